@@ -7,6 +7,11 @@
 """
 import ast
 import os
+import sys
+
+# The shared table updater (widgets.*) lives in src, two levels up
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, project_root)
 
 from textual.css.query import NoMatches
 from textual.screen import ModalScreen
@@ -23,6 +28,8 @@ from pyegeria._output_format_models import (
     ActionParameter,
     FormatSet)
 from member_details_screen import MemberDetailsScreen
+
+from widgets.table_updater import KeyedTableUpdater
 from pyegeria.base_report_formats import select_report_spec, report_specs
 
 CSS_PATH = ["data_products.tcss"]
@@ -774,55 +781,59 @@ class DataProducts(App):
         """ Process the members of a collection """
         self.log(f"Processing members of collection: {self.selected_name}")
         self.log(f"Selected qualified name: {self.selected_qualified_name}")
+        # Reuse the members table from the last drill-down and apply only the differences;
+        # the table built for a catalogue's members has other columns, so replace that one
+        updater = getattr(self, "_member_updater", None)
         try:
-            self.member_datatable = self.query_one("#member_datatable").remove()
-            self.member_datatable: DataTable = DataTable()
-        except(NoMatches):
-            self.log(f"No DataTable found")
+            mounted = self.query_one("#member_datatable")
+        except NoMatches:
+            mounted = None
+        if updater is None or mounted is not updater.table:
+            if mounted is not None:
+                mounted.remove()
             self.member_datatable: DataTable = DataTable()
-        # Configure the DataTable - member_datatable
-        self.member_datatable.id = "member_datatable"
-        # Add columns to the DataTable
-        self.member_datatable.add_columns(
-            ("Qualified Name"),
-            ("Display Name"),
-            ("Type Name"),
-        )
-        # set the cursor to row instead of cell
-        self.member_datatable.cursor_type = "row"
-        # give the DataTable zebra stripes so it is easier to follow across rows on the screen
-        self.member_datatable.zebra_stripes = True
+            # Configure the DataTable - member_datatable
+            self.member_datatable.id = "member_datatable"
+            # Add columns to the DataTable
+            self.member_datatable.add_columns(
+                ("Qualified Name"),
+                ("Display Name"),
+                ("Type Name"),
+            )
+            # set the cursor to row instead of cell
+            self.member_datatable.cursor_type = "row"
+            # give the DataTable zebra stripes so it is easier to follow across rows on the screen
+            self.member_datatable.zebra_stripes = True
+            # Rows are keyed by qualified name
+            updater = self._member_updater = KeyedTableUpdater(self.member_datatable, key_index=0)
+            mounted = None
         # Check that we have at least one Data Product Catalogue
         if self.members is None or "There are no members for this collection" in self.members:
             # No Data Product Catalogues found
             # self.log("No Data Product Catalogues found")
-            self.member_datatable.add_row("Error, No Data Product Catalogues found")
+            rows = [("Error, No Data Product Catalogues found",)]
         elif type(self.members) is list and "There are no members for this collection" in self.members:
             # No members found for the collection
-            self.member_datatable.add_row("Error, No members found for this collection")
+            rows = [("Error, No members found for this collection",)]
         else:
             # Load data into the DataTable
             try:
-                for entry in self.members:
-                    self.member_datatable.add_row(
-                        # entry.get("Qualified Name", "None"),
-                        entry["Qualified Name"],
-                        entry["Display Name"],
-                        entry["Type Name"],
-                    )
-                    # self.log(f"DataTable row added with: {entry['Qualified Name']}")
+                rows = [
+                    # entry.get("Qualified Name", "None"),
+                    (entry["Qualified Name"], entry["Display Name"], entry["Type Name"])
+                    for entry in self.members
+                ]
             except Exception as e:
-                self.member_datatable.add_row("Error", "Error updating member list", str(e))
+                rows = [("Error", "Error updating member list", str(e))]
                 # self.log(f"Error updating member list: {str(e)}")
+        updater.update(rows)
         try:
             collection_mounted = self.query_one("#collection_datatable")
             if collection_mounted:
                 self.collection_datatable.remove()
-            widget_to_mount = self.query_one("#member_datatable")
-            if not widget_to_mount:
-                self.mount(self.member_datatable, after="#after_static")
-            self.member_datatable.refresh(layout=True, recompose=True)
         except (NoMatches):
+            pass
+        if mounted is None:
             self.mount(self.member_datatable, after="#after_static")
 
     def get_member_details(self, selected_qname) -> list:
@@ -6,10 +6,17 @@
 
 """
 
+import asyncio
 import datetime
+import os
 import pprint
 import re
 import json
+import sys
+
+# The lazy tree and tree updater (widgets.*) live in src, two levels up
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, project_root)
 
 from prompt_toolkit.clipboard.pyperclip import PyperclipClipboard
 from pyegeria import load_app_config, settings, MyProfile, PyegeriaException, print_basic_exception, exec_report_spec, \
@@ -35,6 +42,9 @@ from SearchForTermScreen import SearchForTermScreen
 from CreateSubscriptionRequestScreen import CreateSubscriptionRequestScreen
 from pyegeria import GovernanceOfficer
 
+from widgets.lazy_tree import LazyTree
+from widgets.tree_updater import TreeSpec, TreeUpdater
+
 
 class MyProfileApp(App):
     """My Profile App.
@@ -110,6 +120,7 @@ class MyProfileApp(App):
         self.team_members: list[list] = []
         self.max_mermaid_node_count = 0  # This is to tell egeria we dont want mermaid graphs in the response packet.
         self.graph_query_depth = 0  # This tell egeria not to include relationships in the response packet
+        self.detail_trees: dict[str, TreeUpdater] = {}  # tree id -> reusable details tree
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -1025,6 +1036,21 @@ class MyProfileApp(App):
             self.log(f"Unknown selection type: {selection_type}")
             self.exit(429)
 
+    def detail_tree(self, tree_id: str, loader=None) -> TreeUpdater:
+        """
+        The details tree for tree_id, kept across selections so each build only patches
+        what changed (and open branches stay open). A fresh tree is made while the last
+        one is still on screen. With a loader the tree is a LazyTree: lazy branches fetch
+        their children through it when first expanded.
+        """
+        updater = self.detail_trees.get(tree_id)
+        if updater is None or updater.tree.is_attached:
+            tree: Tree = Tree(label="", id=tree_id) if loader is None else LazyTree("", loader, id=tree_id)
+            tree.root.expand()
+            tree.auto_expand = True
+            updater = self.detail_trees[tree_id] = TreeUpdater(tree)
+        return updater
+
     def build_dictionary_details(self, target_qualified_name, target_display_name):
         """ Build the details object for a dictionary details screen"""
         self.log(f"Building dictionary details for qualified name: {target_qualified_name}")
@@ -1052,13 +1078,12 @@ class MyProfileApp(App):
             self.log(f"Error retrieving dictionary details: {error_category}, {error_message}")
             self.push_screen(StatusScreen(f"{error_category}: {error_message}"), callback=self.status_callback)
         elif self.dictionary_details.get("kind") == "empty":
-            dictionary_tree: Tree = Tree(label="Empty Dictionary", id="data_dictionary_tree")
-            dictionary_tree.root.expand()
-            dictionary_tree.root.content = "No dictionary terms found for this dictionary"
+            dictionary_updater = self.detail_tree("data_dictionary_tree")
+            dictionary_updater.update([], label="Empty Dictionary", data="No dictionary terms found for this dictionary")
+            dictionary_tree = dictionary_updater.tree
         else:
-            dictionary_tree: Tree = Tree(label=self.dictionary_display_name, id="data_dictionary_tree")
-            dictionary_tree.root.expand()
-            dictionary_tree.auto_expand = True
+            dictionary_updater = self.detail_tree("data_dictionary_tree")
+            dictionary_tree = dictionary_updater.tree
             self.dictionary_details_data = self.dictionary_details.get("data")
             for term in self.dictionary_details_data:
                 self.log(f"Dictionary term: {term} being processed")
@@ -1070,16 +1095,19 @@ class MyProfileApp(App):
                     build_structure[term_subject] = []
                 build_structure[term_subject].append({term_qualified_name: term_summary})
                 continue
-            # Once the structure is complete we can build the tree from it
+            # Once the structure is complete we can patch the tree from it
+            dictionary_specs = []
             for term_subject, terms in build_structure.items():
                 self.log(f"Building tree for subject: {term_subject}, term: {terms}")
-                dictionary_branch = dictionary_tree.root.add(term_subject)
-                dictionary_branch.expand()
+                dictionary_branch = TreeSpec(term_subject, expand=True)
                 for term_dict in terms:
                     self.log(f"Adding term to tree: {term_dict}")
                     for term_qualified_name, term_summary in term_dict.items():
-                        dictionary_branch.add_leaf(term_summary, data=term_qualified_name)
-                dictionary_tree.root.expand()
+                        dictionary_branch.children.append(
+                            TreeSpec(term_summary, data=term_qualified_name, key=term_qualified_name, leaf=True)
+                        )
+                dictionary_specs.append(dictionary_branch)
+            dictionary_updater.update(dictionary_specs, label=self.dictionary_display_name)
 
         self.push_screen(SelectionOverviewScreen("dictionary",
                                                  self.view_server,
@@ -1115,43 +1143,23 @@ class MyProfileApp(App):
             self.log(f"Error retrieving business domain details: {error_category}, {error_message}")
             self.push_screen(StatusScreen(f"{error_category}: {error_message}"), callback=self.status_callback)
         elif self.domain_details.get("kind") == "empty":
-            domain_tree: Tree = Tree(label="Empty Business Domain", id="business_domain_tree")
-            domain_tree.root.expand()
-            domain_tree.root.content = "No domain details found for this business domain"
+            domain_updater = self.detail_tree("business_domain_tree", loader=self.domain_member_children)
+            domain_updater.update([], label="Empty Business Domain", data="No domain details found for this business domain")
+            domain_tree = domain_updater.tree
         else:
             self.domain_details_data = self.domain_details.get("data")
             self.log(f"domain_details_data: {self.domain_details_data}")
             self.domain_display_name = self.domain_details_data.get("Qualified Name")
-            domain_tree: Tree = Tree(label=self.domain_display_name, id="business_domain_tree")
-            domain_tree.root.expand()
-            domain_tree.auto_expand = True
+            domain_updater = self.detail_tree("business_domain_tree", loader=self.domain_member_children)
+            domain_tree = domain_updater.tree
             for term in self.domain_details_data:
                 if term == None:
                     continue
-                term_qualified_name = term.get("Qualified Name") or ""
-                term_type = term.get("Type Name") or ""
-                term_GUID = term.get("GUID") or ""
-                term_members = term.get("Containing Members")
-                term_memberof = term.get("Member Of")
                 # create dict structure for loading the tree
-                build_structure[term_qualified_name] = {
-                    "term_type": term_type,
-                    "term_GUID": term_GUID,
-                    "term_members": term_members,
-                    "term_memberof": term_memberof
-                }
+                build_structure[term.get("Qualified Name") or ""] = self.domain_branch(term)
                 continue
-            # Once the structure is complete we can build the tree from it
-            for qualified_name, details in build_structure.items():
-                domain_branch = domain_tree.root.add(qualified_name, id=qualified_name, data=[details["term_type"], details["term_GUID"]])
-                if details["term_members"] != None:
-                    domain_branch_members = domain_branch.add("Containing Members")
-                    for member in details["term_members"]:
-                        domain_branch_members.add_leaf(member)
-                if details["term_memberof"] != None:
-                    for member in details["term_memberof"]:
-                        domain_branch.add_leaf(member)
-                domain_tree.root.expand()
+            # Once the structure is complete we can patch the tree from it
+            domain_updater.update(list(build_structure.values()), label=self.domain_display_name)
 
         self.push_screen(SelectionOverviewScreen("domain",
                                                  self.view_server,
@@ -1160,12 +1168,47 @@ class MyProfileApp(App):
                                                  self.user_password,
                                                  data_tree=domain_tree), callback=self.overview_callback)
 
+    def domain_branch(self, term: dict) -> TreeSpec:
+        """ Tree node for one business capability; its members are fetched when expanded"""
+        domain_branch = TreeSpec(term.get("Qualified Name") or "",
+                                 data=[term.get("Type Name") or "", term.get("GUID") or ""])
+        term_members = term.get("Containing Members")
+        term_memberof = term.get("Member Of")
+        if term_members != None:
+            domain_branch.children.append(
+                TreeSpec("Containing Members", children=[TreeSpec(m, data=m, lazy=True) for m in term_members])
+            )
+        if term_memberof != None:
+            for member in term_memberof:
+                domain_branch.children.append(TreeSpec(member, leaf=True))
+        return domain_branch
+
+    async def domain_member_children(self, member_qualified_name) -> list[TreeSpec]:
+        """ Children of a business capability member, fetched the first time it is expanded"""
+        member_details = await asyncio.to_thread(exec_report_spec,
+                                                 format_set_name="BusinessCapabilities",
+                                                 output_format="DICT",
+                                                 params={"search_string": member_qualified_name, "filter_string": member_qualified_name},
+                                                 view_server=self.view_server,
+                                                 view_url=self.platform_url,
+                                                 user=self.user_name,
+                                                 user_pass=self.user_password)
+        terms = [t for t in (member_details.get("data") or []) if t] if isinstance(member_details, dict) else []
+        for term in terms:
+            if term.get("Qualified Name") == member_qualified_name:
+                return self.domain_branch(term).children or [TreeSpec("No members", leaf=True)]
+        return [self.domain_branch(term) for term in terms] or [TreeSpec("No domain details found", leaf=True)]
+
     def build_catalog_details(self, target_qualified_name, target_display_name):
         """ Build the details object for a product catalog details screen"""
         self.log(f"Building product catalog details for qualified name: {target_qualified_name}")
         self.catalog_qualified_name = target_qualified_name
         self.catalog_display_name = target_display_name
         build_structure = {}
+        self.catalog_memberships = {}  # product qualified name -> its "Member Of" list
+        # Filled in as products are expanded; the overview screen shows it on selection
+        sample_data: list = []
+        self.catalog_sample_data = sample_data
 
         try:
             self.catalog_details = exec_report_spec(format_set_name="Digital-Product-Catalog",
@@ -1187,13 +1230,12 @@ class MyProfileApp(App):
             self.log(f"Error retrieving catalog details: {error_category}, {error_message}")
             self.push_screen(StatusScreen(f"{error_category}: {error_message}"), callback=self.status_callback)
         elif self.catalog_details.get("kind") == "empty":
-            catalog_tree: Tree = Tree(label="Empty Catalog", id="digital_product_catalog_tree")
-            catalog_tree.root.expand()
-            catalog_tree.root.content = "No catalog terms found for this catalog"
+            catalog_updater = self.detail_tree("digital_product_catalog_tree", loader=self.catalog_product_samples)
+            catalog_updater.update([], label="Empty Catalog", data="No catalog terms found for this catalog")
+            catalog_tree = catalog_updater.tree
         else:
-            catalog_tree: Tree = Tree(label=self.catalog_display_name, id="digital_product_catalog_tree")
-            catalog_tree.root.expand()
-            catalog_tree.auto_expand = True
+            catalog_updater = self.detail_tree("digital_product_catalog_tree", loader=self.catalog_product_samples)
+            catalog_tree = catalog_updater.tree
             self.catalog_details_data: list[dict] = self.catalog_details.get("data")
             self.log(f"catalog_details_data: {self.catalog_details_data}")
             if not self.catalog_details_data or self.catalog_details_data == None:
@@ -1211,54 +1253,22 @@ class MyProfileApp(App):
                 if term_subject not in build_structure:
                     build_structure[term_subject] = []
                 build_structure[term_subject].append({term_qualified_name: term_summary})
+                self.catalog_memberships[term_qualified_name] = product.get("Member Of")
                 self.log(f"build_structure: {build_structure}")
                 continue
-            # Once the structure is complete we can build the tree from it
-            sample_data:list = []
+            # Once the structure is complete we can patch the tree from it. Each product's
+            # data samples are only fetched when its node is expanded
+            catalog_specs = []
             for instance, data_prods in build_structure.items():
-                catalog_branch = catalog_tree.root.add(instance)
+                catalog_branch = TreeSpec(instance)
                 for data_prod in data_prods:
                     for term_qualified_name, term_summary in data_prod.items():
-                        catalog_branch.add_leaf(term_summary, data=term_qualified_name)
+                        catalog_branch.children.append(
+                            TreeSpec(term_summary, data=term_qualified_name, key=term_qualified_name, lazy=True)
+                        )
                         self.log(f"term_qualified_name: {term_qualified_name}, term summary: {term_summary}")
-                catalog_tree.root.expand()
-                # get some sample data from the data source
-                if product:
-                    collection_memberships = product.get("Member Of")
-                    self.log(f"Collection memberships len: {len(collection_memberships)}")
-                if collection_memberships:
-                    data_set_data = None
-                    collection_membership_list = collection_memberships.split(",")
-                    self.log(f"Membership List: {collection_membership_list}")
-                    for membership_qname in collection_membership_list:
-                        self.log(f"Processing collection membership: {membership_qname}")
-                        if "DigitalProduct" in membership_qname:
-                            self.log(f"Processing dataset: {membership_qname}")
-                            try:
-                                # create client instance and retrieve data
-                                dclient = DataEngineer(self.view_server, self.platform_url, self.user_name, self.user_password)
-                                token = dclient.create_egeria_bearer_token(self.user_name, self.user_password)
-                                data_set_data = dclient.find_tabular_data_sets(
-                                                                           search_string=membership_qname,
-                                                                           start_from=0,
-                                                                           page_size=10,
-                                                                           output_format = "MD"
-                                                                           )
-                                self.log(f"Dataset data retrieved: {data_set_data}")
-                                if data_set_data == "No elements found":
-                                    sample_data.append(f"No data sample available at this time for {membership_qname}")
-                                else:
-                                    sample_data.append(data_set_data)
-                                continue
-                            except PyegeriaException as e:
-                                self.log(f"Error retrieving dataset data: {e}")
-                                print_basic_exception(e)
-                        else:
-                            continue
-                    # ************************************************************
-                    # once we have the correct data decide how we will display it!
-                    # ************************************************************
-                    self.log(f"Sample data: {sample_data}")
+                catalog_specs.append(catalog_branch)
+            catalog_updater.update(catalog_specs, label=self.catalog_display_name)
 
         self.push_screen(SelectionOverviewScreen("catalog",
                                                  self.view_server,
@@ -1268,6 +1278,53 @@ class MyProfileApp(App):
                                                  data_tree=catalog_tree,
                                                  data_samples=sample_data), callback=self.overview_callback)
 
+    async def catalog_product_samples(self, product_qualified_name) -> list[TreeSpec]:
+        """ Data samples for one digital product, fetched the first time its node is expanded"""
+        collection_memberships = self.catalog_memberships.get(product_qualified_name)
+        if not collection_memberships:
+            return [TreeSpec("No data sets for this product", data=product_qualified_name, leaf=True)]
+        samples = await asyncio.to_thread(self.fetch_data_samples, collection_memberships)
+        self.catalog_sample_data.extend(samples.values())
+        # ************************************************************
+        # once we have the correct data decide how we will display it!
+        # ************************************************************
+        self.log(f"Sample data: {self.catalog_sample_data}")
+        return [TreeSpec(f"Data sample: {membership_qname}", data=product_qualified_name, leaf=True)
+                for membership_qname in samples] or [
+            TreeSpec("No data sets for this product", data=product_qualified_name, leaf=True)]
+
+    def fetch_data_samples(self, collection_memberships: str) -> dict:
+        """ Get some sample data from the data sources of a product's collection memberships"""
+        sample_data = {}
+        collection_membership_list = collection_memberships.split(",")
+        self.log(f"Membership List: {collection_membership_list}")
+        for membership_qname in collection_membership_list:
+            self.log(f"Processing collection membership: {membership_qname}")
+            if "DigitalProduct" in membership_qname:
+                self.log(f"Processing dataset: {membership_qname}")
+                try:
+                    # create client instance and retrieve data
+                    dclient = DataEngineer(self.view_server, self.platform_url, self.user_name, self.user_password)
+                    token = dclient.create_egeria_bearer_token(self.user_name, self.user_password)
+                    data_set_data = dclient.find_tabular_data_sets(
+                                                               search_string=membership_qname,
+                                                               start_from=0,
+                                                               page_size=10,
+                                                               output_format = "MD"
+                                                               )
+                    self.log(f"Dataset data retrieved: {data_set_data}")
+                    if data_set_data == "No elements found":
+                        sample_data[membership_qname] = f"No data sample available at this time for {membership_qname}"
+                    else:
+                        sample_data[membership_qname] = data_set_data
+                    continue
+                except PyegeriaException as e:
+                    self.log(f"Error retrieving dataset data: {e}")
+                    print_basic_exception(e)
+            else:
+                continue
+        return sample_data
+
     def build_glossary_details(self, target_qualified_name, target_display_name):
         """ Build the details object for a glossary details screen"""
         self.log(f"Building glossary details for qualified name: {target_qualified_name}")
@@ -1279,13 +1336,12 @@ class MyProfileApp(App):
                 self.glossary_folders = glossary_instance.get("Folders") or None
                 self.log(f"glossary_folders: {self.glossary_folders}")
                 category = "Uncategorised"
+                glossary_updater = self.detail_tree("glossary_details_tree")
+                glossary_tree = glossary_updater.tree
                 if self.glossary_folders != None:
-                    glossary_tree: Tree = Tree(label=self.glossary_display_name, id="glossary_details_tree")
-                    glossary_tree.root.expand()
-                    glossary_tree.auto_expand = True
-                    
                     folder_entries = [f.strip() for f in self.glossary_folders.split(',')]
-                    nodes = {(): glossary_tree.root}
+                    root_spec = TreeSpec(self.glossary_display_name)
+                    nodes = {(): root_spec}
                     prefixes = ["GlossaryCategory", "GlossaryTerm", "CollectionFolder"]
 
                     for entry in folder_entries:
@@ -1313,19 +1369,19 @@ class MyProfileApp(App):
                             if current_path not in nodes:
                                 parent_node = nodes[parent_path]
                                 if is_leaf and i == len(path_parts) - 1:
-                                    nodes[current_path] = parent_node.add_leaf(part, data=full_id)
+                                    new_node = TreeSpec(part, data=full_id, leaf=True)
                                 else:
-                                    new_node = parent_node.add(part, data=part)
-                                    new_node.expand()
-                                    nodes[current_path] = new_node
-                                    
-                    glossary_tree.refresh()
+                                    new_node = TreeSpec(part, data=part, expand=True)
+                                parent_node.children.append(new_node)
+                                nodes[current_path] = new_node
+
+                    glossary_updater.update(root_spec.children, label=self.glossary_display_name)
                 else:
                     self.log(f"No glossary folders found in the glossary data extract")
                     folder_category = "Empty Glossary"
-                    category = glossary_tree.root.add(folder_category)
                     folder_term = "No glossary terms found for this glossary"
-                    category.add_leaf(folder_term)
+                    category = TreeSpec(folder_category, children=[TreeSpec(folder_term, leaf=True)])
+                    glossary_updater.update([category], label=self.glossary_display_name)
 
         self.push_screen(SelectionOverviewScreen("glossary",
                                                  self.view_server,
@@ -1336,23 +1392,18 @@ class MyProfileApp(App):
 
     def build_root_collection_details(self, target_qualified_name, target_display_name):
         """ Build the details object for a root collection details screen"""
-        member_tree: Tree = Tree(label="Root Collection", id="root_collection_members_tree")
-        member_tree.root.expand()
-        member_tree.auto_expand = True
+        member_updater = self.detail_tree("root_collection_members_tree", loader=self.collection_member_children)
+        member_tree = member_updater.tree
 
         self.log(f"Building root collection details for qualified name: {target_qualified_name}")
         self.root_collection_qualified_name = target_qualified_name
-        collection_branch = member_tree.root.add(self.root_collection_qualified_name, expand=True)
+        collection_branch = TreeSpec(self.root_collection_qualified_name, expand=True)
         self.log(f"self_collections: {self.collections}")
         collection = self.collections[0]
         self.log(f"collection: {collection}")
         if target_qualified_name == collection.get("Qualified Name"):
-            root_collection_contains: str  = collection.get("Containing Members") or None
-            self.log(f"root_collection_contains: {root_collection_contains}")
-            folders = str.split(root_collection_contains, ', ')
-            for folder in folders:
-                collection_branch.add_leaf(folder)
-                continue
+            collection_branch.children = self.collection_member_specs(collection)
+        member_updater.update([collection_branch], label="Root Collection")
 
         self.push_screen(SelectionOverviewScreen("collection",
                                                  self.view_server,
@@ -1363,6 +1414,32 @@ class MyProfileApp(App):
 
 
 
+    def collection_member_specs(self, collection: dict) -> list[TreeSpec]:
+        """ Tree nodes for a collection's members; each one's own members load when expanded"""
+        collection_contains: str = collection.get("Containing Members") or None
+        self.log(f"collection_contains: {collection_contains}")
+        if not collection_contains:
+            return [TreeSpec("No members", leaf=True)]
+        folders = str.split(collection_contains, ', ')
+        return [TreeSpec(folder, data=folder, lazy=True) for folder in folders]
+
+    async def collection_member_children(self, collection_qualified_name) -> list[TreeSpec]:
+        """ Members of a nested collection, fetched the first time its node is expanded"""
+        result = await asyncio.to_thread(exec_report_spec,
+                                         format_set_name="BasicCollections",
+                                         output_format="DICT",
+                                         params={"search_string": collection_qualified_name},
+                                         view_server=self.view_server,
+                                         view_url=self.platform_url,
+                                         user=self.user_name,
+                                         user_pass=self.user_password)
+        if isinstance(result, dict) and result.get("kind") == "json":
+            result = result.get("data")
+        for collection in result if isinstance(result, list) else []:
+            if collection.get("Qualified Name") == collection_qualified_name:
+                return self.collection_member_specs(collection)
+        return [TreeSpec("No members", leaf=True)]
+
     def overview_callback(self, r_code):
         """Callback function for handling overview screen actions."""
         if isinstance(r_code, list):
@@ -7,6 +7,11 @@
 """
 import asyncio
 import os
+import sys
+
+# The shared tree updater (widgets.*) lives in src, two levels up
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, project_root)
 
 from pydantic import ValidationError
 from textual import on
@@ -19,6 +24,8 @@ from textual.widgets import Static, Button, Footer, Header, DataTable, Tree
 from pyegeria.view.base_report_formats import *
 from pyegeria.view.format_set_executor import exec_report_spec
 
+from widgets.tree_updater import TreeSpec, TreeUpdater
+
 # from my_connectors_splash_screen import SplashScreen
 
 CSS_PATH = ["my_connectors.tcss"]
@@ -265,18 +272,17 @@ class ReportSpec(App):
        self.items.clear()
        try:
            self.proc_tree = self.query_one("#proc_tree", Tree)
-           self.proc_tree.clear()
        except NoMatches:
            self.proc_tree: Tree = Tree("Processes", id = "proc_tree")
        except Exception as e:
            self.log(f"Exception building tree: {e}")
            self.exit(400)
+       # Patch the tree from the last selection instead of clearing and rebuilding it
+       if getattr(self, "proc_tree_updater", None) is None or self.proc_tree_updater.tree is not self.proc_tree:
+           self.proc_tree_updater = TreeUpdater(self.proc_tree)
        root_data = "A list of Processes associated with the selected technology type"
        self.proc_tree.auto_expand=True
        # self.proc_tree.root.expand()
-       self.proc_tree.root.label = "Associated Processes"
-       self.proc_tree.root.data = root_data
-       tree_root = self.proc_tree.root
        self.processes = ""
 
        if not self.response:
@@ -287,35 +293,40 @@ class ReportSpec(App):
        if not isinstance(self.response, list):
            self.response = [self.response]
        self.log(f"response: {self.response}", type(self.response), len(self.response))
+       tree_root: list[TreeSpec] = []
        for item in self.response:
-           process_node = tree_root.add(str(item.get("Display Name")), expand=True)
+           process_node = TreeSpec(str(item.get("Display Name")), expand=True)
+           tree_root.append(process_node)
            if len(self.response) > 0 and len(self.response[0]) >= 2:
                 for key, value in self.response:
                    if isinstance(value, dict):
                         self.log(f"key: {key}, {type(key)}, {value}")
-                        sub_node = process_node.add(label=(str(key)), expand=True)
+                        sub_node = TreeSpec(str(key), expand=True)
+                        process_node.children.append(sub_node)
                         for subkey, subvalue in value.items():
                             if isinstance(subvalue, dict):
                                 self.log(f"subkey: {subkey}, {type(subkey)}, {subvalue}")
-                                subprocess_node = sub_node.add(label=(str(subkey)), expand=True)
+                                subprocess_node = TreeSpec(str(subkey), expand=True)
+                                sub_node.children.append(subprocess_node)
                                 for subsubkey, subsubvalue in subvalue.items():
                                     self.log(f"subsubkey: {subsubkey}, {type(subsubkey)}, {subsubvalue}")
-                                    subprocess_node.add_leaf(label=(str(subsubkey)), expand=True)
+                                    subprocess_node.children.append(TreeSpec(str(subsubkey), leaf=True))
                                     continue
                             else:
                                 self.log(f"subkey: {subkey}, {type(subkey)}, {subvalue}")
-                                subprocess_node = sub_node.add_leaf(label=(str(subkey)), expand=True)
+                                sub_node.children.append(TreeSpec(str(subkey), leaf=True))
                                 continue
                         else:
                             self.log(f"key: {key}, {type(key)}, {value}")
-                            sub_node = tree_root.add_leaf(label=(str(key)), expand=True)
+                            tree_root.append(TreeSpec(str(key), leaf=True))
                             continue
                    else:
-                       process_node.add_leaf(label=(str(key)), expand=True)
+                       process_node.children.append(TreeSpec(str(key), leaf=True))
                        continue
            else:
                 #if there is no input, skip
                 continue
+       self.proc_tree_updater.update(tree_root, label="Associated Processes", data=root_data)
 
        # remove the technology type list and mount the processes tree
        self.query_one("#tech_type_data_container", Container).remove()
@@ -8,6 +8,7 @@
 """
 
 import os
+import sys
 from typing import Any
 
 from textual import on
@@ -22,50 +23,53 @@ os.environ.setdefault("EGERIA_PLATFORM_URL", "https://localhost:9443")
 
 from textual.app import App, ComposeResult
 from textual.widgets import Footer
+from screens.lazy import LazyScreen, screen_class
 from screens.login_screen import LoginScreen
-from screens.main_menu import MainMenuScreen
-from screens.glossary.glossary_browser import GlossaryBrowserScreen
-from screens.collections.collection_browser import CollectionBrowserScreen
-from screens.collections.collection_members_screen import CollectionMemberScreen
-from screens.collections.collection_details import CollectionDetailsScreen
-from screens.collections.add_collection import AddCollectionScreen
-from screens.collections.delete_collection import DeleteCollectionScreen
-from screens.glossary.glossary_list_screen import GlossaryListScreen
-from screens.glossary.term_details import TermDetailsScreen
-from screens.glossary.term_list_screen import TermListScreen
-from screens.GovernanceOfficer.governance_officer_browser import GovernanceOfficerBrowserScreen
-from screens.GovernanceOfficer.add_governance_definition import AddGovernanceDefinitionScreen
-from screens.GovernanceOfficer.delete_governance_definition import DeleteGovernanceDefinitionScreen
-from screens.GovernanceOfficer.marketplace_tree import MarketPlaceTree
-from screens.ProductManager.product_manager_browser import ProductManagerBrowser
 from utils.egeria_client import close_all_managers
+from utils.token_refresher import (
+    pause_token_refresher,
+    proactive_refresh_enabled,
+    resume_token_refresher,
+    start_token_refresher,
+    stop_token_refresher,
+)
 from utils.config import EgeriaConfig
+from services.warmup import cancel_warmup
+from utils.health import stop_health_watcher
 from screens.splash_screen import SplashScreen  # your existing splash screen
-from services.term_service import get_terms_for_glossary
 
 class MyEgeria(App):
     """Main app class of my_egeria."""
     CSS_PATH = ["./styles/common.css"]
 
-    # Only register screens that do NOT need constructor arguments here
+    # Only register screens that do NOT need constructor arguments here. Everything past
+    # the login is a LazyScreen: its module (and the services behind it) is imported on
+    # first push, so start-up only pays for the splash and login screens.
     SCREENS = {
         "splash": SplashScreen,
         "login": LoginScreen,
-        "main_menu": MainMenuScreen,
-        "glossary_browser": GlossaryBrowserScreen,
-        "glossary_list_screen": GlossaryListScreen,
-        "term_details": TermDetailsScreen,
-        "term_list_screen": TermListScreen,
-        "collection_details": CollectionDetailsScreen,
-        "add_collection": AddCollectionScreen,
-        "collection_members": CollectionMemberScreen,
-        "collection_browser": CollectionBrowserScreen,
-        "delete_collection": DeleteCollectionScreen,
-        "governance_officer_browser": GovernanceOfficerBrowserScreen,
-        "add_governance_definition": AddGovernanceDefinitionScreen,
-        "delete_governance_definition": DeleteGovernanceDefinitionScreen,
-        "marketplace_tree": MarketPlaceTree,
-        "product_manager_browser": ProductManagerBrowser,
+        "main_menu": LazyScreen("screens.main_menu:MainMenuScreen"),
+        "glossary_browser": LazyScreen("screens.glossary.glossary_browser:GlossaryBrowserScreen"),
+        "glossary_list_screen": LazyScreen("screens.glossary.glossary_list_screen:GlossaryListScreen"),
+        "term_details": LazyScreen("screens.glossary.term_details:TermDetailsScreen"),
+        "term_list_screen": LazyScreen("screens.glossary.term_list_screen:TermListScreen"),
+        "collection_details": LazyScreen("screens.collections.collection_details:CollectionDetailsScreen"),
+        "add_collection": LazyScreen("screens.collections.add_collection:AddCollectionScreen"),
+        "collection_members": LazyScreen("screens.collections.collection_members_screen:CollectionMemberScreen"),
+        "collection_browser": LazyScreen("screens.collections.collection_browser:CollectionBrowserScreen"),
+        "delete_collection": LazyScreen("screens.collections.delete_collection:DeleteCollectionScreen"),
+        "governance_officer_browser": LazyScreen(
+            "screens.GovernanceOfficer.governance_officer_browser:GovernanceOfficerBrowserScreen"
+        ),
+        "add_governance_definition": LazyScreen(
+            "screens.GovernanceOfficer.add_governance_definition:AddGovernanceDefinitionScreen"
+        ),
+        "delete_governance_definition": LazyScreen(
+            "screens.GovernanceOfficer.delete_governance_definition:DeleteGovernanceDefinitionScreen"
+        ),
+        "marketplace_tree": LazyScreen("screens.GovernanceOfficer.marketplace_tree:MarketPlaceTree"),
+        "product_manager_browser": LazyScreen("screens.ProductManager.product_manager_browser:ProductManagerBrowser"),
+        "omnibox": LazyScreen("screens.omnibox_screen:OmniboxScreen"),
         # Details screens require arguments; push them with instances at runtime
         # "term_details": lambda: TermDetailsScreen("<guid>"),
         # "collection_details": lambda: CollectionDetailsScreen("<guid>"),
@@ -76,9 +80,19 @@ class MyEgeria(App):
         yield Footer()
 
     async def on_mount(self) -> None:
+        # Opt-in: renew tokens in the background so no interactive call waits on authentication
+        if proactive_refresh_enabled():
+            start_token_refresher()
         # Start at splash
         await self.push_screen("splash")
 
+    def on_app_blur(self) -> None:
+        # The terminal lost focus: nobody is using the session, let its token lapse
+        pause_token_refresher()
+
+    def on_app_focus(self) -> None:
+        resume_token_refresher()
+
     # Optional: handle a "login successful" message from LoginScreen if you use one
     # Provide a generic hook to go to main menu after login
     @on(LoginScreen.LoginSuccess)
@@ -94,26 +108,38 @@ class MyEgeria(App):
 
     # Convenience helpers for pushing details screens (that need args)
     async def on_show_term_details(self, term_guid: str):
-        await self.switch_screen(TermDetailsScreen(term_guid))
+        await self.switch_screen(screen_class("screens.glossary.term_details:TermDetailsScreen")(term_guid))
 
     async def on_show_term_list(self, glossary_name: str):
-        await self.switch_screen(TermListScreen(glossary_name = glossary_name))
+        await self.switch_screen(
+            screen_class("screens.glossary.term_list_screen:TermListScreen")(glossary_name = glossary_name)
+        )
 
     async def on_show_collection_details(self, collection_guid: str):
-        await self.switch_screen(CollectionDetailsScreen(collection_guid))
+        await self.switch_screen(
+            screen_class("screens.collections.collection_details:CollectionDetailsScreen")(collection_guid)
+        )
 
     async def on_show_add_collection(self):
-        await self.switch_screen(AddCollectionScreen())
+        await self.switch_screen(screen_class("screens.collections.add_collection:AddCollectionScreen")())
 
     async def on_show_governance_officer_browser(self):
-        await self.switch_screen(GovernanceOfficerBrowserScreen())
+        await self.switch_screen(
+            screen_class("screens.GovernanceOfficer.governance_officer_browser:GovernanceOfficerBrowserScreen")()
+        )
 
     async def on_splash_screen_splash_continue(self):
         await self.switch_screen("login")
 
     async def on_shutdown(self) -> None:
         try:
+            cancel_warmup()
+            stop_health_watcher()
+            stop_token_refresher()
             close_all_managers()
+            # Only flush the snapshot store if a screen ever opened it
+            if "utils.snapshot_store" in sys.modules:
+                sys.modules["utils.snapshot_store"].close_snapshot_store()
         except Exception:
             pass
 
@@ -19,6 +19,10 @@ from .delete_governance_definition import DeleteGovernanceDefinitionScreen
 import asyncio
 from textual import on
 from utils.config import EgeriaConfig, get_global_config
+from utils.search_index import IndexedRows
+from widgets.lazy_tree import LazyTree
+from widgets.table_updater import KeyedTableUpdater
+from widgets.tree_updater import TreeSpec
 
 
 # ... existing imports ...
@@ -137,7 +141,10 @@ class GovernanceOfficerBrowserScreen(BaseScreen):
         self.service = GovernanceOfficerService(config=get_global_config())
         self.table.clear()
         self.table.add_columns("GUID", "Type Name", "Document ID", "Unique Name", "Short Name", "Description")
+        # Rows keyed by GUID, else unique name; reloads apply only the differences
+        self._updater = KeyedTableUpdater(self.table, key_index=(0, 3))
         self.last_selected_guid = ""  # track selection defensively
+        self._filter = IndexedRows(text_columns=(1, 2, 3, 4, 5))  # every loaded definition, indexed for search
         await self.load_governance_officer_definitions()
         # Ensure the table has focus for key handling (use Screen API)
         try:
@@ -172,7 +179,7 @@ class GovernanceOfficerBrowserScreen(BaseScreen):
         if self.last_selected_guid:
             # Find the Root(s) for that selected type and display a table of them to select from,
             # could be a tree maybe betterand display 2 or 3 levels deep by default
-                root = await self.service.get_collections_by_name(self.last_selected_guid)
+                root = await asyncio.to_thread(self.service.get_collections_by_name, self.last_selected_guid)
                 root_guid = root.get("GUID", None)
                 root_name = root.get("title", None)
                 root_qname = root.get("qualifiedName", None)
@@ -181,40 +188,20 @@ class GovernanceOfficerBrowserScreen(BaseScreen):
                 if ("marketplace" in root_name.lower()) or ("marketplace" in root_qname.lower()):
                     marketplace_guid = root_guid
                     self.log(f"Found marketplace guid of {marketplace_guid}, {root_name}")
-                    #set up Textual Tree structure for display
-                    market_tree: Tree =Tree(root_name, data=root_guid, id="marketplace_tree")
-                    # now query for all the collection members, probably 2 levels for initial display
-                    marketplace_folders = await self.service.get_collections_by_name(marketplace_guid)
-                    if marketplace_folders:
-                        for folder in marketplace_folders:
-                            folder_guid = folder.get("GUID", None)
-                            folder_name = folder.get("title", None)
-                            folder_qname = folder.get("qualifiedName", None)
-                            folder_desc = folder.get("description", None)
-                            folder_members = folder.get("members", None)
-                            market_tree.root.expand()
-                            if "Folder" in folder_qname:
-                                self.log(f"Found folder guid of {folder_guid}, {folder_name}")
-                                entries = market_tree.root.add(folder_name, data= folder_guid, expasnd = True)
-                                if folder_members:
-                                    for member in folder_members:
-                                        member_guid = member.get("GUID", None)
-                                        member_name = member.get("title", None)
-                                        #process level 3
-                                        entries.add(member_name, member_guid, expand = True)
-                                        continue
-                                else:
-                                    entries.add(f"No members found for {folder_name}")
-                                    continue
-                            else:
-                                market_tree.root.add_leaf(folder_name, data = folder_guid, expand = True)
-                    else:
-                        # marketplace is empty
-                        self.log(f"Marketplace guid {marketplace_guid} is empty")
-                        self.spacer_container = self.query_one("#go_spacer", Container)
-                        market_tree.root.add(f"Marketplace {marketplace_guid} is empty")
+                    # set up Textual Tree structure for display: the folders load when the tree
+                    # opens, a folder's members when it is expanded (the next level is prefetched)
+                    market_tree = LazyTree(
+                        root_name,
+                        self._marketplace_members,
+                        data=root_guid,
+                        id="marketplace_tree",
+                        lazy_root=True,
+                        prefetch_depth=1,
+                    )
+                    market_tree.root.expand()
                 else:
                     self.not_marketplace_guid(root_guid)
+                    return
         else:
             # display error and stay on base screen until a different action is selected
             # or a selection is made
@@ -224,6 +211,29 @@ class GovernanceOfficerBrowserScreen(BaseScreen):
         #
         await self.app.push_screen(MarketPlaceTree(market_tree))
 
+    async def _marketplace_members(self, collection_guid: str) -> list[TreeSpec]:
+        """Tree nodes for the members of a marketplace or folder, fetched on expand."""
+        members = await asyncio.to_thread(self.service.get_collections_by_name, collection_guid)
+        if not members:
+            self.log(f"Collection guid {collection_guid} is empty")
+            return [TreeSpec(f"Collection {collection_guid} is empty", leaf=True)]
+        specs = []
+        for member in members:
+            member_guid = member.get("GUID", None)
+            member_name = member.get("title", None) or member_guid
+            member_qname = member.get("qualifiedName", None) or ""
+            inline_members = member.get("members", None)
+            if "Folder" not in member_qname:
+                specs.append(TreeSpec(member_name, data=member_guid, key=member_guid, leaf=True))
+            elif inline_members:
+                # The folder's members came with the listing: no need to ask again
+                children = [TreeSpec(m.get("title", None) or m.get("GUID", ""), data=m.get("GUID", None), leaf=True)
+                            for m in inline_members]
+                specs.append(TreeSpec(member_name, data=member_guid, key=member_guid, children=children))
+            else:
+                specs.append(TreeSpec(member_name, data=member_guid, key=member_guid, lazy=True))
+        return specs
+
     def not_marketplace_guid(self, root_guid: str):
         self.log(f"Found non-marketplace guid of {root_guid}")
         pass
@@ -275,18 +285,9 @@ class GovernanceOfficerBrowserScreen(BaseScreen):
                 pass
 
     # Helper defined BEFORE handlers that call it to avoid "unresolved reference" warnings
-    async def _refresh_and_focus(self):
-        await self.load_governance_officer_definitions()
-        try:
-            if self.table.row_count > 0:
-                try:
-                    self.table.move_cursor(row=0, column=0)
-                except Exception:
-                    # Fallback removed to avoid Coordinate dependency
-                    pass
-            self.set_focus(self.table)
-        except Exception:
-            pass
+    async def _refresh_and_focus(self, refresh: bool = False):
+        # The load places the cursor and focus once its rows are on screen
+        await self.load_governance_officer_definitions(refresh=refresh)
 
     @on(AddGovernanceDefinitionScreen.GovernanceDefinitionCreated)
     async def process_definition_created(self, msg: AddGovernanceDefinitionScreen.GovernanceDefinitionCreated):
@@ -306,29 +307,53 @@ class GovernanceOfficerBrowserScreen(BaseScreen):
         """
         Hotkey handler for 'r' to reload collections.
         """
-        await self._refresh_and_focus()
+        await self._refresh_and_focus(refresh=True)
+
+    def _show_rows(self, rows):
+        self._updater.update(rows or [("", "No results found", "", "", "", "")])
+
+    @on(Input.Changed, "#gd-search-input")
+    def filter_as_you_type(self, event: Input.Changed) -> None:
+        """Filter the loaded definitions locally on every keystroke."""
+        self._show_rows(self._filter.visible(event.value))
+
+    @on(Button.Pressed, "#gd-search-button")
+    @on(Input.Submitted, "#gd-search-input")
+    async def handle_search(self, event) -> None:
+        """Search locally; only go to the server when the loaded rows are not the full set."""
+        query = self.query_one("#gd-search-input", Input).value.strip()
+        if self._filter.needs_server(query):
+            await self.load_governance_officer_definitions(search=query)
+        else:
+            self._show_rows(self._filter.visible(query))
 
-    async def load_governance_officer_definitions(self, search: str = ""):
-        self.table.clear()
+    async def load_governance_officer_definitions(self, search: str = "", refresh: bool = False):
+        search = search or "*"
         try:
-            collections = await asyncio.to_thread(self.service.find_governance_definitions, search or "*")
-            if collections:
-                for c in collections:
-                    guid = (c.get("GUID", ""))
-                    type_name = (c.get("typeName", ""))
-                    doc_id = (c.get("documentIdentifier", ""))
-                    unique_name = (c.get("title", ""))
-                    summary = (c.get("summary", ""))
-                    description = (c.get("description", ""))
-
-                    self.table.add_row(guid, type_name, doc_id, unique_name, summary, description)
-            else:
-                self.table.add_row("", "No results found", "", "")
+            definitions = await asyncio.to_thread(self.service.find_governance_definitions, search)
+            rows = [
+                (
+                    c.get("GUID", ""),
+                    c.get("typeName", ""),
+                    c.get("documentIdentifier", ""),
+                    c.get("title", ""),
+                    c.get("summary", ""),
+                    c.get("description", ""),
+                )
+                for c in definitions or []
+            ]
+            # Only an unfiltered listing lets keystrokes filter without asking the server; the
+            # rows of a server search are shown as returned
+            fresh = IndexedRows(self._filter.text_columns)
+            fresh.query = self._filter.query
+            await asyncio.to_thread(fresh.set_rows, rows, search == "*", search)
+            self._filter = fresh
+            self._show_rows(fresh.visible())
         except Exception as e:
-            self.table.add_row("", f"Error: {e}", "", "")
+            self._show_rows([("", f"Error: {e}", "", "", "", "")])
         self.last_selected_guid = ""
         try:
-            if self.table.row_count > 0:
+            if self.table.row_count > 0 and not refresh:
                 try:
                     self.table.move_cursor(row=0, column=0)
                 except Exception:
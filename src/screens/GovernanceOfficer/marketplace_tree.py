@@ -12,6 +12,7 @@ from textual.widgets import Button, Tree, Static, Input
 from utils.config import EgeriaConfig, get_global_config
 from textual import on
 from textual.containers import Container, Horizontal
+from widgets.lazy_tree import LazyTree
 
 class MarketPlaceTree(BaseScreen):
     """Screen showing a Data Product MarketPlace in a Tree structure"""
@@ -55,7 +56,10 @@ class MarketPlaceTree(BaseScreen):
         ),
         id = "pt_root",
 
-    def action_refresh(self, event):
+    def action_refresh(self):
+        # Re-fetch the branch under the cursor (the whole marketplace from the root)
+        if isinstance(self.market_tree, LazyTree):
+            self.market_tree.reload(self.market_tree.cursor_node or self.market_tree.root)
         self.market_tree.refresh()
 
     def action_back(self) -> None:
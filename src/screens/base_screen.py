@@ -14,8 +14,9 @@ from textual.app import ComposeResult
 from textual import on
 from textual.containers import Container
 from utils.config import get_global_config
-from utils.egeria_client import EgeriaTechClientManager
-from con_services.egeria_connection import EgeriaConnectionService
+from utils.egeria_client import acquire_manager, preflight_origin, release_manager
+from utils.circuit_breaker import CLOSED, OPEN
+from utils.health import current_health, start_health_watcher
 
 class BaseScreen(Screen):
     CSS_PATH = ["../styles/common.css", "../styles/base_screen.css"]
@@ -31,34 +32,50 @@ class BaseScreen(Screen):
         super().__init__(**kwargs)
         # Use centralized config (set at login)
         self.cfg = get_global_config()
-        self.manager = EgeriaTechClientManager(self.cfg)
+        # Shared, pooled manager: screen navigation reuses the authenticated client
+        self.manager = acquire_manager(self.cfg)
         self._is_connected = False
 
     def compose(self) -> ComposeResult:
         yield Header(show_clock=True)
         yield Container(
-            Static(
-                f"Server: {self.cfg.view_server} | Platform: {self.cfg.platform_url} | User: {self.cfg.user}",
-                id="connection_info",
-            )
+            Static(self._connection_info_text(), id="connection_info")
         )
         yield Footer()
 
-    async def on_mount(self) -> None:
-        # Use a fast connectivity check; don't build the heavy client on mount
+    @property
+    def server_available(self) -> bool:
+        """False while the view server's circuit breaker is open: skip calls and fail fast."""
+        return self.manager.breaker.state != OPEN
+
+    def _connection_info_text(self) -> str:
+        text = f"Server: {self.cfg.view_server} | Platform: {self.cfg.platform_url} | User: {self.cfg.user}"
+        health = current_health()
+        if health is not None:
+            text += f" | Up ({health.latency_ms:.0f} ms)" if health.reachable else " | Platform UNREACHABLE"
+        state = self.manager.breaker.state
+        if state != CLOSED:
+            text += f" | Connection: {state.upper()}"
+        return text
+
+    def _refresh_connection_info(self) -> None:
         try:
-            ecs = EgeriaConnectionService()
-            if not ecs.is_connected():
-                # Optionally: display a non-blocking warning or status
-                pass
+            self.query_one("#connection_info", Static).update(self._connection_info_text())
         except Exception:
-            # Optionally: display a non-blocking warning or status
             pass
 
+    async def on_mount(self) -> None:
+        # Keep the header in step with the circuit breaker so outages are visible immediately
+        self.set_interval(1.0, self._refresh_connection_info)
+        # Connectivity comes from the shared background probe; mounting never waits on the network
+        start_health_watcher()
+
+    def on_unmount(self) -> None:
+        release_manager(self.manager)
+
     def check_connection(self) -> None:
-        # If you still need this elsewhere, prefer the service verify instead of building a client
-        ecs = EgeriaConnectionService()
-        ecs.verify_connection()
+        # Blocking check that raises ConnectionError; prefer current_health() on UI paths
+        preflight_origin(self.cfg.platform_url, self.cfg.user, timeout=2.0)
 
     def show_error_and_exit(self, error_message: str) -> None:
         """Show popup with error and quit app."""
@@ -16,6 +16,10 @@ from ..base_screen import BaseScreen
 from services.collection_service import CollectionService
 from .add_collection import AddCollectionScreen
 from .delete_collection import DeleteCollectionScreen
+from widgets.table_updater import KeyedTableUpdater
+from utils.snapshot_store import format_age
+from utils.search_index import IndexedRows
+from utils.prefetch import Prefetcher
 import asyncio
 from textual import on
 # ... existing imports ...
@@ -133,7 +137,11 @@ class CollectionBrowserScreen(BaseScreen):
         self.service = CollectionService()
         self.table.clear()
         self.table.add_columns("GUID", "Display Name", "Qualified Name", "Description")
+        # Rows keyed by GUID, else qualified name; refreshes apply only the differences
+        self._updater = KeyedTableUpdater(self.table, key_index=(0, 2))
+        self._filter = IndexedRows(text_columns=(1, 2, 3))  # every loaded row, indexed for search
         self.last_selected_guid = ""  # track selection defensively
+        self._prefetcher = Prefetcher(dwell_seconds=0.3, max_concurrency=2)
         await self.load_collections()
         # Ensure the table has focus for key handling (use Screen API)
         try:
@@ -153,6 +161,15 @@ class CollectionBrowserScreen(BaseScreen):
             return
         if row_data:
             self.last_selected_guid = row_data[0] or ""
+            # Warm details and members while the cursor rests here
+            guid = self.last_selected_guid
+            self._prefetcher.hover(guid, lambda: self.service.prefetch_collection_async(guid))
+
+    def on_unmount(self) -> None:
+        prefetcher = getattr(self, "_prefetcher", None)
+        if prefetcher is not None:
+            prefetcher.cancel_all()
+        super().on_unmount()
 
     async def on_data_table_row_selected(self, event: DataTable.RowSelected):
         try:
@@ -206,18 +223,9 @@ class CollectionBrowserScreen(BaseScreen):
                 pass
 
     # Helper defined BEFORE handlers that call it to avoid "unresolved reference" warnings
-    async def _refresh_and_focus(self):
-        await self.load_collections()
-        try:
-            if self.table.row_count > 0:
-                try:
-                    self.table.move_cursor(row=0, column=0)
-                except Exception:
-                    # Fallback removed to avoid Coordinate dependency
-                    pass
-            self.set_focus(self.table)
-        except Exception:
-            pass
+    async def _refresh_and_focus(self, refresh: bool = False):
+        # The load places the cursor and focus once its rows are on screen
+        await self.load_collections(refresh=refresh)
 
     @on(AddCollectionScreen.CollectionCreated)
     async def on_collection_created(self, msg: AddCollectionScreen.CollectionCreated):
@@ -235,47 +243,36 @@ class CollectionBrowserScreen(BaseScreen):
 
     async def action_refresh(self):
         """
-        Hotkey handler for 'r' to reload collections.
+        Hotkey handler for 'r' to reload collections (bypasses the response cache).
         """
-        await self._refresh_and_focus()
+        await self._refresh_and_focus(refresh=True)
 
-    async def load_collections(self, search: str = ""):
-        self.table.clear()
-        try:
-            collections = await asyncio.to_thread(self.service.list_collections, search or "*")
-            if collections:
-                for c in collections:
-                    guid = (
-                        c.get("GUID", "")
-                        or c.get("guid", "")
-                        or c.get("Id", "")
-                        or c.get("ID", "")
-                    )
-                    display = (
-                        c.get("display_name", "")
-                        or c.get("displayName", "")
-                        or c.get("Display Name", "")
-                        or c.get("name", "")
-                        or c.get("Name", "")
-                    )
-                    qname = (
-                        c.get("qualified_name", "")
-                        or c.get("qualifiedName", "")
-                        or c.get("Qualified Name", "")
-                    )
-                    desc = (
-                        c.get("description", "")
-                        or c.get("summary", "")
-                        or c.get("Description", "")
-                    )
-                    self.table.add_row(guid, display, qname, desc)
-            else:
-                self.table.add_row("", "No results found", "", "")
-        except Exception as e:
-            self.table.add_row("", f"Error: {e}", "", "")
+    async def load_collections(self, search: str = "", refresh: bool = False):
+        """
+        Stale-while-revalidate: show the last-known result set immediately, then fetch
+        fresh data in a background worker and apply only the differences.
+        """
+        search = search or "*"
+        snapshot = None if refresh else self.service.peek_collections(search)
+        if snapshot is not None:
+            await self._index_rows(self._collection_rows(snapshot[0]), search)
+            self._show_staleness(snapshot[1])
+        # A manual refresh keeps the rows on screen and diffs against the full result
+        have_rows = snapshot is not None or (refresh and bool(self._updater.rows))
         self.last_selected_guid = ""
+        if snapshot is not None and not refresh:
+            # The snapshot rows are already on screen; the revalidation diff keeps the cursor
+            self._focus_table(home=True)
+        self.run_worker(
+            self._revalidate_collections(search, refresh, have_snapshot=have_rows),
+            exclusive=True,
+            group="load_collections",
+        )
+
+    def _focus_table(self, home: bool) -> None:
+        """Focus the table, first moving the cursor to the top row if home."""
         try:
-            if self.table.row_count > 0:
+            if home and self.table.row_count > 0:
                 try:
                     self.table.move_cursor(row=0, column=0)
                 except Exception:
@@ -283,3 +280,99 @@ class CollectionBrowserScreen(BaseScreen):
             self.set_focus(self.table)
         except Exception:
             pass
+
+    async def _revalidate_collections(self, search: str, refresh: bool, have_snapshot: bool):
+        try:
+            await self._fetch_collections(search, refresh, have_snapshot)
+        finally:
+            # A refresh keeps the cursor on the row it was on; a new listing starts at the top
+            self._focus_table(home=not (refresh or have_snapshot))
+
+    async def _fetch_collections(self, search: str, refresh: bool, have_snapshot: bool):
+        try:
+            if have_snapshot:
+                collections = await asyncio.to_thread(self.service.list_collections, search, refresh)
+            else:
+                # Nothing on screen yet: render each page as it arrives
+                collections = []
+                self._filter.set_rows([], complete=False, answers=search)
+                async for page in self.service.iter_collections(search, remember=True):
+                    collections.extend(page)
+                    self._filter.add_rows(self._collection_rows(page))
+                    self._show_rows(self._filter.visible())
+        except Exception as e:
+            if have_snapshot:
+                # Keep showing the last-known rows; just report the failed refresh
+                self.notify(f"Refresh failed: {e}", severity="warning")
+            else:
+                self._show_rows([("", f"Error: {e}", "", "")])
+            return
+        self._show_staleness(None)
+        if collections:
+            await self._index_rows(self._collection_rows(collections), search)
+        else:
+            self._filter.set_rows([], complete=search == "*")
+            self._show_rows([("", "No results found", "", "")])
+
+    def _show_staleness(self, age):
+        """Title shows the snapshot age until fresh data has arrived."""
+        title = "Collections" if age is None else f"Collections (snapshot, {format_age(age)} old)"
+        self.query_one("#c_title", Static).update(title)
+
+    def _show_rows(self, rows):
+        self._updater.update(rows)
+
+    async def _index_rows(self, rows, search: str):
+        """Re-index the server's answer to search off the UI thread, then show it for the search box."""
+        fresh = IndexedRows(self._filter.text_columns)
+        fresh.query = self._filter.query
+        # Only an unfiltered listing lets keystrokes filter without asking the server; the
+        # rows of a server search are shown as returned
+        await asyncio.to_thread(fresh.set_rows, rows, search == "*", search)
+        self._filter = fresh
+        self._show_rows(fresh.visible())
+
+    @on(Input.Changed, "#search-input")
+    def filter_as_you_type(self, event: Input.Changed) -> None:
+        """Filter the loaded rows locally on every keystroke."""
+        self._show_rows(self._filter.visible(event.value))
+
+    @on(Button.Pressed, "#search-button")
+    @on(Input.Submitted, "#search-input")
+    async def handle_search(self, event) -> None:
+        """Search locally; only go to the server when the loaded rows are not the full set."""
+        query = self.query_one("#search-input", Input).value.strip()
+        if self._filter.needs_server(query):
+            await self.load_collections(search=query)
+        else:
+            self._show_rows(self._filter.visible(query))
+
+    @staticmethod
+    def _collection_rows(collections):
+        rows = []
+        for c in collections:
+            guid = (
+                c.get("GUID", "")
+                or c.get("guid", "")
+                or c.get("Id", "")
+                or c.get("ID", "")
+            )
+            display = (
+                c.get("display_name", "")
+                or c.get("displayName", "")
+                or c.get("Display Name", "")
+                or c.get("name", "")
+                or c.get("Name", "")
+            )
+            qname = (
+                c.get("qualified_name", "")
+                or c.get("qualifiedName", "")
+                or c.get("Qualified Name", "")
+            )
+            desc = (
+                c.get("description", "")
+                or c.get("summary", "")
+                or c.get("Description", "")
+            )
+            rows.append((guid, display, qname, desc))
+        return rows
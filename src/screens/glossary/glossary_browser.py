@@ -14,6 +14,9 @@ from textual.containers import Horizontal, Vertical, Container
 from screens.base_screen import BaseScreen
 from services.glossary_service import GlossaryService
 from .term_details import TermDetailsScreen
+from widgets.table_updater import KeyedTableUpdater
+from utils.snapshot_store import format_age
+from utils.search_index import IndexedRows
 import asyncio
 
 
@@ -45,8 +48,8 @@ class GlossaryBrowserScreen(BaseScreen):
             # Search (fixed 5 rows)
             Container(
                 Horizontal(
-                    Input(placeholder="Search...", id="search-input", disabled=True),
-                    Button("Search", id="search-button", disabled=True),
+                    Input(placeholder="Search...", id="search-input"),
+                    Button("Search", id="search-button"),
                     id="search_row",
                 ),
                 id="search_row_container",
@@ -147,6 +150,9 @@ class GlossaryBrowserScreen(BaseScreen):
         self.title_widget.update("Glossaries")
         self.table.clear(columns=True)
         self.table.add_columns("GUID", "Display Name", "Qualified Name", "Description")
+        # Rows keyed by GUID, else qualified name; refreshes apply only the differences
+        self._updater = KeyedTableUpdater(self.table, key_index=(0, 2))
+        self._filter = IndexedRows(text_columns=(1, 2, 3))  # every loaded glossary, indexed for search
         self.selected_glossary_guid = ""
         self.selected_glossary_name = ""
         self._set_buttons_state(
@@ -201,33 +207,97 @@ class GlossaryBrowserScreen(BaseScreen):
     # ------------- Loader -------------
 
     async def _load_glossaries(self, search: str = ""):
-        self.table.clear()
+        """
+        Stale-while-revalidate: render the last-known glossaries at once, then revalidate
+        in a background worker and apply only the differences.
+        """
+        search = search or "*"
+        snapshot = self.service.peek_glossaries(search)
+        if snapshot is not None:
+            await self._index_rows(self._glossary_rows(snapshot[0]), search)
+            self.title_widget.update(f"Glossaries (snapshot, {format_age(snapshot[1])} old)")
+        self.run_worker(
+            self._revalidate_glossaries(search, have_snapshot=snapshot is not None),
+            exclusive=True,
+            group="load_glossaries",
+        )
+
+    async def _revalidate_glossaries(self, search: str, have_snapshot: bool):
         try:
-            # Run the sync call in a worker thread to avoid blocking the UI loop
-            glossaries = await asyncio.to_thread(self.service.list_glossaries, search or "*")
-            self.log(f"Loaded {len(glossaries)} glossaries")
-            self.log(f"Glossaries: {glossaries}")
-            if glossaries:
-                for g in glossaries:
-                    self.table.add_row(
-                        g.get("GUID", "") or g.get("guid", ""),
-                        g.get("display_name", "") or g.get("displayName", ""),
-                        g.get("qualified_name", "") or g.get("qualifiedName", ""),
-                        g.get("description", "") or g.get("summary", ""),
-                    )
+            if have_snapshot:
+                # Run the sync call in a worker thread to avoid blocking the UI loop
+                glossaries = await asyncio.to_thread(self.service.list_glossaries, search)
             else:
-                self.table.add_row("", "No glossaries found", "", "")
+                # Nothing on screen yet: render each page as it arrives
+                glossaries = []
+                self._filter.set_rows([], complete=False, answers=search)
+                async for page in self.service.iter_glossaries(search, remember=True):
+                    glossaries.extend(page)
+                    self._filter.add_rows(self._glossary_rows(page))
+                    self._show_rows(self._filter.visible())
+            self.log(f"Loaded {len(glossaries)} glossaries")
         except Exception as e:
-            self.table.add_row("", f"Error: {e}", "", "")
+            if have_snapshot:
+                self.notify(f"Refresh failed: {e}", severity="warning")
+            else:
+                self._show_rows([("", f"Error: {e}", "", "")])
+            return
+        self.title_widget.update("Glossaries")
+        if glossaries:
+            await self._index_rows(self._glossary_rows(glossaries), search)
+        else:
+            self._filter.set_rows([], complete=search == "*")
+            self._show_rows([("", "No glossaries found", "", "")])
+
+    def _show_rows(self, rows):
+        self._updater.update(rows)
+
+    async def _index_rows(self, rows, search: str):
+        """Re-index the server's answer to search off the UI thread, then show it for the search box."""
+        fresh = IndexedRows(self._filter.text_columns)
+        fresh.query = self._filter.query
+        # Only an unfiltered listing lets keystrokes filter without asking the server; the
+        # rows of a server search are shown as returned
+        await asyncio.to_thread(fresh.set_rows, rows, search == "*", search)
+        self._filter = fresh
+        self._show_rows(fresh.visible())
+
+    def on_input_changed(self, event: Input.Changed) -> None:
+        """Filter the loaded glossaries locally on every keystroke."""
+        if event.input.id == "search-input" and self.mode == "glossaries":
+            self._show_rows(self._filter.visible(event.value))
+
+    async def on_input_submitted(self, event: Input.Submitted) -> None:
+        if event.input.id == "search-input":
+            await self._search(event.value.strip())
+
+    async def _search(self, query: str) -> None:
+        """Search locally; only go to the server when the loaded rows are not the full set."""
+        if self.mode != "glossaries":
+            return
+        if self._filter.needs_server(query):
+            await self._load_glossaries(search=query)
+        else:
+            self._show_rows(self._filter.visible(query))
+
+    @staticmethod
+    def _glossary_rows(glossaries):
+        return [
+            (
+                g.get("GUID", "") or g.get("guid", ""),
+                g.get("display_name", "") or g.get("displayName", ""),
+                g.get("qualified_name", "") or g.get("qualifiedName", ""),
+                g.get("description", "") or g.get("summary", ""),
+            )
+            for g in glossaries
+        ]
 
     # ------------- Button handlers -------------
 
     async def on_button_pressed(self, event: Button.Pressed):
         btn_id = event.button.id
         if btn_id == "search-button":
-            query = self.query_one("#search-input", Input).value.strip()
-            if self.mode == "glossaries":
-                await self._load_glossaries(search=query)
+            await self._search(self.query_one("#search-input", Input).value.strip())
 
         elif btn_id == "back-button":
             self._configure_for_glossaries()
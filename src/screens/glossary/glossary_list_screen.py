@@ -10,7 +10,8 @@ This module provides services for the Glossary related functions of my_egeria mo
 
 from textual.widgets import Static
 from textual.containers import Vertical
-from widgets.editable_table import EditableDataTable
+from widgets.row_sources import ListRowSource
+from widgets.virtual_table import VirtualTable
 from services.glossary_service import GlossaryService
 from screens.base_screen import BaseScreen
 
@@ -21,7 +22,7 @@ class GlossaryListScreen(BaseScreen):
     def __init__(self, glossary_service: GlossaryService) -> None:
         super().__init__()
         self.glossary_service = glossary_service
-        self.table = EditableDataTable(id="glossary-table")
+        self.table = VirtualTable(id="glossary-table", editable=True)
 
     def compose(self):
         yield from super().compose()
@@ -32,15 +33,18 @@ class GlossaryListScreen(BaseScreen):
 
     async def on_mount(self):
         await super().on_mount()
-        self.table.add_columns("Glossary Name", "Description")
         glossaries = await self.glossary_service.list_glossaries_async()
+        rows = []
         for g in glossaries or []:
             name = g.get("display_name") or g.get("displayName") or g.get("qualified_name") or g.get("qualifiedName") or ""
             desc = g.get("description") or g.get("summary") or ""
-            self.table.add_row(name, desc)
+            rows.append((name, desc))
+        # Only the rows on screen are rendered, however many glossaries there are
+        self.table.set_source(ListRowSource(("Glossary Name", "Description"), rows))
         self.table.focus()
 
-    async def on_editable_data_table_row_selected(self, event):
-        selected_row = self.table.get_row_at(event.cursor_row)
-        glossary_name = selected_row[0]
+    async def on_virtual_table_row_selected(self, event: VirtualTable.RowSelected):
+        if event.values is None:
+            return
+        glossary_name = event.values[0]
         self.app.show_term_list(glossary_name)
@@ -15,7 +15,6 @@ from textual.containers import Container
 
 from .base_screen import BaseScreen
 from utils.config import get_global_config
-from utils.egeria_client import EgeriaTechClientManager
 
 
 class GovernanceScreen(BaseScreen):
@@ -25,7 +24,6 @@ class GovernanceScreen(BaseScreen):
         super().__init__(**kwargs)
         self.table = DataTable()
         self.cfg = get_global_config()
-        self.manager = EgeriaTechClientManager(self.cfg)
 
     def compose(self) -> ComposeResult:
         yield from super().compose()
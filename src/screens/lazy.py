@@ -0,0 +1,36 @@
+# Python
+
+"""PDX-License-Identifier: Apache-2.0
+Copyright Contributors to the ODPi Egeria project.
+
+This module provides lazily imported screen registrations for the my_egeria module.
+
+
+"""
+
+import importlib
+
+
+def screen_class(path: str):
+    """The screen class named by "package.module:ClassName", importing its module if needed."""
+    module_name, _, class_name = path.partition(":")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+class LazyScreen:
+    """
+    A SCREENS entry that imports its screen module only when the screen is first pushed.
+    Textual calls SCREENS entries to build the screen (and keeps the instance), so this
+    behaves like registering the class itself, minus the import at app start-up.
+    """
+
+    __slots__ = ("path",)
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def __call__(self, *args, **kwargs):
+        return screen_class(self.path)(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        return f"LazyScreen({self.path!r})"
@@ -8,12 +8,18 @@ This module provides services for the Screen related functions of my_egeria modu
 
 """
 
+import asyncio
 import os
 from textual.containers import Container, Vertical
 from textual.message import Message
 from textual.widgets import Static, Input, Button
 from .base_screen import BaseScreen
-from ..con_services.egeria_connection import connect_to_egeria
+from services.warmup import keep_warmup_for
+from utils.config import EgeriaConfig, get_global_config
+from con_services.egeria_connection import connect_to_egeria
+
+# Quiet time after the last keystroke before the form is compared with the warm-up
+WARMUP_CHECK_SECONDS = 0.75
 
 
 class LoginScreen(BaseScreen):
@@ -29,6 +35,7 @@ class LoginScreen(BaseScreen):
     def __init__(self):
         super().__init__()
         self.login_payload: list = []
+        self._warmup_check = None
 
     def compose(self):
         yield from super().compose()
@@ -104,9 +111,32 @@ class LoginScreen(BaseScreen):
         # Focus username for convenience
         self.query_one("#username", Input).focus()
 
+    def _entered_config(self) -> EgeriaConfig:
+        """The connection described by the form; blank fields keep their defaults."""
+        return get_global_config().with_overrides(
+            user=self.query_one("#username", Input).value.strip(),
+            password=self.query_one("#password", Input).value.strip(),
+            platform_url=self.query_one("#platform-url", Input).value.strip(),
+            view_server=self.query_one("#view-server", Input).value.strip(),
+        )
+
+    def on_input_changed(self, event: Input.Changed) -> None:
+        # The splash warm-up signed in with the defaults; drop it once the user settles on
+        # another connection (not on a half-typed field), and restart it if they come back
+        if self._warmup_check is not None:
+            self._warmup_check.stop()
+        self._warmup_check = self.set_timer(WARMUP_CHECK_SECONDS, self._check_warmup)
+
+    def _check_warmup(self) -> None:
+        if self._warmup_check is not None:
+            self._warmup_check.stop()
+            self._warmup_check = None
+        keep_warmup_for(self._entered_config())
+
     async def on_button_pressed(self, event: Button.Pressed):
         if event.button.id != "login_button":
             return
+        self._check_warmup()
 
         username = self.query_one("#username", Input).value.strip()
         password = self.query_one("#password", Input).value.strip()
@@ -138,7 +168,10 @@ class LoginScreen(BaseScreen):
         ok = False
         try:
             # Run blocking work off the UI thread, with a timeout for safety
-            ok = connect_to_egeria,
+            ok = await asyncio.wait_for(
+                asyncio.to_thread(connect_to_egeria, username, password, platform_url, view_server),
+                timeout=30.0,
+            )
         except Exception as e:
             ok = False
             status.update(f"Error: {e}")
@@ -31,6 +31,7 @@ class MainMenuScreen(BaseScreen):
                 Vertical(
                     Static("Egeria Management Console", id="menu_title"),
                     Vertical(
+                        Button("Search Everything", id="omnibox"),
                         Button("Glossaries", id="glossaries"),
                         Button("Collections", id="collections"),
                         Button("GovernanceOfficer", id="gov_officers"),
@@ -93,12 +94,14 @@ class MainMenuScreen(BaseScreen):
         buttons.styles.width = "100%"
 
         # Make buttons a consistent width for aesthetics
-        for bid in ("#glossaries", "#collections", "#projects", "#subject_areas", "#quit"):
+        for bid in ("#omnibox", "#glossaries", "#collections", "#projects", "#subject_areas", "#quit"):
             btn = self.query_one(bid, Button)
             btn.styles.width = 24  # fixed character width
 
     async def on_button_pressed(self, event: Button.Pressed):
-        if event.button.id == "glossaries":
+        if event.button.id == "omnibox":
+            await self.app.push_screen("omnibox")
+        elif event.button.id == "glossaries":
             await self.app.push_screen("glossary_browser")
         elif event.button.id == "collections":
             await self.app.push_screen("collection_browser")
@@ -116,3 +119,5 @@ class MainMenuScreen(BaseScreen):
     async def on_key(self, event: events.Key):
         if event.key == "q":
             self.app.exit()
+        elif event.key == "slash":
+            await self.app.push_screen("omnibox")
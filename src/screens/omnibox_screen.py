@@ -0,0 +1,137 @@
+# python
+
+"""PDX-License-Identifier: Apache-2.0
+Copyright Contributors to the ODPi Egeria project.
+
+This module provides the cross-entity search ("omnibox") Screen of my_egeria module.
+
+
+"""
+
+from contextlib import aclosing
+from textual import on
+from textual.containers import Vertical
+from textual.widgets import DataTable, Input, Static
+from screens.base_screen import BaseScreen
+from services.search_service import SearchHit, UnifiedSearchService, SOURCES
+from widgets.table_updater import KeyedTableUpdater, keyed_rows
+
+DEBOUNCE_SECONDS = 0.25
+
+
+class OmniboxScreen(BaseScreen):
+    """
+    One search box over glossaries, terms, collections, technology types, governance
+    definitions and report specs. Each source's answer is merged into a single ranked list as it arrives;
+    typing again cancels the sources still running for the previous query.
+    """
+
+    CSS_PATH = [*BaseScreen.CSS_PATH]  # same directory, so the relative paths still resolve
+    BINDINGS = [
+        ("escape", "back", "Back"),
+    ]
+
+    def __init__(self, query: str = ""):
+        super().__init__()
+        self.initial_query = query
+        self.service = UnifiedSearchService()
+        self._hits: list[SearchHit] = []
+        self._status = {}
+        self._debounce = None
+
+    def compose(self):
+        yield from super().compose()
+        yield Vertical(
+            Static("Search everything", id="omni_title"),
+            Input(placeholder="Search glossaries, terms, collections, tech types, governance...", id="omni-input"),
+            Static("", id="omni_status"),
+            DataTable(id="omni-table", cursor_type="row"),
+            id="omni_root",
+        )
+
+    async def on_mount(self):
+        await super().on_mount()
+        self.table = self.query_one("#omni-table", DataTable)
+        self.table.add_columns("Kind", "Display Name", "Qualified Name", "GUID")
+        self._updater = KeyedTableUpdater(self.table)
+        self.query_one("#omni_title", Static).styles.text_style = "bold"
+        box = self.query_one("#omni-input", Input)
+        box.value = self.initial_query
+        self.set_focus(box)
+        if self.initial_query:
+            self._start_search(self.initial_query)
+
+    async def action_back(self) -> None:
+        await self.app.pop_screen()
+
+    # ------------- Searching -------------
+
+    @on(Input.Changed, "#omni-input")
+    def schedule_search(self, event: Input.Changed) -> None:
+        """Debounce keystrokes so a fast typist does not fan out once per character."""
+        if self._debounce is not None:
+            self._debounce.stop()
+        query = event.value
+        self._debounce = self.set_timer(DEBOUNCE_SECONDS, lambda: self._start_search(query))
+
+    @on(Input.Submitted, "#omni-input")
+    def search_now(self, event: Input.Submitted) -> None:
+        if self._debounce is not None:
+            self._debounce.stop()
+        self._start_search(event.value)
+
+    def _start_search(self, query: str) -> None:
+        query = query.strip()
+        self._hits = []
+        self._status = {source.kind: "…" for source in SOURCES}
+        if not query:
+            self.workers.cancel_group(self, "omnibox")
+            self._status = {}
+            self._render()
+            return
+        # exclusive=True cancels the previous query's worker, which cancels its pending sources
+        self.run_worker(self._run_search(query), exclusive=True, group="omnibox")
+
+    async def _run_search(self, query: str) -> None:
+        self._render()
+        # aclosing: a cancelled worker closes the stream at once, cancelling slow sources
+        async with aclosing(self.service.search(query)) as batches:
+            async for batch in batches:
+                if batch.error is not None:
+                    self._status[batch.source.kind] = "error"
+                    self.log(f"{batch.source.kind} search failed: {batch.error}")
+                else:
+                    self._status[batch.source.kind] = str(len(batch.hits))
+                    self._hits = sorted(self._hits + batch.hits)
+                self._render()
+
+    def _render(self) -> None:
+        status = "  ".join(f"{kind}: {state}" for kind, state in self._status.items())
+        self.query_one("#omni_status", Static).update(status)
+        rows = [(h.kind, h.display_name, h.qualified_name, h.guid) for h in self._hits]
+        keyed = [(f"{row[0]}:{key}", row) for key, row in keyed_rows(rows, key_index=(3, 2))]
+        self._updater.update_keyed(keyed)
+
+    # ------------- Navigation -------------
+
+    async def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
+        try:
+            kind, _name, _qname, guid = self.table.get_row(event.row_key)
+        except Exception:
+            return
+        if kind == "Collection" and guid:
+            from screens.collections.collection_details import CollectionDetailsScreen
+
+            await self.app.push_screen(CollectionDetailsScreen(guid))
+        elif kind == "Term" and guid:
+            from screens.glossary.term_details import TermDetailsScreen
+
+            await self.app.push_screen(TermDetailsScreen(guid))
+        elif kind == "Glossary":
+            await self.app.push_screen("glossary_browser")
+        elif kind == "Report Spec":
+            self.notify(f"Report spec {_name} ({_qname}) - open it from my_reports")
+        elif kind == "Governance Definition":
+            await self.app.push_screen("governance_officer_browser")
+        else:
+            self.notify(f"{kind}: {guid}")
@@ -12,7 +12,6 @@ from textual.widgets import Static, DataTable
 from textual.app import ComposeResult
 from textual.containers import Container
 from utils.config import get_global_config
-from utils.egeria_client import EgeriaTechClientManager
 from ..base_screen import BaseScreen
 
 
@@ -23,7 +22,6 @@ class PlatformsScreen(BaseScreen):
         super().__init__(**kwargs)
         self.table = DataTable()
         self.cfg = get_global_config()
-        self.manager = EgeriaTechClientManager(self.cfg)
 
     def compose(self) -> ComposeResult:
         yield from super().compose()
@@ -13,6 +13,17 @@ from textual.message import Message
 from textual.widgets import Label, Button, TextArea
 from textual import on
 from .base_screen import BaseScreen
+from services.warmup import start_warmup
+
+# Splash status line for each warm-up stage
+WARMUP_STATUS = {
+    "probe": "Checking the Egeria platform…",
+    "authenticate": "Signing in…",
+    "prefetch": "Loading glossaries and collections…",
+    "done": "Ready.",
+    "failed": "",
+    "cancelled": "",
+}
 
 
 class SplashScreen(BaseScreen):
@@ -60,6 +71,7 @@ class SplashScreen(BaseScreen):
                 id="splash_meta",
             ),
             Button("Continue", variant="primary", id="continue"),
+            Label("", id="splash_warmup"),
             id="splash_top",
         )
         yield top
@@ -111,6 +123,17 @@ class SplashScreen(BaseScreen):
         btn = self.query_one("#continue", Button)
         btn.styles.margin = (1, 0, 0, 0)
 
+        status = self.query_one("#splash_warmup", Label)
+        status.styles.text_align = "center"
+        status.styles.color = "grey"
+
+        # Sign in and fetch the main-menu data with the default credentials while the user reads
+        start_warmup(on_progress=self._show_warmup)
+
+    def _show_warmup(self, stage: str) -> None:
+        if self.is_attached:
+            self.query_one("#splash_warmup", Label).update(WARMUP_STATUS.get(stage, ""))
+
     @on(Button.Pressed, "#continue")
     async def continue_to_app(self) -> None:
         self.post_message(self.SplashContinue())
\ No newline at end of file
@@ -8,13 +8,71 @@ This module provides services for the functions of my_egeria module.
 
 """
 
-from typing import Any, List, Dict, Optional, Tuple
-from utils.egeria_client import EgeriaTechClientManager
+import asyncio
+import contextvars
+import json
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, List, Dict, Optional, Tuple
+from utils.egeria_client import EgeriaTechClientManager, acquire_manager, get_client_pool, release_manager
 from utils.config import EgeriaConfig, get_global_config
+from utils.circuit_breaker import CircuitOpenError, is_transport_failure
+from utils.async_egeria_client import AsyncEgeriaClientManager, NativeAsyncUnavailable
+from utils.response_cache import cache_enabled, default_ttl_seconds, get_response_cache
+from utils.snapshot_store import get_snapshot_store
+from utils.single_flight import get_single_flight
+from utils.scheduler import get_scheduler
+from utils.hedging import get_hedger, hedging_enabled
 from os import getenv
+from functools import lru_cache
+from importlib import metadata
+
+# (logical operation, pyegeria version) -> (method name, positional arg count, kwarg names)
+_RESOLUTION_CACHE: Dict[Tuple[str, str], Tuple[str, int, Tuple[str, ...]]] = {}
+
+
+@lru_cache(maxsize=1)
+def _pyegeria_version() -> str:
+    try:
+        return metadata.version("pyegeria")
+    except Exception:
+        return "unknown"
+
+
+def _candidate_shape(name: str, args: Tuple, kwargs: dict) -> Tuple[str, int, Tuple[str, ...]]:
+    return name, len(args), tuple(sorted(kwargs))
+
+
+def _is_signature_error(exc: BaseException) -> bool:
+    """Missing method or mismatched arguments, as opposed to a failure of the call itself."""
+    return isinstance(exc, (AttributeError, TypeError))
+
+
+@dataclass
+class BulkResult:
+    """Outcome of a many-GUID lookup: results and errors are keyed by GUID, in request order."""
+
+    results: Dict[str, Any] = field(default_factory=dict)
+    errors: Dict[str, Exception] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+
+def _unique_guids(guids: Iterable[str]) -> List[str]:
+    return list(dict.fromkeys(g for g in guids if g))
+
 
 class BaseService:
-    """Shared logic for services: client management, safe invocation, normalization."""
+    """Shared logic for services: client management, safe invocation, caching, normalization."""
+
+    # Per-operation cache TTLs in seconds (pyegeria method name -> TTL); others use the default
+    READ_TTLS: Dict[str, float] = {}
+    # Read operations persisted to the local SQLite snapshot for instant cold starts
+    SNAPSHOT_OPERATIONS: Tuple[str, ...] = ()
+    # Idempotent reads that may be hedged (EGERIA_HEDGED_READS) when they fall into the slow tail
+    HEDGED_OPERATIONS: Tuple[str, ...] = ()
 
     def __init__(
         self,
@@ -22,13 +80,23 @@ class BaseService:
         manager: Optional[EgeriaTechClientManager] = None,
     ):
         self.config = config or get_global_config()
-        self.manager = manager or EgeriaTechClientManager(self.config)
+        # Share one authenticated client per (platform, view server, user) across services
+        self._pooled = manager is None
+        self.manager = manager or acquire_manager(self.config)
+        # Shared per view server: caps concurrent calls and serves interactive ones first
+        self.scheduler = get_scheduler(self.config.platform_url, self.config.view_server)
 
     # Invoke a method by name on the client with auto-refresh retry
     def _invoke(
-        self, method_name: str, args: Tuple = (), kwargs: Optional[dict] = None
+        self,
+        method_name: str,
+        args: Tuple = (),
+        kwargs: Optional[dict] = None,
+        *,
+        manager: Optional[EgeriaTechClientManager] = None,
     ):
         kwargs = kwargs or {}
+        manager = manager or self.manager
 
         def _call(client, *a, **k):
             fn = getattr(client, method_name, None)
@@ -36,7 +104,121 @@ class BaseService:
                 raise AttributeError(f"Client has no method '{method_name}'")
             return fn(*a, **k)
 
-        return self.manager.invoke_with_auto_refresh(_call, args=args, kwargs=kwargs)
+        with self.scheduler.slot():
+            return manager.invoke_with_auto_refresh(_call, args=args, kwargs=kwargs)
+
+    def _hedged(self, method_name: str) -> bool:
+        return method_name in self.HEDGED_OPERATIONS and hedging_enabled()
+
+    def _read_invoke(self, method_name: str, args: Tuple, kwargs: dict):
+        """_invoke for a cache miss in _read; hedged on a second client where allowed."""
+        if not self._hedged(method_name):
+            return self._invoke(method_name, args=args, kwargs=kwargs)
+        hedge = get_client_pool().hedge_manager(self.config)
+        return get_hedger(self.config.platform_url, self.config.view_server).run(
+            method_name,
+            lambda: self._invoke(method_name, args=args, kwargs=kwargs),
+            lambda: self._invoke(method_name, args=args, kwargs=kwargs, manager=hedge),
+        )
+
+    # ------------------ read-through response cache ------------------
+
+    @property
+    def cache_scope(self) -> Tuple[str, str, str]:
+        return (self.config.platform_url.rstrip("/"), self.config.view_server, self.config.user)
+
+    def _cache_key(self, method_name: str, args: Tuple = (), kwargs: Optional[dict] = None):
+        return get_response_cache().make_key(self.cache_scope, method_name, args, kwargs)
+
+    def _ttl_for(self, method_name: str) -> float:
+        return self.READ_TTLS.get(method_name, default_ttl_seconds())
+
+    def _read(
+        self,
+        method_name: str,
+        args: Tuple = (),
+        kwargs: Optional[dict] = None,
+        *,
+        refresh: bool = False,
+    ):
+        """_invoke for read-only operations, served from the shared response cache when fresh."""
+        kwargs = kwargs or {}
+        key = self._cache_key(method_name, args, kwargs)
+        if cache_enabled() and not refresh:
+            hit, value = get_response_cache().get(key)
+            if hit:
+                return value
+
+        def fetch():
+            generation = self._generation(method_name)
+            res = self._read_invoke(method_name, args, kwargs)
+            self._store_read(key, method_name, args, kwargs, res, generation)
+            return res
+
+        # Identical concurrent reads share one request
+        return get_single_flight().do(key, fetch)
+
+    def _generation(self, method_name: str) -> int:
+        return get_response_cache().generation(self.cache_scope, method_name)
+
+    def _store_read(
+        self, key, method_name: str, args: Tuple, kwargs: dict, res: Any, generation: int
+    ) -> None:
+        """Cache and snapshot res, unless method_name was invalidated since generation was read."""
+        if self._generation(method_name) != generation:
+            return  # a mutation landed while the read was in flight; res may predate it
+        if cache_enabled():
+            get_response_cache().put(key, res, self._ttl_for(method_name))
+        self._record_snapshot(method_name, args, kwargs, res)
+
+    def _peek(
+        self, method_name: str, args: Tuple = (), kwargs: Optional[dict] = None
+    ) -> Optional[Tuple[Any, float]]:
+        """
+        Last-known response and its age in seconds, even if expired (stale-while-revalidate).
+        Falls back to the on-disk snapshot, so a cold start can render before any network call.
+        """
+        kwargs = kwargs or {}
+        snapshot = get_response_cache().peek(self._cache_key(method_name, args, kwargs))
+        if snapshot is not None:
+            return snapshot
+        store = get_snapshot_store() if method_name in self.SNAPSHOT_OPERATIONS else None
+        if store is None:
+            return None
+        try:
+            return store.load(self.snapshot_scope, method_name, self._snapshot_request(args, kwargs))
+        except Exception:
+            return None
+
+    # ------------------ persistent snapshot ------------------
+
+    @property
+    def snapshot_scope(self) -> str:
+        return "|".join(self.cache_scope)
+
+    @staticmethod
+    def _snapshot_request(args: Tuple, kwargs: dict) -> str:
+        return json.dumps([list(args), kwargs], sort_keys=True, default=str)
+
+    def _record_snapshot(self, method_name: str, args: Tuple, kwargs: dict, res: Any) -> None:
+        if method_name not in self.SNAPSHOT_OPERATIONS:
+            return
+        store = get_snapshot_store()
+        if store is not None:
+            store.record(self.snapshot_scope, method_name, self._snapshot_request(args, kwargs), res)
+
+    def snapshot_age(self) -> Optional[float]:
+        """Seconds since anything was last written to the local snapshot for this connection."""
+        store = get_snapshot_store()
+        return store.age(self.snapshot_scope) if store is not None else None
+
+    def _invalidate(self, *method_names: str) -> None:
+        """Drop cached reads made stale by a mutation."""
+        get_response_cache().invalidate(self.cache_scope, method_names)
+        get_single_flight().forget(self.cache_scope, method_names)
+        store = get_snapshot_store()
+        if store is not None:
+            store.forget(self.snapshot_scope, method_names)
 
     def _normalize_list(self, res: Any, keys: Tuple[str, ...]) -> List[Dict[str, Any]]:
         if res is None:
@@ -52,45 +234,257 @@ class BaseService:
         return [res]
 
     def _call_list_like(
-        self, candidates, keys: Tuple[str, ...]
+        self, candidates, keys: Tuple[str, ...], op: Optional[str] = None
     ) -> List[Dict[str, Any]]:
-        last_err = None
         if getenv("EGERIA_DEBUG_METHODS", "").lower() in ("1", "true", "yes"):
             print(f"[debug] trying methods: {[name for name,_,_ in candidates]}")
-        for name, args, kwargs in candidates:
-            try:
-                res = self._invoke(name, args=tuple(args), kwargs=kwargs)
-                if getenv("EGERIA_DEBUG_RESULTS", "").lower() in ("1", "true", "yes"):
-                    shape = type(res).__name__
-                    size = (len(res) if isinstance(res, (list, tuple)) else
-                            len(res) if isinstance(res, dict) else None)
-                    print(f"[debug] {name} returned shape={shape} size={size}")
-                    if isinstance(res, dict):
-                        print(f"[debug] dict keys: {list(res.keys())[:10]}")
-                    if isinstance(res, list) and res:
-                        sample = res[0]
-                        print(f"[debug] first item keys: {list(sample.keys())[:10] if isinstance(sample, dict) else type(sample).__name__}")
-                return self._normalize_list(res, keys)
-            except Exception as e:
-                last_err = e
-                continue
-        raise ConnectionError(
-            f"Operation failed (tried multiple client methods). Last error: {last_err}"
-        )
+        name, res = self._call_resolved(candidates, op)
+        if getenv("EGERIA_DEBUG_RESULTS", "").lower() in ("1", "true", "yes"):
+            shape = type(res).__name__
+            size = (len(res) if isinstance(res, (list, tuple)) else
+                    len(res) if isinstance(res, dict) else None)
+            print(f"[debug] {name} returned shape={shape} size={size}")
+            if isinstance(res, dict):
+                print(f"[debug] dict keys: {list(res.keys())[:10]}")
+            if isinstance(res, list) and res:
+                sample = res[0]
+                print(f"[debug] first item keys: {list(sample.keys())[:10] if isinstance(sample, dict) else type(sample).__name__}")
+        return self._normalize_list(res, keys)
 
 
-    def _call_first(self, candidates):
+    def _call_first(self, candidates, op: Optional[str] = None):
+        return self._call_resolved(candidates, op)[1]
+
+    def _call_resolved(self, candidates, op: Optional[str] = None) -> Tuple[str, Any]:
+        """
+        Call the first working candidate (name, args, kwargs) and return (name, result).
+
+        The winning candidate's name and argument shape are remembered per logical
+        operation (op, defaulting to the candidate names) and pyegeria version, so later
+        calls go straight to it. The memo is dropped only when that candidate raises a
+        signature error (missing method / wrong arguments).
+        """
+        candidates = [(name, tuple(args), kwargs or {}) for name, args, kwargs in candidates]
+        cache_key = (op or "|".join(name for name, _, _ in candidates), _pyegeria_version())
+        resolved = _RESOLUTION_CACHE.get(cache_key)
         last_err = None
+
+        if resolved is not None:
+            for i, (name, args, kwargs) in enumerate(candidates):
+                if _candidate_shape(name, args, kwargs) != resolved:
+                    continue
+                try:
+                    return name, self._invoke(name, args=args, kwargs=kwargs)
+                except CircuitOpenError:
+                    raise
+                except Exception as e:
+                    if not _is_signature_error(e):
+                        raise ConnectionError(f"Operation failed ({name}): {e}") from e
+                    _RESOLUTION_CACHE.pop(cache_key, None)
+                    last_err = e
+                    candidates = candidates[:i] + candidates[i + 1:]
+                break
+
         for name, args, kwargs in candidates:
             try:
-                return self._invoke(name, args=tuple(args), kwargs=kwargs)
+                res = self._invoke(name, args=args, kwargs=kwargs)
+            except CircuitOpenError:
+                raise
             except Exception as e:
+                if is_transport_failure(e):
+                    # Server unreachable: other candidates would only stack up more timeouts
+                    raise ConnectionError(f"Operation failed ({name}): {e}") from e
                 last_err = e
                 continue
+            _RESOLUTION_CACHE[cache_key] = _candidate_shape(name, args, kwargs)
+            return name, res
         raise ConnectionError(
             f"Operation failed (tried multiple client methods). Last error: {last_err}"
         )
 
 
+    def _bulk_concurrency(self, concurrency: Optional[int]) -> int:
+        return max(1, int(concurrency or self.config.bulk_concurrency))
+
+    def _get_many(
+        self, guids: Iterable[str], fetch_one: Callable[[str], Any], concurrency: Optional[int] = None
+    ) -> BulkResult:
+        """
+        Run fetch_one for each distinct GUID on a bounded thread pool. Failures are
+        collected per GUID instead of aborting the batch.
+        """
+        unique = _unique_guids(guids)
+        out = BulkResult()
+        if not unique:
+            return out
+        workers = min(self._bulk_concurrency(concurrency), len(unique))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="egeria-bulk") as pool:
+            # Each worker runs in a copy of the caller's context, so its request priority carries over
+            futures = [(g, pool.submit(contextvars.copy_context().run, fetch_one, g)) for g in unique]
+            for guid, fut in futures:
+                try:
+                    out.results[guid] = fut.result()
+                except Exception as e:
+                    out.errors[guid] = e
+        return out
+
     def close(self) -> None:
-        self.manager.close()
+        if self._pooled:
+            release_manager(self.manager)
+        else:
+            self.manager.close()
+
+
+class AsyncBaseService(BaseService):
+    """BaseService with a native asyncio path that awaits pyegeria's `_async_` coroutines on the UI loop."""
+
+    def __init__(
+        self,
+        config: Optional[EgeriaConfig] = None,
+        manager: Optional[EgeriaTechClientManager] = None,
+    ):
+        super().__init__(config=config, manager=manager)
+        self.async_manager = AsyncEgeriaClientManager(self.manager)
+        self._async_hedge: Optional[AsyncEgeriaClientManager] = None
+
+    def _async_manager_for(self, manager: Optional[EgeriaTechClientManager]) -> AsyncEgeriaClientManager:
+        if manager is None:
+            return self.async_manager
+        hedge = self._async_hedge
+        if hedge is None or hedge.manager is not manager:  # first hedge, or the pool replaced it
+            hedge = self._async_hedge = AsyncEgeriaClientManager(manager)
+        return hedge
+
+    async def _ainvoke(
+        self,
+        method_name: str,
+        args: Tuple = (),
+        kwargs: Optional[dict] = None,
+        *,
+        manager: Optional[EgeriaTechClientManager] = None,
+    ):
+        """
+        Await `_async_<method_name>` directly; only when the client has no such coroutine
+        does the call fall back to the synchronous method in a worker thread.
+        """
+        kwargs = kwargs or {}
+        async_manager = self._async_manager_for(manager)
+        try:
+            async with self.scheduler.aslot():
+                return await async_manager.invoke(f"_async_{method_name}", args=args, kwargs=kwargs)
+        except NativeAsyncUnavailable:
+            return await asyncio.to_thread(
+                lambda: self._invoke(method_name, args=args, kwargs=kwargs, manager=manager)
+            )
+
+    async def _aread_invoke(self, method_name: str, args: Tuple, kwargs: dict):
+        """_ainvoke for a cache miss in _aread; hedged on a second client where allowed."""
+        if not self._hedged(method_name):
+            return await self._ainvoke(method_name, args=args, kwargs=kwargs)
+        hedge = get_client_pool().hedge_manager(self.config)
+        return await get_hedger(self.config.platform_url, self.config.view_server).arun(
+            method_name,
+            lambda: self._ainvoke(method_name, args=args, kwargs=kwargs),
+            lambda: self._ainvoke(method_name, args=args, kwargs=kwargs, manager=hedge),
+        )
+
+    async def _aread(
+        self,
+        method_name: str,
+        args: Tuple = (),
+        kwargs: Optional[dict] = None,
+        *,
+        refresh: bool = False,
+    ):
+        """Async counterpart of _read; shares cache entries with the synchronous path."""
+        kwargs = kwargs or {}
+        key = self._cache_key(method_name, args, kwargs)
+        if cache_enabled() and not refresh:
+            hit, value = get_response_cache().get(key)
+            if hit:
+                return value
+
+        async def fetch():
+            generation = self._generation(method_name)
+            res = await self._aread_invoke(method_name, args, kwargs)
+            self._store_read(key, method_name, args, kwargs, res, generation)
+            return res
+
+        return await get_single_flight().ado(key, fetch)
+
+
+    async def _aiter_pages(
+        self,
+        method_name: str,
+        args: Tuple = (),
+        kwargs: Optional[dict] = None,
+        *,
+        keys: Tuple[str, ...],
+        page_size: Optional[int] = None,
+        remember: bool = False,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Walk a find_* operation page by page using start_from/page_size, yielding each
+        page as a list as soon as it arrives. The next page is requested while the caller
+        is still handling the current one.
+
+        Pages are not cached individually. With remember=True the complete result is stored
+        under the unpaged key once the last page arrives, so list_*/peek_* see it too.
+        """
+        kwargs = kwargs or {}
+        size = max(1, int(page_size or self.config.page_size))
+        flight = get_single_flight()
+
+        def fetch(start: int) -> "asyncio.Future":
+            paged = {**kwargs, "start_from": start, "page_size": size}
+            key = self._cache_key(method_name, args, paged)
+            return asyncio.ensure_future(
+                flight.ado(key, lambda: self._ainvoke(method_name, args=args, kwargs=paged))
+            )
+
+        collected: List[Dict[str, Any]] = []
+        generation = self._generation(method_name)
+        start = 0
+        pending = fetch(start)
+        try:
+            while pending is not None:
+                res = await pending
+                # pyegeria answers an exhausted search with a "No elements found" string
+                page = [e for e in self._normalize_list(res, keys) if isinstance(e, dict)]
+                start += size
+                pending = fetch(start) if len(page) >= size else None
+                if remember:
+                    collected.extend(page)
+                if page:
+                    yield page
+        finally:
+            if pending is not None and not pending.done():
+                pending.cancel()
+        if remember:
+            key = self._cache_key(method_name, args, kwargs)
+            self._store_read(key, method_name, args, kwargs, collected, generation)
+
+    async def _aget_many(
+        self,
+        guids: Iterable[str],
+        fetch_one: Callable[[str], Awaitable[Any]],
+        concurrency: Optional[int] = None,
+    ) -> BulkResult:
+        """Async counterpart of _get_many, bounded by a semaphore on the event loop."""
+        unique = _unique_guids(guids)
+        sem = asyncio.Semaphore(self._bulk_concurrency(concurrency))
+
+        async def one(guid: str):
+            async with sem:
+                return await fetch_one(guid)
+
+        outcomes = await asyncio.gather(*(one(g) for g in unique), return_exceptions=True)
+        out = BulkResult()
+        for guid, outcome in zip(unique, outcomes):
+            if isinstance(outcome, asyncio.CancelledError):
+                raise outcome
+            if isinstance(outcome, Exception):
+                out.errors[guid] = outcome
+            else:
+                out.results[guid] = outcome
+        return out
@@ -8,29 +8,43 @@ This module provides services for the Collections related functions of my_egeria
 
 """
 import asyncio
-from typing import Any, Dict, List, Optional
-from .base_service import BaseService
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple
+from .base_service import AsyncBaseService, BulkResult
 from utils.config import EgeriaConfig
 
-class CollectionService(BaseService):
+class CollectionService(AsyncBaseService):
     """Wrapper around pyegeria collection functions with token-managed client."""
 
+    READ_TTLS = {"find_collections": 30.0, "get_collection": 60.0, "get_member_list": 30.0}
+    SNAPSHOT_OPERATIONS = ("find_collections", "get_collection", "get_member_list")
+    HEDGED_OPERATIONS = ("find_collections", "get_collection")
+
     def __init__(self, config: Optional[EgeriaConfig] = None, manager=None):
         super().__init__(config=config, manager=manager)
 
     # ------------------ synchronous API ------------------
 
-    def list_collections(self, search: str = "*") -> List[Dict[str, Any]]:
+    def list_collections(self, search: str = "*", refresh: bool = False) -> List[Dict[str, Any]]:
         """
-        Use pyegeria.find_collections with a DICT response.
+        Use pyegeria.find_collections with a DICT response (cached; refresh=True bypasses the cache).
         """
-        res = self._invoke("find_collections", args=(search,), kwargs={"output_format": "DICT"})
+        res = self._read("find_collections", args=(search,), kwargs={"output_format": "DICT"}, refresh=refresh)
         return self._ensure_list_like(res, keys=("collections", "elements", "results", "items"))
 
+    def peek_collections(self, search: str = "*") -> Optional[Tuple[List[Dict[str, Any]], float]]:
+        """
+        Last-known list_collections result and its age in seconds, without a network call.
+        """
+        snapshot = self._peek("find_collections", args=(search,), kwargs={"output_format": "DICT"})
+        if snapshot is None:
+            return None
+        res, age = snapshot
+        return self._ensure_list_like(res, keys=("collections", "elements", "results", "items")), age
+
     def get_collection_details(self, collection_guid: str) -> Dict[str, Any]:
         if not collection_guid:
             raise ValueError("collection_guid is required")
-        res = self._invoke("get_collection", args=(collection_guid,), kwargs={"output_format": "DICT"})
+        res = self._read("get_collection", args=(collection_guid,), kwargs={"output_format": "DICT"})
         if isinstance(res, list) and res:
             return res[0]
         if isinstance(res, dict):
@@ -39,6 +53,15 @@ class CollectionService(BaseService):
             "Failed to retrieve collection details (unexpected response shape)."
         )
 
+    def get_collection_details_many(
+        self, guids: Iterable[str], concurrency: Optional[int] = None
+    ) -> BulkResult:
+        """
+        get_collection_details for many GUIDs at once (duplicates fetched once), running up to
+        concurrency requests in parallel (default EGERIA_BULK_CONCURRENCY).
+        """
+        return self._get_many(guids, self.get_collection_details, concurrency)
+
     def get_collection_members(
         self, collection_guid: str, search: str = ""
     ) -> List[Dict[str, Any]]:
@@ -47,7 +70,7 @@ class CollectionService(BaseService):
         """
         if not collection_guid:
             raise ValueError("collection_guid is required")
-        res = self._invoke(
+        res = self._read(
             "get_member_list",
             args=(),
             kwargs={"collection_guid": collection_guid, "collection_name": None, "collection_qname": None},
@@ -82,6 +105,7 @@ class CollectionService(BaseService):
             args=(display_name, description, category, initial_classifications),
             kwargs={},
         )
+        self._invalidate("find_collections")
         if isinstance(res, list) and res:
             return res[0]
         if isinstance(res, dict):
@@ -112,9 +136,10 @@ class CollectionService(BaseService):
 
         res = self._invoke(
             "delete_collection",
-            args=(guid),
+            args=(guid,),
             kwargs={},
         )
+        self._invalidate("find_collections", "get_collection", "get_member_list")
         if isinstance(res, list) and res:
             return res[0]
         if isinstance(res, dict):
@@ -122,43 +147,38 @@ class CollectionService(BaseService):
         return {"result": res}
 
 
-    # ------------------ async API (robust, non-blocking) ------------------
+    # ------------------ async API (native, non-blocking) ------------------
 
-    async def list_collections_async(self, search: str = "*") -> List[Dict[str, Any]]:
+    async def list_collections_async(self, search: str = "*", refresh: bool = False) -> List[Dict[str, Any]]:
         """
-        Prefer native async; if it is not awaitable or stalls, fall back to sync in a worker thread.
+        Await pyegeria's _async_find_collections directly on the event loop (cached).
         """
-        try:
-            res = self._invoke("_async_find_collections", args=(search,), kwargs={"output_format": "DICT"})
-        except Exception:
-            return await asyncio.to_thread(self.list_collections, search)
-
-        try:
-            if asyncio.iscoroutine(res):
-                res = await asyncio.wait_for(res, timeout=8)
-            elif not isinstance(res, (list, dict)):
-                return await asyncio.to_thread(self.list_collections, search)
-        except Exception:
-            return await asyncio.to_thread(self.list_collections, search)
-
+        res = await self._aread(
+            "find_collections", args=(search,), kwargs={"output_format": "DICT"}, refresh=refresh
+        )
         return self._ensure_list_like(res, keys=("collections", "elements", "results", "items"))
 
+    async def iter_collections(
+        self, search: str = "*", page_size: Optional[int] = None, remember: bool = False
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Stream find_collections one page at a time (page_size defaults to EGERIA_PAGE_SIZE).
+        remember=True stores the full result where list_collections/peek_collections find it.
+        """
+        async for page in self._aiter_pages(
+            "find_collections",
+            args=(search,),
+            kwargs={"output_format": "DICT"},
+            keys=("collections", "elements", "results", "items"),
+            page_size=page_size,
+            remember=remember,
+        ):
+            yield page
+
     async def get_collection_details_async(self, collection_guid: str) -> Dict[str, Any]:
         if not collection_guid:
             raise ValueError("collection_guid is required")
-        try:
-            res = self._invoke("_async_get_collection", args=(collection_guid,), kwargs={"output_format": "DICT"})
-        except Exception:
-            return await asyncio.to_thread(self.get_collection_details, collection_guid)
-
-        try:
-            if asyncio.iscoroutine(res):
-                res = await asyncio.wait_for(res, timeout=8)
-            elif not isinstance(res, (list, dict)):
-                return await asyncio.to_thread(self.get_collection_details, collection_guid)
-        except Exception:
-            return await asyncio.to_thread(self.get_collection_details, collection_guid)
-
+        res = await self._aread("get_collection", args=(collection_guid,), kwargs={"output_format": "DICT"})
         if isinstance(res, list) and res:
             return res[0]
         if isinstance(res, dict):
@@ -167,30 +187,31 @@ class CollectionService(BaseService):
             "Failed to retrieve collection details (unexpected response shape)."
         )
 
+    async def get_collection_details_many_async(
+        self, guids: Iterable[str], concurrency: Optional[int] = None
+    ) -> BulkResult:
+        return await self._aget_many(guids, self.get_collection_details_async, concurrency)
+
     async def get_collection_members_async(
         self, collection_guid: str, search: str = ""
     ) -> List[Dict[str, Any]]:
         if not collection_guid:
             raise ValueError("collection_guid is required")
-        try:
-            res = self._invoke(
-                "_async_get_member_list",
-                args=(),
-                kwargs={"collection_guid": collection_guid, "collection_name": None, "collection_qname": None},
-            )
-        except Exception:
-            return await asyncio.to_thread(self.get_collection_members, collection_guid, search)
-
-        try:
-            if asyncio.iscoroutine(res):
-                res = await asyncio.wait_for(res, timeout=8)
-            elif not isinstance(res, (list, dict)):
-                return await asyncio.to_thread(self.get_collection_members, collection_guid, search)
-        except Exception:
-            return await asyncio.to_thread(self.get_collection_members, collection_guid, search)
-
+        res = await self._aread(
+            "get_member_list",
+            args=(),
+            kwargs={"collection_guid": collection_guid, "collection_name": None, "collection_qname": None},
+        )
         return self._ensure_list_like(res, keys=("members", "elements", "results", "items"))
 
+    async def prefetch_collection_async(self, collection_guid: str) -> None:
+        """Warm the cache with what CollectionDetailsScreen loads on mount (details and members)."""
+        await asyncio.gather(
+            self.get_collection_details_async(collection_guid),
+            self.get_collection_members_async(collection_guid),
+            return_exceptions=True,
+        )
+
     async def add_collection_async(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         if not isinstance(payload, dict) or not payload:
             raise ValueError("payload must be a non-empty dict")
@@ -210,23 +231,12 @@ class CollectionService(BaseService):
         if missing:
             raise ValueError(f"Missing required fields: {', '.join(missing)}")
 
-        try:
-            res = self._invoke(
-                "_async_create_collection",
-                args=(display_name, description, category, initial_classifications),
-                kwargs={},
-            )
-        except Exception:
-            return await asyncio.to_thread(self.add_collection, payload)
-
-        try:
-            if asyncio.iscoroutine(res):
-                res = await asyncio.wait_for(res, timeout=8)
-            elif not isinstance(res, (list, dict)):
-                return await asyncio.to_thread(self.add_collection, payload)
-        except Exception:
-            return await asyncio.to_thread(self.add_collection, payload)
-
+        res = await self._ainvoke(
+            "create_collection",
+            args=(display_name, description, category, initial_classifications),
+            kwargs={},
+        )
+        self._invalidate("find_collections")
         if isinstance(res, list) and res:
             return res[0]
         if isinstance(res, dict):
@@ -234,32 +244,22 @@ class CollectionService(BaseService):
         return {"result": res}
 
     async def delete_collection_async(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        # Callers pass either a payload dict or the collection GUID itself
+        if isinstance(payload, str):
+            payload = {"guid": payload}
         if not isinstance(payload, dict) or not payload:
             raise ValueError("payload must be a non-empty dict")
 
         guid = payload.get("guid") or payload.get("collection_guid")
-
-        missing = []
         if not guid:
-            missing.append("guid")
-
-        try:
-            res = self._invoke(
-                "_async_delete_collection",
-                args=(guid),
-                kwargs={},
-            )
-        except Exception:
-            return await asyncio.to_thread(self.delete_collection, guid)
-
-        try:
-            if asyncio.iscoroutine(res):
-                res = await asyncio.wait_for(res, timeout=8)
-            elif not isinstance(res, (list, dict)):
-                return await asyncio.to_thread(self.delete_collection, payload)
-        except Exception:
-            return await asyncio.to_thread(self.delete_collection, payload)
+            raise ValueError("Missing required fields: guid")
 
+        res = await self._ainvoke(
+            "delete_collection",
+            args=(guid,),
+            kwargs={},
+        )
+        self._invalidate("find_collections", "get_collection", "get_member_list")
         if isinstance(res, list) and res:
             return res[0]
         if isinstance(res, dict):
@@ -12,8 +12,8 @@ from __future__ import annotations
 
 from typing import Optional
 
-from ..utils.config import get_global_config
-from ..utils.egeria_client import preflight_origin
+from utils.config import get_global_config
+from utils.egeria_client import adopt_login_session, login_config, preflight_origin, resume_login_session
 
 
 class EgeriaConnectionService:
@@ -49,6 +49,9 @@ class EgeriaConnectionService:
         return self.authenticate(user, password)
 
     def authenticate(self, username: str, password: str) -> bool:
+        cfg = login_config(self.platform_url, self.view_server, username, password)
+        if resume_login_session(cfg):
+            return True  # already signed in with these credentials
         try:
             from pyegeria import EgeriaTech
 
@@ -60,8 +63,8 @@ class EgeriaConnectionService:
             )
             if hasattr(client, "create_egeria_bearer_token"):
                 client.create_egeria_bearer_token(username, password)
-            if hasattr(client, "close_session"):
-                client.close_session()
+            # Keep the session: the shared manager reuses it rather than signing in again
+            adopt_login_session(cfg, client)
             return True
         except Exception:
             return False
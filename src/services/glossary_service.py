@@ -13,14 +13,18 @@ import sys
 import importlib
 import logging
 import asyncio
-from typing import Any, Dict, List, Optional
-from .base_service import BaseService
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple
+from .base_service import AsyncBaseService, BulkResult
 from utils.config import EgeriaConfig
 
 
-class GlossaryService(BaseService):
+class GlossaryService(AsyncBaseService):
     """Wrapper around pyegeria's glossary/term functions with token-managed client."""
 
+    READ_TTLS = {"find_glossaries": 60.0, "find_glossary_terms": 30.0}
+    SNAPSHOT_OPERATIONS = ("find_glossaries", "find_glossary_terms")
+    HEDGED_OPERATIONS = ("find_glossary_terms",)
+
     def __init__(self, config: Optional[EgeriaConfig] = None, manager=None):
         super().__init__(config=config, manager=manager)
 
@@ -81,7 +85,7 @@ class GlossaryService(BaseService):
 
     # --------- sync API ---------
 
-    def list_glossaries(self, search: str = "*") -> List[Dict[str, Any]]:
+    def list_glossaries(self, search: str = "*", refresh: bool = False) -> List[Dict[str, Any]]:
         """
         find_glossaries(search_string='*', ..., output_format='DICT')
         Prefer the monkeypatched GlossaryAuthorView client if present to avoid network latency.
@@ -100,11 +104,21 @@ class GlossaryService(BaseService):
                     keys=("glossaries", "elements", "results", "items")
                 )
 
-        # Fallback to token-managed client
-        res = self._invoke("find_glossaries", args=(search,), kwargs={"output_format": "DICT"})
+        # Fallback to token-managed client (cached; refresh=True bypasses the cache)
+        res = self._read("find_glossaries", args=(search,), kwargs={"output_format": "DICT"}, refresh=refresh)
         return self._ensure_list_like(res, keys=("glossaries", "elements", "results", "items"))
 
 
+    def peek_glossaries(self, search: str = "*") -> Optional[Tuple[List[Dict[str, Any]], float]]:
+        """
+        Last-known list_glossaries result (token-managed path) and its age, without a network call.
+        """
+        snapshot = self._peek("find_glossaries", args=(search,), kwargs={"output_format": "DICT"})
+        if snapshot is None:
+            return None
+        res, age = snapshot
+        return self._ensure_list_like(res, keys=("glossaries", "elements", "results", "items")), age
+
     def add_glossary(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """
         create_glossary(display_name, description, language='English', usage=None)
@@ -130,6 +144,7 @@ class GlossaryService(BaseService):
             args=(display_name, description, language, usage),
             kwargs={},
         )
+        self._invalidate("find_glossaries")
         if isinstance(res, list) and res:
             return res[0]
         if isinstance(res, dict):
@@ -144,6 +159,7 @@ class GlossaryService(BaseService):
             raise ValueError("glossary_guid is required")
 
         res = self._invoke("delete_glossary", args=(glossary_guid,), kwargs={"cascade": cascade})
+        self._invalidate("find_glossaries", "find_glossary_terms")
         if isinstance(res, dict):
             return bool(res.get("success", True))
         return True if res is None else bool(res)
@@ -153,7 +169,7 @@ class GlossaryService(BaseService):
         List terms across all glossaries using:
           find_glossary_terms(search_string, glossary_guid=None, output_format="DICT")
         """
-        res = self._invoke(
+        res = self._read(
             "find_glossary_terms",
             args=((search or "*"),),
             kwargs={"glossary_guid": glossary_guid, "output_format": "DICT"},
@@ -162,6 +178,32 @@ class GlossaryService(BaseService):
             res, keys=("terms", "elements", "results", "items")
         )
 
+    def get_term_by_guid(self, term_guid: str) -> Dict[str, Any]:
+        """
+        Term details by GUID: get_term_by_guid on current pyegeria, get_terms_by_guid on older releases.
+        """
+        if not term_guid:
+            raise ValueError("term_guid is required")
+        res = self._call_first(
+            [
+                ("get_term_by_guid", (term_guid,), {"output_format": "DICT"}),
+                ("get_terms_by_guid", (term_guid,), {"output_format": "DICT"}),
+            ],
+            op="get_term_by_guid",
+        )
+        if isinstance(res, list) and res:
+            return res[0]
+        if isinstance(res, dict):
+            return res
+        raise ConnectionError(f"Term {term_guid} not found (unexpected response: {res!r})")
+
+    def get_terms_by_guid_many(self, guids: Iterable[str], concurrency: Optional[int] = None) -> BulkResult:
+        """
+        get_term_by_guid for many GUIDs at once (duplicates fetched once), running up to
+        concurrency requests in parallel (default EGERIA_BULK_CONCURRENCY).
+        """
+        return self._get_many(guids, self.get_term_by_guid, concurrency)
+
     def add_term(self, glossary_guid: str, payload: Dict[str, Any]) -> Dict[str, Any]:
 
         """
@@ -226,6 +268,7 @@ class GlossaryService(BaseService):
                 ep["additionalProperties"] = additional_props
 
         res = self._invoke("create_controlled_glossary_term", args=(glossary_guid, body), kwargs={})
+        self._invalidate("find_glossary_terms")
         if isinstance(res, list) and res:
             return res[0]
         if isinstance(res, dict):
@@ -240,16 +283,17 @@ class GlossaryService(BaseService):
             args=(term_guid,),
             kwargs={"for_lineage": for_lineage, "for_duplicate_processing": for_duplicate_processing},
         )
+        self._invalidate("find_glossary_terms")
         if isinstance(res, dict):
             return bool(res.get("success", True))
         return True if res is None else bool(res)
 
     # --------- async wrappers for UI ---------
 
-    async def list_glossaries_async(self, search: str = "*"):
+    async def list_glossaries_async(self, search: str = "*", refresh: bool = False):
         """
-        Prefer native async on the monkeypatched client if present; otherwise fall back to sync in a thread
-        or the token-managed async/sync path (non-blocking).
+        Prefer native async on the monkeypatched client if present; otherwise await the
+        token-managed client's _async_find_glossaries directly (no worker-thread hop).
         """
         client = self._ensure_gclient()
         if client and hasattr(client, "_async_find_glossaries"):
@@ -265,19 +309,43 @@ class GlossaryService(BaseService):
                 except Exception:
                     pass  # fall through to manager fallback
 
-        # Manager-based async path with non-blocking fallback
-        try:
-            res = self._invoke("_async_find_glossaries", args=(search,), kwargs={"output_format": "DICT"})
-            if asyncio.iscoroutine(res):
-                res = await asyncio.wait_for(res, timeout=8)
-            elif not isinstance(res, (list, dict)):
-                return await asyncio.to_thread(self.list_glossaries, search)
-        except Exception:
-            return await asyncio.to_thread(self.list_glossaries, search)
-
+        # Token-managed client: await the native coroutine on the event loop
+        res = await self._aread(
+            "find_glossaries", args=(search,), kwargs={"output_format": "DICT"}, refresh=refresh
+        )
         return self._ensure_list_like(res, keys=("glossaries", "elements", "results", "items"))
 
 
+    async def iter_glossaries(
+        self, search: str = "*", page_size: Optional[int] = None, remember: bool = False
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Stream find_glossaries one page at a time (page_size defaults to EGERIA_PAGE_SIZE).
+        remember=True stores the full result where list_glossaries/peek_glossaries find it.
+        """
+        async for page in self._aiter_pages(
+            "find_glossaries",
+            args=(search,),
+            kwargs={"output_format": "DICT"},
+            keys=("glossaries", "elements", "results", "items"),
+            page_size=page_size,
+            remember=remember,
+        ):
+            yield page
+
+    async def iter_terms(
+        self, search: str = "", glossary_guid: str = None, page_size: Optional[int] = None
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Stream find_glossary_terms one page at a time; the paged counterpart of get_terms."""
+        async for page in self._aiter_pages(
+            "find_glossary_terms",
+            args=((search or "*"),),
+            kwargs={"glossary_guid": glossary_guid, "output_format": "DICT"},
+            keys=("terms", "elements", "results", "items"),
+            page_size=page_size,
+        ):
+            yield page
+
     async def add_glossary_async(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         if not isinstance(payload, dict) or not payload:
             raise ValueError("payload must be a non-empty dict")
@@ -295,22 +363,12 @@ class GlossaryService(BaseService):
         if missing:
             raise ValueError(f"Missing required fields: {', '.join(missing)}")
 
-        try:
-            res = self._invoke(
-                "_async_create_glossary",
-                args=(display_name, description, language, usage),
-                kwargs={},
-            )
-        except Exception:
-            return await asyncio.to_thread(self.add_glossary, payload)
-
-        try:
-            if asyncio.iscoroutine(res):
-                res = await asyncio.wait_for(res, timeout=8)
-            elif not isinstance(res, (list, dict)):
-                return await asyncio.to_thread(self.add_glossary, payload)
-        except Exception:
-            return await asyncio.to_thread(self.add_glossary, payload)
+        res = await self._ainvoke(
+            "create_glossary",
+            args=(display_name, description, language, usage),
+            kwargs={},
+        )
+        self._invalidate("find_glossaries")
 
         if isinstance(res, list) and res:
             return res[0]
@@ -322,18 +380,8 @@ class GlossaryService(BaseService):
         if not glossary_guid:
             raise ValueError("glossary_guid is required")
 
-        try:
-            res = self._invoke("_async_delete_glossary", args=(glossary_guid,), kwargs={"cascade": cascade})
-        except Exception:
-            return await asyncio.to_thread(self.delete_glossary, glossary_guid, cascade)
-
-        try:
-            if asyncio.iscoroutine(res):
-                res = await asyncio.wait_for(res, timeout=8)
-            elif not isinstance(res, (dict, type(None), bool)):
-                return await asyncio.to_thread(self.delete_glossary, glossary_guid, cascade)
-        except Exception:
-            return await asyncio.to_thread(self.delete_glossary, glossary_guid, cascade)
+        res = await self._ainvoke("delete_glossary", args=(glossary_guid,), kwargs={"cascade": cascade})
+        self._invalidate("find_glossaries", "find_glossary_terms")
 
         if isinstance(res, dict):
             return bool(res.get("success", True))
@@ -343,27 +391,23 @@ class GlossaryService(BaseService):
         if not glossary_guid:
             raise ValueError("glossary_guid is required")
 
-        try:
-            res = self._invoke(
-                "_async_find_glossary_terms",
-                args=(search or "*",),
-                kwargs={"glossary_guid": glossary_guid, "output_format": "DICT"},
-            )
-        except Exception:
-            return await asyncio.to_thread(self.get_terms, glossary_guid, search)
-
-        try:
-            if asyncio.iscoroutine(res):
-                res = await asyncio.wait_for(res, timeout=8)
-            elif not isinstance(res, (list, dict)):
-                return await asyncio.to_thread(self.get_terms, glossary_guid, search)
-        except Exception:
-            return await asyncio.to_thread(self.get_terms, glossary_guid, search)
+        res = await self._aread(
+            "find_glossary_terms",
+            args=(search or "*",),
+            kwargs={"glossary_guid": glossary_guid, "output_format": "DICT"},
+        )
 
         return self._ensure_list_like(
             res, keys=("terms", "elements", "results", "items")
         )
 
+    async def get_terms_by_guid_many_async(
+        self, guids: Iterable[str], concurrency: Optional[int] = None
+    ) -> BulkResult:
+        return await self._aget_many(
+            guids, lambda guid: asyncio.to_thread(self.get_term_by_guid, guid), concurrency
+        )
+
     async def add_term_async(self, glossary_guid: str, payload: Dict[str, Any]):
         if not glossary_guid:
             raise ValueError("glossary_guid is required")
@@ -416,17 +460,10 @@ class GlossaryService(BaseService):
             if additional_props:
                 ep["additionalProperties"] = additional_props
 
-        try:
-            res = self._invoke(
-                "_async_create_controlled_glossary_term", args=(glossary_guid, body), kwargs={}
-            )
-        except Exception:
-            return await asyncio.to_thread(self.add_term, glossary_guid, payload)
-
-        if asyncio.iscoroutine(res):
-            res = await res
-        elif not isinstance(res, (list, dict)):
-            return await asyncio.to_thread(self.add_term, glossary_guid, payload)
+        res = await self._ainvoke(
+            "create_controlled_glossary_term", args=(glossary_guid, body), kwargs={}
+        )
+        self._invalidate("find_glossary_terms")
 
         if isinstance(res, list) and res:
             return res[0]
@@ -438,19 +475,12 @@ class GlossaryService(BaseService):
         if not term_guid:
             raise ValueError("term_guid is required")
 
-        try:
-            res = self._invoke(
-                "_async_delete_term",
-                args=(term_guid,),
-                kwargs={"for_lineage": for_lineage, "for_duplicate_processing": for_duplicate_processing},
-            )
-        except Exception:
-            return await asyncio.to_thread(self.delete_term, term_guid, for_lineage=for_lineage, for_duplicate_processing=for_duplicate_processing)
-
-        if asyncio.iscoroutine(res):
-            res = await res
-        elif not isinstance(res, (dict, type(None), bool)):
-            return await asyncio.to_thread(self.delete_term, term_guid, for_lineage=for_lineage, for_duplicate_processing=for_duplicate_processing)
+        res = await self._ainvoke(
+            "delete_term",
+            args=(term_guid,),
+            kwargs={"for_lineage": for_lineage, "for_duplicate_processing": for_duplicate_processing},
+        )
+        self._invalidate("find_glossary_terms")
 
         if isinstance(res, dict):
             return bool(res.get("success", True))
@@ -0,0 +1,176 @@
+# python
+
+"""PDX-License-Identifier: Apache-2.0
+Copyright Contributors to the ODPi Egeria project.
+
+This module provides the cross-entity (omnibox) search service of my_egeria module.
+
+
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
+from .base_service import AsyncBaseService
+from utils.config import EgeriaConfig
+from utils.response_cache import cache_enabled, get_response_cache
+from utils.search_index import tokenize
+
+
+@dataclass(frozen=True)
+class SearchSource:
+    kind: str  # label shown in the result list
+    method: str  # pyegeria find_* operation
+    keys: Tuple[str, ...] = ("elements", "results", "items")
+    weight: float = 1.0  # tie-breaker between equally good matches from different sources
+    local: bool = False  # answered in-process (method names a module function), filtered here
+
+
+SOURCES: Tuple[SearchSource, ...] = (
+    SearchSource("Glossary", "find_glossaries", ("glossaries", "elements", "results", "items"), 1.2),
+    SearchSource("Term", "find_glossary_terms", ("terms", "elements", "results", "items"), 1.1),
+    SearchSource("Collection", "find_collections", ("collections", "elements", "results", "items"), 1.0),
+    SearchSource("Technology Type", "find_technology_types", ("elements", "results", "items"), 0.9),
+    SearchSource("Governance Definition", "find_governance_definitions", ("elements", "results", "items"), 0.9),
+    SearchSource("Report Spec", "report_spec_list", ("elements", "items"), 0.8, local=True),
+)
+
+
+def _report_specs() -> List[Dict[str, Any]]:
+    """pyegeria's report specs (the my_reports tree); they live in pyegeria, not on the server."""
+    try:
+        from pyegeria.view.base_report_formats import report_spec_list
+    except ImportError:
+        from pyegeria.base_report_formats import report_spec_list
+    return report_spec_list(show_family=True, sort_by_family=True, return_kind="dicts")
+
+
+_LOCAL_SOURCES = {"report_spec_list": _report_specs}
+
+
+@dataclass(order=True)
+class SearchHit:
+    sort_key: Tuple[float, str] = field(init=False, repr=False)
+    score: float = field(compare=False)
+    kind: str = field(compare=False)
+    guid: str = field(compare=False)
+    display_name: str = field(compare=False)
+    qualified_name: str = field(compare=False, default="")
+    description: str = field(compare=False, default="")
+
+    def __post_init__(self):
+        self.sort_key = (-self.score, self.display_name.lower())
+
+
+@dataclass
+class SearchBatch:
+    """One source's answer: its hits, or the error it failed with."""
+
+    source: SearchSource
+    hits: List[SearchHit]
+    error: Optional[Exception] = None
+
+
+def _first(element: Dict[str, Any], *names: str) -> str:
+    props = element.get("properties") if isinstance(element.get("properties"), dict) else {}
+    for name in names:
+        value = element.get(name) or props.get(name)
+        if value:
+            return str(value)
+    return ""
+
+
+def score_match(query: str, display_name: str, qualified_name: str, description: str) -> float:
+    """
+    Rank a hit for the query: exact and prefix matches on the display name first, then
+    token-prefix matches, then qualified name, then description. 0 means no local match
+    (the server matched on a field we do not show); such hits still rank, just last.
+    """
+    q = query.strip().lower()
+    if not q or q == "*":
+        return 1.0
+    name = display_name.lower()
+    if name == q:
+        return 100.0
+    if name.startswith(q):
+        return 80.0
+    fragments = tokenize(q)
+    name_tokens = tokenize(name)
+    if fragments and all(any(t.startswith(f) for t in name_tokens) for f in fragments):
+        return 60.0
+    if q in name:
+        return 40.0
+    if q in qualified_name.lower():
+        return 20.0
+    if q in description.lower():
+        return 10.0
+    return 0.0
+
+
+class UnifiedSearchService(AsyncBaseService):
+    """Fan one query out to every find_* source and stream the answers back as they land."""
+
+    READ_TTLS = {source.method: 30.0 for source in SOURCES}
+
+    def __init__(self, config: Optional[EgeriaConfig] = None, manager=None):
+        super().__init__(config=config, manager=manager)
+
+    def to_hits(self, source: SearchSource, query: str, res: Any) -> List[SearchHit]:
+        hits = []
+        for element in self._normalize_list(res, source.keys):
+            if not isinstance(element, dict):
+                continue  # e.g. pyegeria's "No elements found"
+            guid = _first(element, "GUID", "guid", "elementGUID")
+            display = _first(element, "display_name", "displayName", "name", "title", "Display Name")
+            qname = _first(element, "qualified_name", "qualifiedName", "Qualified Name", "family")
+            desc = _first(element, "description", "summary", "Description")
+            score = score_match(query, display, qname, desc) * source.weight
+            hits.append(SearchHit(score, source.kind, guid, display or qname or guid, qname, desc))
+        return hits
+
+    async def _search_local(self, source: SearchSource, query: str) -> SearchBatch:
+        try:
+            res = await asyncio.to_thread(_LOCAL_SOURCES[source.method])
+        except Exception as e:
+            return SearchBatch(source, [], e)
+        hits = self.to_hits(source, query, res)
+        if query != "*":
+            hits = [h for h in hits if h.score > 0]
+        return SearchBatch(source, hits)
+
+    async def _search_source(self, source: SearchSource, query: str) -> SearchBatch:
+        if source.local:
+            return await self._search_local(source, query)
+        args, kwargs = (query,), {"output_format": "DICT"}
+        key = self._cache_key(source.method, args, kwargs)
+        if cache_enabled():
+            hit, value = get_response_cache().get(key)
+            if hit:
+                return SearchBatch(source, self.to_hits(source, query, value))
+        generation = self._generation(source.method)
+        try:
+            # Awaited directly (not through the shared in-flight table) so that refining
+            # the query really cancels a slow source's request
+            res = await self._ainvoke(source.method, args=args, kwargs=kwargs)
+        except Exception as e:
+            return SearchBatch(source, [], e)
+        self._store_read(key, source.method, args, kwargs, res, generation)
+        return SearchBatch(source, self.to_hits(source, query, res))
+
+    async def search(
+        self, query: str, sources: Optional[Sequence[SearchSource]] = None
+    ) -> AsyncIterator[SearchBatch]:
+        """
+        Query all sources concurrently and yield each SearchBatch as soon as its source
+        answers. Closing the generator (or cancelling its consumer) cancels the sources
+        still running.
+        """
+        query = query.strip() or "*"
+        tasks = [asyncio.ensure_future(self._search_source(s, query)) for s in (sources or SOURCES)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
@@ -0,0 +1,195 @@
+# python
+
+"""PDX-License-Identifier: Apache-2.0
+Copyright Contributors to the ODPi Egeria project.
+
+This module provides the start-up warm-up pipeline of my_egeria module.
+
+
+"""
+
+import asyncio
+import os
+from typing import Callable, Dict, Optional
+
+from utils.config import EgeriaConfig, get_global_config
+from utils.egeria_client import (
+    EgeriaTechClientManager,
+    acquire_manager,
+    preflight_origin,
+    release_manager,
+)
+from utils.scheduler import BACKGROUND, request_priority
+
+
+def warmup_enabled() -> bool:
+    val = os.getenv("EGERIA_WARMUP_DISABLED", "")
+    return val.strip().lower() not in ("1", "true", "yes", "y", "on")
+
+
+class WarmUp:
+    """
+    Gets the first browser screen's data ready while the splash and login screens are up:
+    probe the platform, authenticate the pooled manager for config, then fetch the
+    glossary and collection lists into the response cache that the browsers read.
+
+    Each stage runs off the UI thread; a failed probe or login ends the pipeline quietly
+    (the login screen reports real failures). cancel() stops it between stages: a call
+    already on the wire finishes in its thread, but nothing further is started.
+    """
+
+    STAGES = ("probe", "authenticate", "prefetch")
+
+    def __init__(
+        self,
+        config: Optional[EgeriaConfig] = None,
+        *,
+        manager: Optional[EgeriaTechClientManager] = None,
+        probe: Callable[[str, str], None] = preflight_origin,
+        on_progress: Optional[Callable[[str], None]] = None,
+    ):
+        self.config = config or get_global_config()
+        self._manager = manager
+        self._probe = probe
+        self._on_progress = on_progress
+        self._task: Optional[asyncio.Task] = None
+        self.stage = "pending"  # a STAGES entry, then done, failed or cancelled
+        self.error: Optional[BaseException] = None
+        self.prefetched: Dict[str, int] = {}  # list name -> rows now cached
+
+    def matches(self, config: EgeriaConfig) -> bool:
+        """True if config is the connection being warmed (same identity and password)."""
+        mine = self.config
+        return (
+            config.platform_url.rstrip("/") == mine.platform_url.rstrip("/")
+            and config.view_server == mine.view_server
+            and config.user == mine.user
+            and config.password == mine.password
+        )
+
+    def restarted(self) -> "WarmUp":
+        """A fresh, not yet started warm-up of the same connection (progress is not reported)."""
+        return WarmUp(self.config, manager=self._manager, probe=self._probe)
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> asyncio.Task:
+        """Schedule the pipeline on the running loop; call it from UI handlers."""
+        if self._task is None:
+            self._task = asyncio.ensure_future(self.run())
+        return self._task
+
+    def cancel(self) -> None:
+        if self.running:
+            self._task.cancel()
+
+    async def run(self) -> None:
+        # Nobody is waiting on the warm-up yet: anything interactive goes first
+        with request_priority(BACKGROUND):
+            await self._run()
+
+    async def _run(self) -> None:
+        manager = self._manager
+        pooled = manager is None
+        try:
+            self._enter("probe")
+            await asyncio.to_thread(self._probe, self.config.platform_url, self.config.user)
+
+            self._enter("authenticate")
+            if pooled:
+                manager = acquire_manager(self.config)
+            await asyncio.to_thread(manager.get_client)
+
+            self._enter("prefetch")
+            await self._prefetch(manager)
+            self._enter("done")
+        except asyncio.CancelledError:
+            self._enter("cancelled")
+            raise
+        except Exception as e:
+            self.error = e
+            self._enter("failed")
+        finally:
+            if pooled and manager is not None:
+                release_manager(manager)
+
+    async def _prefetch(self, manager: EgeriaTechClientManager) -> None:
+        # Imported here so that starting the splash screen does not load the services
+        from services.collection_service import CollectionService
+        from services.glossary_service import GlossaryService
+
+        # The same requests the browsers make on open ("*"), so they hit the cache
+        lists = {
+            "glossaries": GlossaryService(self.config, manager=manager).list_glossaries,
+            "collections": CollectionService(self.config, manager=manager).list_collections,
+        }
+        results = await asyncio.gather(
+            *(asyncio.to_thread(fetch, "*") for fetch in lists.values()), return_exceptions=True
+        )
+        for name, res in zip(lists, results):
+            if isinstance(res, Exception):
+                self.error = self.error or res  # best effort; the browser retries on open
+            else:
+                self.prefetched[name] = len(res)
+
+    def _enter(self, stage: str) -> None:
+        self.stage = stage
+        if self._on_progress is not None:
+            try:
+                self._on_progress(stage)
+            except Exception:
+                pass
+
+
+_WARMUP: Optional[WarmUp] = None
+_SET_ASIDE: Optional[WarmUp] = None  # warm-up cancelled because the login form moved away
+
+
+def start_warmup(config: Optional[EgeriaConfig] = None, **kwargs) -> Optional[WarmUp]:
+    """Start the process-wide warm-up for config (env defaults if omitted), once per connection."""
+    global _WARMUP
+    if not warmup_enabled():
+        return None
+    cfg = config or get_global_config()
+    if _WARMUP is not None and _WARMUP.matches(cfg):
+        return _WARMUP
+    cancel_warmup()
+    _WARMUP = WarmUp(cfg, **kwargs)
+    _WARMUP.start()
+    return _WARMUP
+
+
+def get_warmup() -> Optional[WarmUp]:
+    return _WARMUP
+
+
+def keep_warmup_for(config: EgeriaConfig) -> bool:
+    """
+    Cancel the warm-up unless it is for config; True if it is (still) warming config.
+    A warm-up cancelled this way starts again if the form comes back to its connection.
+    """
+    global _WARMUP, _SET_ASIDE
+    if _WARMUP is None:
+        if _SET_ASIDE is None or not _SET_ASIDE.matches(config):
+            return False
+        job, _SET_ASIDE = _SET_ASIDE, None
+        # A finished warm-up is still good; one cut short starts over
+        _WARMUP = job if job.stage == "done" else job.restarted()
+        _WARMUP.start()
+        return True
+    if _WARMUP.matches(config):
+        return True
+    warmed = _WARMUP
+    cancel_warmup()
+    _SET_ASIDE = warmed
+    return False
+
+
+def cancel_warmup() -> None:
+    global _WARMUP, _SET_ASIDE
+    _SET_ASIDE = None
+    if _WARMUP is not None:
+        _WARMUP.cancel()
+        _WARMUP = None
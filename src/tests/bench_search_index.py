@@ -0,0 +1,88 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file benchmarks search-as-you-type filtering over the client-side search index.
+
+   Each keystroke is timed over the whole path a browser runs on Input.Changed: the
+   index lookup (IndexedRows.visible) and the KeyedTableUpdater diff applied to a real
+   DataTable in a headless app, plus the repaint that follows.
+
+   Run from src/:  python -m tests.bench_search_index [rows]
+
+
+"""
+
+import asyncio
+import random
+import string
+import sys
+import time
+
+from textual.app import App
+from textual.widgets import DataTable
+
+from utils.search_index import IndexedRows
+from widgets.table_updater import KeyedTableUpdater
+
+
+def _word(rng: random.Random) -> str:
+    return "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 10)))
+
+
+class _BenchApp(App):
+    def compose(self):
+        yield DataTable()
+
+
+async def main(n: int) -> None:
+    rng = random.Random(1)
+    words = [_word(rng) for _ in range(20000)]
+    rows = [
+        (
+            f"guid-{i}",
+            " ".join(rng.sample(words, 2)),
+            f"Collection::{rng.choice(words)}-{i}",
+            " ".join(rng.sample(words, 6)),
+        )
+        for i in range(n)
+    ]
+    t0 = time.perf_counter()
+    indexed = IndexedRows(text_columns=(1, 2, 3))
+    indexed.set_rows(rows)
+    print(f"index {n} rows: {time.perf_counter() - t0:.2f}s")
+
+    app = _BenchApp()
+    async with app.run_test() as pilot:
+        table = app.query_one(DataTable)
+        table.add_columns("GUID", "Display Name", "Qualified Name", "Description")
+        updater = KeyedTableUpdater(table, key_index=(0, 2))
+        t0 = time.perf_counter()
+        updater.update(indexed.visible(""))
+        await pilot.pause()
+        print(f"show {n} rows: {time.perf_counter() - t0:.2f}s")
+
+        # Simulate typing two words one keystroke at a time, then clearing the box
+        target = f"{words[7]} {words[11][:4]}"
+        queries = [target[:end] for end in range(1, len(target) + 1)] + [""]
+        worst = {"filter": 0.0, "keystroke": 0.0}
+        for query in queries:
+            t0 = time.perf_counter()
+            visible = indexed.visible(query)
+            filtered = time.perf_counter()
+            updater.update(visible)
+            await pilot.pause()  # let the table repaint
+            done = time.perf_counter()
+            times = {"filter": (filtered - t0) * 1000, "keystroke": (done - t0) * 1000}
+            for k, v in times.items():
+                worst[k] = max(worst[k], v)
+            print(
+                f"{query!r:>24}  {len(visible):>7} rows  "
+                f"filter {times['filter']:7.2f} ms  keystroke {times['keystroke']:8.2f} ms"
+            )
+    print(f"worst filter: {worst['filter']:.2f} ms, worst keystroke: {worst['keystroke']:.2f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000))
@@ -24,6 +24,8 @@ def pytest_configure():
     os.environ.setdefault("EGERIA_USER_PASSWORD", "secret")
     os.environ.setdefault("EGERIA_PLATFORM_URL", "https://localhost:9443")
     os.environ.setdefault("EGERIA_VIEW_SERVER", "qs-view-server")
+    # Keep unit tests off the user's on-disk metadata snapshot
+    os.environ.setdefault("EGERIA_SNAPSHOT_DISABLED", "true")
 
 
 # @pytest.fixture(scope="session", autouse=True)
@@ -0,0 +1,80 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file is a unit test for my_egeria.
+
+
+"""
+
+import asyncio
+import threading
+
+from services.collection_service import CollectionService
+from utils.config import EgeriaConfig
+from utils.egeria_client import EgeriaTechClientManager
+
+CFG = EgeriaConfig(
+    platform_url="https://localhost:9443",
+    view_server="async-test-server",
+    user="erinoverview",
+    password="secret",
+)
+
+
+class FakeAsyncClient:
+    """Mimics EgeriaTech: sync methods plus native `_async_` coroutines."""
+
+    def __init__(self):
+        self.sync_calls = 0
+        self.async_threads = set()
+
+    def create_egeria_bearer_token(self, user, password):
+        pass
+
+    def find_collections(self, search, output_format="JSON"):
+        self.sync_calls += 1
+        return [{"guid": "sync"}]
+
+    async def _async_find_collections(self, search, output_format="JSON"):
+        self.async_threads.add(threading.get_ident())
+        return {"elements": [{"guid": "native", "search": search}]}
+
+    def get_member_list(self, collection_guid=None, collection_name=None, collection_qname=None):
+        self.sync_calls += 1
+        return [{"guid": "m1"}]
+
+    def close_session(self):
+        pass
+
+
+def _service(client) -> CollectionService:
+    manager = EgeriaTechClientManager(CFG, client_factory=lambda cfg: client)
+    return CollectionService(CFG, manager=manager)
+
+
+def test_native_async_path_stays_on_the_event_loop():
+    client = FakeAsyncClient()
+    service = _service(client)
+
+    async def _run():
+        await service.list_collections_async("*")  # cold path builds the client
+        client.async_threads.clear()
+        res = await service.list_collections_async("data")
+        return res, threading.get_ident()
+
+    res, loop_thread = asyncio.run(_run())
+    assert res == [{"guid": "native", "search": "data"}]
+    assert client.async_threads == {loop_thread}
+    assert client.sync_calls == 0
+    service.close()
+
+
+def test_missing_coroutine_falls_back_to_sync_method():
+    client = FakeAsyncClient()
+    service = _service(client)
+    members = asyncio.run(service.get_collection_members_async("c1"))
+    assert members == [{"guid": "m1"}]
+    assert client.sync_calls == 1
+    service.close()
@@ -0,0 +1,117 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file is a unit test for my_egeria.
+
+
+"""
+
+import pytest
+from services import base_service
+from services.base_service import BaseService
+from utils.config import EgeriaConfig
+
+CFG = EgeriaConfig(
+    platform_url="https://localhost:9443",
+    view_server="qs-view-server",
+    user="erinoverview",
+    password="secret",
+)
+
+
+class FakeManager:
+    """Stands in for EgeriaTechClientManager: calls straight through to a fake client."""
+
+    def __init__(self, client):
+        self.client = client
+        self.calls = []
+
+    def invoke_with_auto_refresh(self, fn, args=(), kwargs=None):
+        return fn(self.client, *args, **(kwargs or {}))
+
+    def close(self):
+        pass
+
+
+class RecordingService(BaseService):
+    def _invoke(self, method_name, args=(), kwargs=None):
+        self.manager.calls.append(method_name)
+        return super()._invoke(method_name, args=args, kwargs=kwargs)
+
+
+@pytest.fixture(autouse=True)
+def _clear_resolution_cache():
+    base_service._RESOLUTION_CACHE.clear()
+    yield
+    base_service._RESOLUTION_CACHE.clear()
+
+
+CANDIDATES = [
+    ("find_collections_old", ("*",), {}),
+    ("find_collections", ("*",), {"output_format": "DICT"}),
+    ("find_collections", ("*",), {}),
+]
+
+
+def test_resolution_is_memoized_per_operation():
+    class Client:
+        def find_collections(self, search, output_format="JSON"):
+            return {"elements": [{"guid": "c1"}]}
+
+    manager = FakeManager(Client())
+    service = RecordingService(CFG, manager=manager)
+
+    assert service._call_list_like(CANDIDATES, keys=("elements",), op="collections") == [{"guid": "c1"}]
+    assert manager.calls == ["find_collections_old", "find_collections"]
+
+    manager.calls.clear()
+    service._call_list_like(CANDIDATES, keys=("elements",), op="collections")
+    # Second call goes straight to the remembered candidate
+    assert manager.calls == ["find_collections"]
+
+
+def test_resolution_is_invalidated_on_signature_error():
+    class OldClient:
+        def find_collections(self, search, output_format="JSON"):
+            return [{"guid": "old"}]
+
+    class NewClient:
+        def find_collections(self, search):
+            return [{"guid": "new"}]
+
+    manager = FakeManager(OldClient())
+    service = RecordingService(CFG, manager=manager)
+    service._call_first(CANDIDATES, op="collections")
+
+    manager.client = NewClient()
+    manager.calls.clear()
+    assert service._call_first(CANDIDATES, op="collections") == [{"guid": "new"}]
+    assert manager.calls == ["find_collections", "find_collections_old", "find_collections"]
+
+    manager.calls.clear()
+    service._call_first(CANDIDATES, op="collections")
+    assert manager.calls == ["find_collections"]
+
+
+def test_resolved_candidate_failure_does_not_fall_back():
+    class Client:
+        fail = False
+
+        def find_collections(self, search, output_format="JSON"):
+            if self.fail:
+                raise ValueError("server rejected the request")
+            return [{"guid": "c1"}]
+
+    client = Client()
+    manager = FakeManager(client)
+    service = RecordingService(CFG, manager=manager)
+    service._call_first(CANDIDATES, op="collections")
+
+    client.fail = True
+    manager.calls.clear()
+    with pytest.raises(ConnectionError):
+        service._call_first(CANDIDATES, op="collections")
+    assert manager.calls == ["find_collections"]
+    assert base_service._RESOLUTION_CACHE
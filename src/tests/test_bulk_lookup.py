@@ -0,0 +1,116 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file is a unit test for my_egeria.
+
+
+"""
+
+import asyncio
+import threading
+import time
+
+from services.collection_service import CollectionService
+from services.glossary_service import GlossaryService
+from utils.config import EgeriaConfig
+from utils.egeria_client import EgeriaTechClientManager
+from utils.response_cache import get_response_cache
+
+CFG = EgeriaConfig(
+    platform_url="https://localhost:9443",
+    view_server="bulk-test-server",
+    user="erinoverview",
+    password="secret",
+    bulk_concurrency=3,
+)
+
+
+class BulkClient:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+        self.calls = []
+
+    def create_egeria_bearer_token(self, user, password):
+        pass
+
+    def _enter(self, guid):
+        with self.lock:
+            self.calls.append(guid)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+
+    def _leave(self):
+        with self.lock:
+            self.active -= 1
+
+    def get_collection(self, guid, output_format="JSON"):
+        self._enter(guid)
+        try:
+            time.sleep(0.02)
+            if guid == "missing":
+                raise ValueError("no such collection")
+            return {"GUID": guid}
+        finally:
+            self._leave()
+
+    async def _async_get_collection(self, guid, output_format="JSON"):
+        self._enter(guid)
+        try:
+            await asyncio.sleep(0.02)
+            if guid == "missing":
+                raise ValueError("no such collection")
+            return {"GUID": guid}
+        finally:
+            self._leave()
+
+    def get_terms_by_guid(self, guid, output_format="JSON"):
+        self._enter(guid)
+        self._leave()
+        return {"GUID": guid, "displayName": f"Term {guid}"}
+
+
+def _services():
+    get_response_cache().clear()
+    client = BulkClient()
+    manager = EgeriaTechClientManager(CFG, client_factory=lambda cfg: client)
+    return CollectionService(CFG, manager=manager), GlossaryService(CFG, manager=manager), client
+
+
+def test_sync_bulk_dedupes_bounds_concurrency_and_reports_errors():
+    collections, _, client = _services()
+    guids = ["a", "b", "c", "a", "d", "missing", "e", "b"]
+
+    out = collections.get_collection_details_many(guids)
+
+    assert list(out.results) == ["a", "b", "c", "d", "e"]
+    assert list(out.errors) == ["missing"]
+    assert not out.ok
+    # Each distinct GUID is requested once; a not-found is not retried after a token refresh
+    assert all(client.calls.count(g) == 1 for g in "abcde")
+    assert client.calls.count("missing") == 1
+    assert 1 < client.peak <= 3
+
+
+def test_async_bulk_bounded_by_semaphore():
+    collections, _, client = _services()
+    guids = [f"g{i}" for i in range(9)] + ["missing"]
+
+    out = asyncio.run(collections.get_collection_details_many_async(guids, concurrency=2))
+
+    assert len(out.results) == 9
+    assert isinstance(out.errors["missing"], Exception)
+    assert client.peak == 2
+
+
+def test_terms_by_guid_many_falls_back_to_older_method_name():
+    _, glossary, client = _services()
+
+    out = glossary.get_terms_by_guid_many(["t1", "t2", "t1"])
+
+    assert out.ok
+    assert out.results["t2"]["displayName"] == "Term t2"
+    assert sorted(client.calls) == ["t1", "t2"]
@@ -0,0 +1,177 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file is a unit test for my_egeria.
+
+
+"""
+
+import asyncio
+import time
+
+import pytest
+from utils.async_egeria_client import AsyncEgeriaClientManager, NativeAsyncUnavailable
+from utils.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError
+from utils.config import EgeriaConfig
+from utils.egeria_client import EgeriaTechClientManager
+
+
+def test_breaker_opens_after_threshold_and_half_opens_after_timeout():
+    breaker = CircuitBreaker("test", failure_threshold=2, reset_timeout=0.05)
+    breaker.record_failure(ConnectionError("down"))
+    assert breaker.state == CLOSED
+    breaker.record_failure(ConnectionError("down"))
+    assert breaker.state == OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.check()
+
+    time.sleep(0.06)
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow() is True
+    # Only one trial call is let through while half-open
+    assert breaker.allow() is False
+    breaker.record_success()
+    assert breaker.state == CLOSED
+
+
+def test_abandoned_trial_is_given_up_after_the_reset_timeout():
+    breaker = CircuitBreaker("trial", failure_threshold=1, reset_timeout=0.05)
+    breaker.record_failure(TimeoutError("slow"))
+    time.sleep(0.06)
+    lost = breaker.check()  # this caller goes away without reporting back
+    with pytest.raises(CircuitOpenError):
+        breaker.check()
+
+    time.sleep(0.06)
+    trial = breaker.check()
+    assert trial != lost
+    breaker.release_trial(lost)  # a late release must not free the new trial
+    assert breaker.allow() is False
+    breaker.record_success()
+    assert breaker.state == CLOSED
+
+
+def test_background_probe_moves_breaker_to_half_open():
+    probed = []
+    breaker = CircuitBreaker(
+        "probe", failure_threshold=1, reset_timeout=0.02, probe=lambda: probed.append(True)
+    )
+    breaker.record_failure(TimeoutError("slow"))
+    assert breaker.state == OPEN
+    deadline = time.time() + 2
+    while breaker.state != HALF_OPEN and time.time() < deadline:
+        time.sleep(0.01)
+    assert probed
+    assert breaker.state == HALF_OPEN
+
+
+def test_manager_fails_fast_while_circuit_is_open():
+    cfg = EgeriaConfig(
+        platform_url="https://localhost:9443",
+        view_server="breaker-test-server",
+        user="erinoverview",
+        password="secret",
+    )
+
+    class _DownClient:
+        calls = 0
+
+        def create_egeria_bearer_token(self, user, password):
+            pass
+
+        def find_collections(self, search):
+            _DownClient.calls += 1
+            raise ConnectionRefusedError("connection refused")
+
+    manager = EgeriaTechClientManager(cfg, client_factory=lambda c: _DownClient())
+    manager.breaker.failure_threshold = 2
+    call = lambda client, s: client.find_collections(s)
+
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            manager.invoke_with_auto_refresh(call, ("*",))
+    # Transport failures are not retried after a token refresh
+    assert _DownClient.calls == 2
+
+    started = time.perf_counter()
+    with pytest.raises(CircuitOpenError):
+        manager.invoke_with_auto_refresh(call, ("*",))
+    assert time.perf_counter() - started < 0.05
+    assert _DownClient.calls == 2
+    manager.breaker.reset()
+    manager.close()
+
+
+def test_only_transport_errors_count_against_the_server():
+    import httpx
+
+    from utils.circuit_breaker import is_transport_failure
+
+    assert is_transport_failure(TimeoutError("slow"))
+    assert is_transport_failure(ConnectionRefusedError("refused"))
+    assert is_transport_failure(httpx.ConnectError("refused"))
+    try:
+        raise ConnectionError("Preflight error") from httpx.ReadTimeout("slow")
+    except ConnectionError as wrapped:
+        assert is_transport_failure(wrapped)
+    # Local bugs and our own response-shape errors must not trip the breaker
+    assert not is_transport_failure(FileNotFoundError("config.json"))
+    assert not is_transport_failure(PermissionError("snapshot.db"))
+    assert not is_transport_failure(ConnectionError("Unexpected response shape"))
+
+
+def test_async_calls_that_end_without_a_verdict_hand_the_trial_back():
+    cfg = EgeriaConfig(
+        platform_url="https://localhost:9443",
+        view_server="breaker-trial-server",
+        user="erinoverview",
+        password="secret",
+    )
+
+    class _Client:
+        def create_egeria_bearer_token(self, user, password):
+            pass
+
+        def find_collections(self, search):
+            return ["sync"]
+
+        async def _async_find_collections(self, search):
+            await asyncio.sleep(1)
+
+    def _half_open(manager):
+        manager.breaker.reset()
+        manager.breaker.failure_threshold = 1
+        manager.breaker.reset_timeout = 0
+        manager.breaker.probe = None  # the next call is the trial
+        manager.breaker.record_failure(ConnectionRefusedError("refused"))
+        assert manager.breaker.state == HALF_OPEN
+
+    call = lambda client, s: client.find_collections(s)
+    manager = EgeriaTechClientManager(cfg, client_factory=lambda c: _Client())
+    async_manager = AsyncEgeriaClientManager(manager)
+
+    # No such coroutine, before and after the client was built
+    for _ in range(2):
+        _half_open(manager)
+        with pytest.raises(NativeAsyncUnavailable):
+            asyncio.run(async_manager.invoke("_async_get_member_list", ("c1",)))
+        assert manager.invoke_with_auto_refresh(call, ("*",)) == ["sync"]
+        assert manager.breaker.state == CLOSED
+
+    # Cancelled while awaiting the server
+    _half_open(manager)
+
+    async def cancelled():
+        task = asyncio.ensure_future(async_manager.invoke("_async_find_collections", ("*",)))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancelled())
+    assert manager.breaker.state == HALF_OPEN
+    assert manager.invoke_with_auto_refresh(call, ("*",)) == ["sync"]
+    assert manager.breaker.state == CLOSED
+    manager.close()
@@ -0,0 +1,280 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file is a unit test for my_egeria.
+
+
+"""
+
+import sys
+import threading
+import time
+
+import pytest
+from utils.config import EgeriaConfig
+from utils.egeria_client import EgeriaClientPool
+
+
+def _cfg(**overrides) -> EgeriaConfig:
+    base = EgeriaConfig(
+        platform_url="https://localhost:9443",
+        view_server="qs-view-server",
+        user="erinoverview",
+        password="secret",
+    )
+    return base.with_overrides(**overrides)
+
+
+def test_pool_shares_manager_per_connection():
+    pool = EgeriaClientPool()
+    first = pool.acquire(_cfg())
+    second = pool.acquire(_cfg())
+    other = pool.acquire(_cfg(view_server="other-view-server"))
+
+    assert first is second
+    assert other is not first
+    stats = pool.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["managers"] == 2
+    pool.clear()
+
+
+def test_pool_keeps_idle_manager_after_release():
+    pool = EgeriaClientPool()
+    manager = pool.acquire(_cfg())
+    pool.release(manager)
+    assert pool.stats()["in_use"] == 0
+
+    # Navigating back to a screen must reuse the cached session
+    assert pool.acquire(_cfg()) is manager
+    assert pool.stats()["hits"] == 1
+    pool.clear()
+
+
+def test_pool_replaces_manager_when_password_changes():
+    pool = EgeriaClientPool()
+    manager = pool.acquire(_cfg())
+    closed = []
+    manager.close = lambda: closed.append(manager)
+    replacement = pool.acquire(_cfg(password="changed"))
+    assert replacement is not manager
+    assert pool.stats()["misses"] == 2
+
+    # The screen still holding the old manager keeps it until it lets go
+    assert closed == []
+    pool.release(manager)
+    assert closed == [manager]
+    pool.clear()
+
+
+class _FakeClient:
+    def __init__(self):
+        self.token_calls = 0
+
+    def create_egeria_bearer_token(self, user, password):
+        self.token_calls += 1
+
+    def close_session(self):
+        pass
+
+
+def test_token_refresher_renews_only_active_managers_near_expiry():
+    from utils.token_refresher import TokenRefresher
+
+    pool = EgeriaClientPool()
+    now = time.time()
+    near = pool.acquire(_cfg(token_ttl_seconds=300, token_refresh_margin_seconds=60))
+    idle = pool.acquire(_cfg(user="idle-user", token_ttl_seconds=300))
+    fresh = pool.acquire(_cfg(user="fresh-user", token_ttl_seconds=300))
+    for m in (near, idle, fresh):
+        m._client = _FakeClient()
+        m._last_used_ts = now
+    near._last_auth_ts = now - 270  # 30s left, inside the 60s margin
+    idle._last_auth_ts = now - 270
+    idle._last_used_ts = now - 3600
+    fresh._last_auth_ts = now
+
+    refresher = TokenRefresher(pool, idle_after_seconds=600)
+    assert refresher.run_once() == 1
+    assert near._client.token_calls == 1
+    assert idle._client.token_calls == 0
+    assert fresh._client.token_calls == 0
+
+    refresher.pause()
+    near._last_auth_ts = now - 270
+    assert refresher.run_once() == 0
+    pool.clear()
+
+
+class _TokenExpired(Exception):
+    pass
+
+
+class _ExpiringClient:
+    """Fake EgeriaTech whose server-side token can be revoked."""
+
+    def __init__(self, parties: int):
+        self.token_valid = False
+        self.token_calls = 0
+        self._barrier = threading.Barrier(parties, timeout=10)
+
+    def create_egeria_bearer_token(self, user, password):
+        time.sleep(0.05)  # make the authentication window wide
+        self.token_calls += 1
+        self.token_valid = True
+
+    def find_collections(self, search):
+        if not self.token_valid:
+            # Hold every caller until all have observed the stale token
+            self._barrier.wait()
+            raise _TokenExpired("401 token expired")
+        return [{"guid": "c1", "search": search}]
+
+    def close_session(self):
+        pass
+
+
+def test_concurrent_failures_share_one_reauthentication():
+    import asyncio
+    from concurrent.futures import ThreadPoolExecutor
+    from utils.egeria_client import EgeriaTechClientManager
+
+    callers = 100
+    fake = _ExpiringClient(parties=callers)
+    manager = EgeriaTechClientManager(_cfg(), client_factory=lambda cfg: fake)
+    manager.get_client()
+    assert fake.token_calls == 1
+    fake.token_valid = False  # server revokes the token
+
+    def _call(client, search):
+        return client.find_collections(search)
+
+    async def _fan_out():
+        loop = asyncio.get_running_loop()
+        loop.set_default_executor(ThreadPoolExecutor(max_workers=callers))
+        return await asyncio.gather(
+            *(
+                asyncio.to_thread(manager.invoke_with_auto_refresh, _call, ("*",))
+                for _ in range(callers)
+            )
+        )
+
+    results = asyncio.run(_fan_out())
+    assert len(results) == callers
+    assert all(r[0]["guid"] == "c1" for r in results)
+    # One initial authentication plus exactly one coalesced re-authentication
+    assert fake.token_calls == 2
+    assert manager.auth_count == 2
+    manager.close()
+
+
+def test_only_a_rejected_token_is_refreshed_and_retried():
+    from utils.egeria_client import EgeriaTechClientManager, is_auth_failure
+
+    class _HttpError(Exception):
+        def __init__(self, status_code):
+            super().__init__(f"HTTP {status_code}")
+            self.status_code = status_code
+
+    assert is_auth_failure(_TokenExpired("401 token expired"))
+    assert is_auth_failure(_HttpError(401))
+    assert not is_auth_failure(ConnectionError("Operation failed"))
+    assert not is_auth_failure(_HttpError(404))
+    assert not is_auth_failure(ValueError("no such collection"))
+
+    fake = _FakeClient()
+    manager = EgeriaTechClientManager(_cfg(), client_factory=lambda cfg: fake)
+    calls = []
+
+    def _missing(client):
+        calls.append(1)
+        raise ValueError("no such collection")
+
+    with pytest.raises(ValueError):
+        manager.invoke_with_auto_refresh(_missing)
+    assert len(calls) == 1 and manager.auth_count == 1
+    manager.close()
+
+
+def test_login_session_is_handed_to_the_pool():
+    pool = EgeriaClientPool()
+    login_client = _FakeClient()
+    manager = pool.adopt(_cfg(user="login-user"), login_client)
+
+    # The first service call reuses the login's session: no second build or token request
+    assert manager.get_client() is login_client
+    assert login_client.token_calls == 0
+    assert pool.live_session(_cfg(user="login-user")) is manager
+    assert pool.live_session(_cfg(user="login-user", password="other")) is None
+    assert pool.stats()["in_use"] == 0
+
+    # A manager already signed in keeps its session and the newcomer is closed
+    closed = []
+    second = _FakeClient()
+    second.close_session = lambda: closed.append(True)
+    assert pool.adopt(_cfg(user="login-user"), second).get_client() is login_client
+    assert closed == [True]
+    pool.clear()
+
+
+def test_resume_login_session_sets_the_app_connection(monkeypatch):
+    from utils import config, egeria_client
+
+    pool = EgeriaClientPool()
+    monkeypatch.setattr(egeria_client, "_CLIENT_POOL", pool)
+    monkeypatch.setattr(config, "_current_config", None)
+    cfg = _cfg(user="warm-user")
+
+    assert egeria_client.resume_login_session(cfg) is False
+    egeria_client.adopt_login_session(cfg, _FakeClient())
+    assert config.get_global_config() == cfg
+    monkeypatch.setattr(config, "_current_config", None)
+    assert egeria_client.resume_login_session(cfg) is True
+    assert config.get_global_config() == cfg
+    pool.clear()
+
+
+@pytest.mark.parametrize("module", ["con_services.egeria_connection", "services.egeria_connection"])
+def test_login_through_the_connection_service_reaches_acquire_manager(monkeypatch, module):
+    import importlib
+    import types
+    from utils import config, egeria_client
+
+    signed_in = []
+
+    class _EgeriaTech(_FakeClient):
+        def __init__(self, view_server, platform_url, user_id, user_pwd):
+            super().__init__()
+            signed_in.append(self)
+
+    monkeypatch.setitem(sys.modules, "pyegeria", types.SimpleNamespace(EgeriaTech=_EgeriaTech))
+    pool = EgeriaClientPool()
+    monkeypatch.setattr(egeria_client, "_CLIENT_POOL", pool)
+    monkeypatch.setattr(config, "_current_config", _cfg())
+    connection = importlib.import_module(module)
+
+    service = connection.EgeriaConnectionService()
+    assert service.connect_to_egeria("login-user", "secret", "https://localhost:9443", "qs-view-server")
+
+    # The services' manager is the one the login signed in: same client, no second token
+    manager = egeria_client.acquire_manager(config.get_global_config())
+    assert manager.get_client() is signed_in[0]
+    assert len(signed_in) == 1 and signed_in[0].token_calls == 1
+    egeria_client.release_manager(manager)
+    pool.clear()
+
+
+def test_app_focus_pauses_and_resumes_the_refresher():
+    from utils import token_refresher
+
+    refresher = token_refresher.start_token_refresher(pool=EgeriaClientPool(), interval_seconds=60)
+    try:
+        token_refresher.pause_token_refresher()
+        assert refresher.run_once() == 0 and refresher._paused.is_set()
+        token_refresher.resume_token_refresher()
+        assert not refresher._paused.is_set()
+    finally:
+        token_refresher.stop_token_refresher()
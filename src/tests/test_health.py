@@ -0,0 +1,116 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file is a unit test for my_egeria.
+
+
+"""
+
+import asyncio
+import sys
+import types
+
+import httpx
+import pytest
+
+from utils import health
+from utils.config import EgeriaConfig
+from utils.egeria_client import EgeriaTechClientManager, preflight_origin
+from utils.health import HealthCache, HealthWatcher, probe_origin
+
+
+def test_checks_within_the_ttl_share_one_probe():
+    calls = []
+
+    async def probe(url, user):
+        calls.append(url)
+        await asyncio.sleep(0.01)
+
+    async def scenario():
+        cache = HealthCache(ttl_seconds=60, probe=probe)
+        first = await asyncio.gather(*(cache.check("https://p:9443/", "u") for _ in range(5)))
+        again = await cache.check("https://p:9443", "u")
+        return cache, first, again
+
+    cache, first, again = asyncio.run(scenario())
+    assert calls == ["https://p:9443/"]
+    assert all(status is again for status in first)
+    assert again.reachable and cache.peek("https://p:9443", "u") is again
+
+
+def test_failed_probe_is_cached_as_unreachable():
+    async def probe(url, user):
+        raise ConnectionError("refused")
+
+    async def scenario():
+        cache = HealthCache(ttl_seconds=0, probe=probe)
+        return await cache.check("https://p:9443", "u")
+
+    status = asyncio.run(scenario())
+    assert not status.reachable
+    assert status.error == "refused"
+
+
+def test_watcher_follows_the_global_config(monkeypatch):
+    from utils import config
+    from utils.config import EgeriaConfig
+
+    monkeypatch.setattr(
+        config, "_current_config", EgeriaConfig("https://watched:9443", "vs", "watcher", "secret")
+    )
+    probed = []
+
+    async def probe(url, user):
+        probed.append((url, user))
+
+    async def scenario():
+        cache = HealthCache(ttl_seconds=60, probe=probe)
+        watcher = HealthWatcher(cache, interval_seconds=0.01)
+        watcher.start()
+        await asyncio.sleep(0.05)
+        watcher.stop()
+        return cache
+
+    cache = asyncio.run(scenario())
+    assert ("https://watched:9443", "watcher") in probed
+    assert cache.peek("https://watched:9443", "watcher").reachable
+
+
+def test_origin_probes_report_http_failures(monkeypatch):
+    def handler(request):
+        assert request.url.path.endswith("/users/erinoverview/server-platform/origin")
+        return httpx.Response(503)
+
+    transport = httpx.MockTransport(handler)
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(httpx, "AsyncClient", lambda **kw: real_client(transport=transport, **kw))
+    with pytest.raises(ConnectionError, match="503"):
+        asyncio.run(probe_origin("https://localhost:9443", "erinoverview"))
+
+    monkeypatch.setattr(httpx, "get", lambda url, **kw: httpx.Response(200))
+    preflight_origin("https://localhost:9443", "erinoverview")
+    with pytest.raises(ConnectionError, match="Malformed"):
+        preflight_origin("localhost", "erinoverview")
+
+
+def test_client_builds_use_the_cached_health_instead_of_a_preflight(monkeypatch):
+    def no_network(*args, **kwargs):
+        raise AssertionError("client build made its own origin request")
+
+    async def refused(url, user):
+        raise ConnectionError("Preflight error contacting origin: refused")
+
+    monkeypatch.setattr(httpx, "get", no_network)
+    monkeypatch.setitem(sys.modules, "pyegeria", types.SimpleNamespace(EgeriaTech=lambda **kw: "client"))
+    cache = HealthCache(ttl_seconds=60, probe=refused)
+    monkeypatch.setattr(health, "_HEALTH_CACHE", cache)
+    manager = EgeriaTechClientManager(EgeriaConfig("https://built:9443", "vs", "builder", "secret"))
+
+    assert manager._build_client() == "client"  # nothing known: no round trip before the build
+
+    asyncio.run(cache.check("https://built:9443", "builder"))
+    with pytest.raises(ConnectionError, match="refused"):
+        manager._build_client()
+    manager.close()
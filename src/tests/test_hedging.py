@@ -0,0 +1,125 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file is a unit test for my_egeria.
+
+
+"""
+
+import asyncio
+import time
+
+from services.collection_service import CollectionService
+from utils import hedging
+from utils.config import EgeriaConfig
+from utils.egeria_client import EgeriaTechClientManager, get_client_pool
+from utils.hedging import HedgeBudget, Hedger, LatencyTracker
+
+
+def _trained(fraction: float = 1.0) -> Hedger:
+    hedger = Hedger("test", budget=HedgeBudget(fraction), min_samples=5)
+    for _ in range(100):
+        hedger.tracker("op").record(0.01)
+    return hedger
+
+
+def test_p90_needs_enough_samples():
+    tracker = LatencyTracker(min_samples=10)
+    for ms in range(1, 10):
+        tracker.record(ms / 1000)
+    assert tracker.p90() is None
+    tracker.record(0.1)
+    assert tracker.p90() == 0.009
+
+
+def test_slow_call_is_hedged_and_the_first_answer_wins():
+    hedger = _trained()
+
+    def slow():
+        time.sleep(0.3)
+        return "primary"
+
+    t0 = time.monotonic()
+    assert hedger.run("op", slow, lambda: "hedge") == "hedge"
+    assert time.monotonic() - t0 < 0.2
+    assert (hedger.hedges, hedger.hedge_wins) == (1, 1)
+
+    # Fast calls never pay for a duplicate
+    assert hedger.run("op", lambda: "primary", lambda: "hedge") == "primary"
+    assert hedger.hedges == 1
+
+
+def test_hedges_stay_within_the_budget():
+    hedger = _trained(fraction=0.25)
+    secondary_calls = []
+
+    def slow():
+        time.sleep(0.03)
+        return "primary"
+
+    def secondary():
+        secondary_calls.append(1)
+        time.sleep(0.1)
+        return "hedge"
+
+    results = [hedger.run("op", slow, secondary) for _ in range(8)]
+    assert results == ["primary"] * 8
+    assert hedger.hedges == len(secondary_calls) == 2
+
+
+def test_async_hedge_cancels_the_loser():
+    hedger = _trained()
+    cancelled = []
+
+    async def slow():
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    async def fast():
+        return "hedge"
+
+    async def scenario():
+        result = await hedger.arun("op", slow, fast)
+        await asyncio.sleep(0)
+        return result
+
+    assert asyncio.run(scenario()) == "hedge"
+    assert cancelled == [True]
+    # The cancelled primary still counts, at the time it had run for
+    samples = hedger.tracker("op")._samples
+    assert len(samples) == 101 and samples[-1] >= 0.01
+
+
+def test_service_reads_are_hedged_on_a_second_client(monkeypatch):
+    monkeypatch.setenv("EGERIA_HEDGED_READS", "true")
+    cfg = EgeriaConfig("https://localhost:9443", "hedge-test-server", "erinoverview", "secret")
+
+    class Client:
+        def __init__(self, delay, name):
+            self.delay, self.name = delay, name
+
+        def create_egeria_bearer_token(self, user, password):
+            pass
+
+        def find_collections(self, search, output_format="DICT"):
+            time.sleep(self.delay)
+            return [{"GUID": self.name}]
+
+    primary = EgeriaTechClientManager(cfg, client_factory=lambda c: Client(0.3, "primary"))
+    second = EgeriaTechClientManager(cfg, client_factory=lambda c: Client(0.0, "hedge"))
+    monkeypatch.setattr(get_client_pool(), "hedge_manager", lambda config=None: second)
+    hedger = _trained()
+    for _ in range(5):
+        hedger.tracker("find_collections").record(0.01)
+    monkeypatch.setattr(hedging, "_HEDGERS", {("https://localhost:9443", "hedge-test-server"): hedger})
+
+    service = CollectionService(cfg, manager=primary)
+    assert service.list_collections("hedged", refresh=True)[0]["GUID"] == "hedge"
+    assert hedger.hedge_wins == 1
+    # Async hedges reuse one wrapper around the hedge manager
+    assert service._async_manager_for(second) is service._async_manager_for(second)
@@ -0,0 +1,177 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file is a unit test for my_egeria.
+
+
+"""
+
+import asyncio
+
+from textual.app import App
+
+from utils.scheduler import BACKGROUND, RequestScheduler, request_priority
+from widgets.lazy_tree import LazyTree
+from widgets.tree_updater import TreeSpec, TreeUpdater
+
+# collection guid -> member guids; "broken" fails to load
+HIERARCHY = {
+    "market": ["folder-1", "folder-2"],
+    "folder-1": ["product-a", "product-b"],
+    "folder-2": [],
+    "product-a": [],
+    "product-b": [],
+}
+
+
+def _tree(calls, **kwargs):
+    async def loader(guid):
+        calls.append(guid)
+        await asyncio.sleep(0.01)
+        if guid == "broken":
+            raise RuntimeError("server said no")
+        return [TreeSpec(m, data=m, lazy=bool(HIERARCHY.get(m))) for m in HIERARCHY[guid]]
+
+    return LazyTree("Marketplace", loader, data="market", id="tree", **kwargs)
+
+
+class TreeApp(App):
+    def __init__(self, tree):
+        super().__init__()
+        self.lazy_tree = tree
+
+    def compose(self):
+        yield self.lazy_tree
+
+
+def _labels(node):
+    return [c.label.plain for c in node.children]
+
+
+def test_children_load_on_expand_and_are_cached():
+    calls = []
+
+    async def scenario():
+        tree = _tree(calls, lazy_root=True)
+        tree.root.expand()
+        async with TreeApp(tree).run_test() as pilot:
+            await pilot.pause(0.1)
+            assert _labels(tree.root) == ["folder-1", "folder-2"]
+            folder = tree.root.children[0]
+            assert _labels(folder) == ["Loading…"]
+            assert calls == ["market"]
+
+            folder.expand()
+            await pilot.pause(0.1)
+            assert _labels(folder) == ["product-a", "product-b"]
+            folder.collapse()
+            folder.expand()
+            await pilot.pause(0.1)
+            assert calls == ["market", "folder-1"]
+
+            tree.reload(folder)
+            await pilot.pause(0.1)
+            assert calls == ["market", "folder-1", "folder-1"]
+            assert _labels(folder) == ["product-a", "product-b"]
+
+    asyncio.run(scenario())
+
+
+def test_prefetch_warms_the_next_level_and_failures_retry():
+    calls = []
+
+    async def scenario():
+        tree = _tree(calls, lazy_root=True, prefetch_depth=1)
+        tree.root.expand()
+        async with TreeApp(tree).run_test() as pilot:
+            await pilot.pause(0.2)
+            assert sorted(calls) == ["folder-1", "market"]  # folder-2 has no members: not lazy
+            tree.root.children[0].expand()
+            await pilot.pause(0.05)
+            assert calls.count("folder-1") == 1
+
+            broken = tree.add_spec(tree.root, TreeSpec("Broken", data="broken", lazy=True))
+            broken.expand()
+            await pilot.pause(0.1)
+            assert _labels(broken) == ["Failed to load: server said no"]
+            assert not tree.is_loaded(broken)
+
+    asyncio.run(scenario())
+
+
+def test_updater_leaves_loaded_lazy_branches_alone():
+    calls = []
+
+    async def scenario():
+        tree = _tree(calls)
+        updater = TreeUpdater(tree)
+        async with TreeApp(tree).run_test() as pilot:
+            updater.update([TreeSpec("folder-1", data="folder-1", lazy=True)])
+            tree.root.children[0].expand()
+            await pilot.pause(0.1)
+            assert _labels(tree.root.children[0]) == ["product-a", "product-b"]
+            stats = updater.update([TreeSpec("folder-1", data="folder-1", lazy=True)])
+            assert not stats.changed
+            assert _labels(tree.root.children[0]) == ["product-a", "product-b"]
+
+    asyncio.run(scenario())
+
+
+def test_reload_while_loading_fetches_again_and_shows_the_new_answer():
+    answers = iter([["stale"], ["fresh"]])
+    release = asyncio.Event()
+    calls = []
+
+    async def scenario():
+        async def loader(guid):
+            calls.append(guid)
+            specs = [TreeSpec(label, leaf=True) for label in next(answers)]
+            if len(calls) == 1:
+                await release.wait()  # the first load is still on the wire during the reload
+            return specs
+
+        tree = LazyTree("Marketplace", loader, data="market", id="tree", lazy_root=True)
+        tree.root.expand()
+        async with TreeApp(tree).run_test() as pilot:
+            await pilot.pause(0.05)
+            tree.reload(tree.root)
+            await pilot.pause(0.05)
+            assert _labels(tree.root) == ["fresh"]
+            release.set()
+            await pilot.pause(0.05)
+            # The old answer neither crashes the load nor lands in the tree or the cache
+            assert _labels(tree.root) == ["fresh"]
+            assert await tree.children_of("market") == [TreeSpec("fresh", leaf=True)]
+            assert calls == ["market", "market"]
+
+    asyncio.run(scenario())
+
+
+def test_expanding_a_branch_being_prefetched_raises_its_priority():
+    scheduler = RequestScheduler("test", limit=1)
+    order = []
+
+    async def call(name, hold=0.0):
+        async with scheduler.aslot():
+            order.append(name)
+            await asyncio.sleep(hold)
+        return [TreeSpec(name, data=name)]
+
+    async def scenario():
+        tree = LazyTree("Marketplace", call, data="market")
+        busy = asyncio.ensure_future(call("busy", hold=0.05))
+        await asyncio.sleep(0.01)
+        with request_priority(BACKGROUND):
+            other = asyncio.ensure_future(call("other-prefetch"))
+            prefetch = asyncio.ensure_future(tree.children_of("folder-1"))
+        await asyncio.sleep(0.01)
+        specs = await tree.children_of("folder-1")  # the user expands it
+        await asyncio.gather(busy, other, prefetch)
+        return tree, specs
+
+    tree, specs = asyncio.run(scenario())
+    assert [s.label for s in specs] == ["folder-1"]
+    assert order == ["busy", "folder-1", "other-prefetch"]
+    assert tree.loads == 1
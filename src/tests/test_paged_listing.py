@@ -0,0 +1,91 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file is a unit test for my_egeria.
+
+
+"""
+
+import asyncio
+
+from services.collection_service import CollectionService
+from utils.config import EgeriaConfig
+from utils.egeria_client import EgeriaTechClientManager
+from utils.response_cache import get_response_cache
+
+CFG = EgeriaConfig(
+    platform_url="https://localhost:9443",
+    view_server="paging-test-server",
+    user="erinoverview",
+    password="secret",
+    page_size=2,
+)
+
+ALL = [{"GUID": f"c{i}", "displayName": f"Collection {i}"} for i in range(5)]
+
+
+class PagedClient:
+    def __init__(self):
+        self.requests = []
+
+    def create_egeria_bearer_token(self, user, password):
+        pass
+
+    async def _async_find_collections(self, search, output_format="JSON", start_from=0, page_size=None):
+        self.requests.append(start_from)
+        await asyncio.sleep(0)
+        page = ALL[start_from:start_from + page_size]
+        return page or "No elements found"
+
+
+def _service():
+    client = PagedClient()
+    manager = EgeriaTechClientManager(CFG, client_factory=lambda cfg: client)
+    return CollectionService(CFG, manager=manager), client
+
+
+def test_iter_collections_yields_pages_until_short_page():
+    get_response_cache().clear()
+    service, client = _service()
+
+    async def collect():
+        return [page async for page in service.iter_collections("*")]
+
+    pages = asyncio.run(collect())
+    assert [len(p) for p in pages] == [2, 2, 1]
+    assert client.requests == [0, 2, 4]
+
+
+def test_iter_collections_prefetches_next_page():
+    get_response_cache().clear()
+    service, client = _service()
+
+    async def first_page_only():
+        gen = service.iter_collections("*")
+        page = await gen.__anext__()
+        await asyncio.sleep(0.01)
+        seen = list(client.requests)
+        await gen.aclose()
+        return page, seen
+
+    page, seen = asyncio.run(first_page_only())
+    assert page == ALL[:2]
+    # Page two was requested while the caller still held page one
+    assert seen == [0, 2]
+
+
+def test_remembered_stream_feeds_list_and_peek():
+    get_response_cache().clear()
+    service, client = _service()
+
+    async def drain():
+        async for _ in service.iter_collections("*", remember=True):
+            pass
+
+    asyncio.run(drain())
+    calls = len(client.requests)
+    assert service.list_collections("*") == ALL
+    assert service.peek_collections("*")[0] == ALL
+    assert len(client.requests) == calls
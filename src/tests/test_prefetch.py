@@ -0,0 +1,102 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file is a unit test for my_egeria.
+
+
+"""
+
+import asyncio
+
+from services.collection_service import CollectionService
+from utils.config import EgeriaConfig
+from utils.egeria_client import EgeriaTechClientManager
+from utils.prefetch import Prefetcher
+from utils.response_cache import get_response_cache
+
+CFG = EgeriaConfig(
+    platform_url="https://localhost:9443",
+    view_server="prefetch-test-server",
+    user="erinoverview",
+    password="secret",
+)
+
+
+def test_moving_the_highlight_cancels_dwelling_prefetches():
+    fetched = []
+
+    async def scenario():
+        prefetcher = Prefetcher(dwell_seconds=0.05)
+
+        def factory(key):
+            async def run():
+                fetched.append(key)
+            return run
+
+        for key in ("a", "b", "c"):  # cursor skims over rows
+            prefetcher.hover(key, factory(key))
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.1)
+        return prefetcher
+
+    prefetcher = asyncio.run(scenario())
+    assert fetched == ["c"]
+    assert prefetcher.cancelled == 2
+
+
+def test_concurrency_is_capped_and_started_prefetches_finish():
+    active, peak, finished = [0], [0], []
+
+    async def scenario():
+        prefetcher = Prefetcher(dwell_seconds=0, max_concurrency=2)
+
+        def factory(key):
+            async def run():
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+                await asyncio.sleep(0.05)
+                active[0] -= 1
+                finished.append(key)
+            return run
+
+        for key in ("a", "b"):
+            prefetcher.hover(key, factory(key))
+            await asyncio.sleep(0.01)  # dwell elapsed: both committed
+        prefetcher.hover("c", factory("c"))  # waits for a free slot
+        await asyncio.sleep(0.2)
+
+    asyncio.run(scenario())
+    assert peak[0] == 2
+    assert sorted(finished) == ["a", "b", "c"]
+
+
+def test_prefetch_warms_what_the_details_screen_loads():
+    get_response_cache().clear()
+    calls = []
+
+    class Client:
+        def create_egeria_bearer_token(self, user, password):
+            pass
+
+        async def _async_get_collection(self, guid, output_format="JSON"):
+            calls.append("get_collection")
+            return {"GUID": guid}
+
+        async def _async_get_member_list(self, collection_guid=None, collection_name=None, collection_qname=None):
+            calls.append("get_member_list")
+            return [{"GUID": "m1"}]
+
+    manager = EgeriaTechClientManager(CFG, client_factory=lambda cfg: Client())
+    service = CollectionService(CFG, manager=manager)
+
+    async def scenario():
+        await service.prefetch_collection_async("c1")
+        details = await service.get_collection_details_async("c1")
+        members = await service.get_collection_members_async("c1")
+        return details, members
+
+    details, members = asyncio.run(scenario())
+    assert details == {"GUID": "c1"} and members == [{"GUID": "m1"}]
+    assert sorted(calls) == ["get_collection", "get_member_list"]
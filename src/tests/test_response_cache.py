@@ -0,0 +1,172 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file is a unit test for my_egeria.
+
+
+"""
+
+import threading
+import time
+
+from services.collection_service import CollectionService
+from utils.config import EgeriaConfig
+from utils.egeria_client import EgeriaTechClientManager
+from utils.response_cache import ResponseCache, get_response_cache
+from utils.single_flight import get_single_flight
+
+CFG = EgeriaConfig(
+    platform_url="https://localhost:9443",
+    view_server="cache-test-server",
+    user="erinoverview",
+    password="secret",
+)
+
+
+def test_ttl_expiry_keeps_stale_entry_for_peek():
+    cache = ResponseCache()
+    key = cache.make_key("scope", "find_collections", ("*",), {"output_format": "DICT"})
+    cache.put(key, [{"guid": "c1"}], ttl=0.01)
+    assert cache.get(key) == (True, [{"guid": "c1"}])
+    time.sleep(0.02)
+    assert cache.get(key) == (False, None)
+    value, age = cache.peek(key)
+    assert value == [{"guid": "c1"}] and age >= 0.01
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+
+def test_callers_get_copies_they_may_modify():
+    cache = ResponseCache()
+    key = cache.make_key("scope", "find_collections", ("*",), {})
+    listing = [{"guid": "c1", "tags": ["a"]}]
+    cache.put(key, listing, ttl=60)
+    listing.append({"guid": "c2"})  # the caller's own object is not the cached one
+
+    _, value = cache.get(key)
+    value[0]["tags"].append("b")
+    value.clear()
+    stale, _ = cache.peek(key)
+    stale[0]["guid"] = "changed"
+    assert cache.get(key) == (True, [{"guid": "c1", "tags": ["a"]}])
+
+
+def test_lru_eviction_by_entries_and_bytes():
+    cache = ResponseCache(max_entries=2)
+    for i in range(3):
+        cache.put(cache.make_key("s", "m", (i,)), i, ttl=60)
+    assert cache.get(cache.make_key("s", "m", (0,)))[0] is False
+    assert cache.stats()["evictions"] == 1
+
+    small = ResponseCache(max_bytes=1500)
+    small.put(small.make_key("s", "a"), "x" * 900, ttl=60)
+    small.put(small.make_key("s", "b"), "y" * 900, ttl=60)
+    assert small.stats()["entries"] == 1
+    assert small.stats()["bytes"] <= 1500
+
+
+class CollectionsClient:
+    def __init__(self):
+        self.find_calls = 0
+
+    def create_egeria_bearer_token(self, user, password):
+        pass
+
+    def find_collections(self, search, output_format="JSON"):
+        self.find_calls += 1
+        return [{"guid": f"c{self.find_calls}"}]
+
+    def delete_collection(self, guid):
+        return {"success": True}
+
+    def close_session(self):
+        pass
+
+
+def test_service_reads_are_cached_and_mutations_invalidate():
+    get_response_cache().clear()
+    client = CollectionsClient()
+    manager = EgeriaTechClientManager(CFG, client_factory=lambda cfg: client)
+    service = CollectionService(CFG, manager=manager)
+
+    assert service.list_collections("*") == [{"guid": "c1"}]
+    assert service.list_collections("*") == [{"guid": "c1"}]
+    assert client.find_calls == 1
+
+    assert service.list_collections("*", refresh=True) == [{"guid": "c2"}]
+    service.delete_collection({"guid": "c2", "display_name": "Old", "description": "gone"})
+    assert service.list_collections("*") == [{"guid": "c3"}]
+    assert client.find_calls == 3
+    service.close()
+    get_response_cache().clear()
+
+
+def test_read_that_overlaps_a_mutation_is_not_cached():
+    get_response_cache().clear()
+    started, release = threading.Event(), threading.Event()
+
+    class SlowClient(CollectionsClient):
+        def find_collections(self, search, output_format="JSON"):
+            self.find_calls += 1
+            if self.find_calls == 1:
+                started.set()
+                release.wait(2)  # the delete happens while this read is on the wire
+            return [{"guid": f"c{self.find_calls}"}]
+
+    client = SlowClient()
+    manager = EgeriaTechClientManager(CFG, client_factory=lambda cfg: client)
+    service = CollectionService(CFG, manager=manager)
+
+    slow = []
+    reader = threading.Thread(target=lambda: slow.append(service.list_collections("*")))
+    reader.start()
+    assert started.wait(2)
+    service.delete_collection({"guid": "c1", "display_name": "Old", "description": "gone"})
+    release.set()
+    reader.join(2)
+
+    assert slow == [[{"guid": "c1"}]]  # its own caller still gets the answer
+    assert service.list_collections("*") == [{"guid": "c2"}]
+    assert client.find_calls == 2
+    service.close()
+    get_response_cache().clear()
+
+
+def test_concurrent_readers_sharing_a_request_get_their_own_rows():
+    get_response_cache().clear()
+    started, release = threading.Event(), threading.Event()
+
+    class SlowClient(CollectionsClient):
+        def find_collections(self, search, output_format="JSON"):
+            self.find_calls += 1
+            started.set()
+            release.wait(2)
+            return [{"guid": "c1", "display_name": "Original"}]
+
+    client = SlowClient()
+    manager = EgeriaTechClientManager(CFG, client_factory=lambda cfg: client)
+    service = CollectionService(CFG, manager=manager)
+
+    results = []
+    readers = [threading.Thread(target=lambda: results.append(service.list_collections("shared"))) for _ in range(2)]
+    readers[0].start()
+    assert started.wait(2)
+    shared = get_single_flight().stats()["shared"]
+    readers[1].start()
+    deadline = time.time() + 2
+    while get_single_flight().stats()["shared"] == shared and time.time() < deadline:
+        time.sleep(0.005)
+    release.set()
+    for reader in readers:
+        reader.join(2)
+
+    assert client.find_calls == 1
+    first, second = results
+    first[0]["display_name"] = "Edited on one screen"
+    second.append({"guid": "local"})
+    assert first == [{"guid": "c1", "display_name": "Edited on one screen"}]
+    assert second == [{"guid": "c1", "display_name": "Original"}, {"guid": "local"}]
+    assert service.list_collections("shared") == [{"guid": "c1", "display_name": "Original"}]
+    service.close()
+    get_response_cache().clear()
@@ -0,0 +1,87 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file is a unit test for my_egeria.
+
+
+"""
+
+import asyncio
+import sqlite3
+
+from widgets.row_sources import AsyncPageSource, ListRowSource, SQLiteRowSource
+
+
+def test_list_source_sorts_filters_and_edits_through_the_view():
+    source = ListRowSource(("Name", "Kind"), [("beta", "x"), ("Alpha", "y"), ("gamma", "x")])
+    source.sort(0)
+    assert [r[0] for r in source.rows(0, 10)] == ["Alpha", "beta", "gamma"]
+    source.filter("x")
+    assert source.count() == 2
+    assert [r[0] for r in source.rows(0, 10)] == ["beta", "gamma"]
+
+    source.set_cell(1, 0, "delta")  # position in the filtered, sorted view
+    source.filter("")
+    assert ("delta", "x") in source.rows(0, 10)
+
+
+def test_async_pages_load_on_demand_and_find_the_end():
+    requested = []
+
+    async def fetch_page(start_from, page_size):
+        requested.append(start_from)
+        return [(f"row {i}",) for i in range(start_from, min(start_from + page_size, 25))]
+
+    async def scenario():
+        source = AsyncPageSource(("Name",), fetch_page, page_size=10)
+        assert source.count() == 10  # unknown total: one page ahead
+        assert source.rows(0, 2) == [None, None]
+        assert source.missing(0, 5)
+        await source.load(0, 5)
+        assert requested == [0]
+        assert source.rows(0, 2) == [("row 0",), ("row 1",)]
+        assert source.count() == 20
+
+        await source.load(10, 30)
+        assert sorted(requested) == [0, 10, 20]
+        assert source.complete
+        assert source.count() == 25
+        assert not source.missing(0, 100)
+
+        source.sort(0, reverse=True)
+        assert source.rows(0, 1) == [("row 9",)]
+
+    asyncio.run(scenario())
+
+
+def test_sqlite_source_pushes_sort_filter_and_edits_into_sql():
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE terms (name TEXT, summary TEXT)")
+    conn.executemany(
+        "INSERT INTO terms VALUES (?, ?)", [(f"term {i:03}", "odd" if i % 2 else "even") for i in range(200)]
+    )
+    source = SQLiteRowSource(conn, "terms", ("name", "summary"))
+    assert source.count() == 200
+    assert source.rows(10, 12) == [("term 010", "even"), ("term 011", "odd")]
+
+    source.sort(0, reverse=True)
+    assert source.rows(0, 1) == [("term 199", "odd")]
+    source.filter("odd")
+    assert source.count() == 100
+
+    source.set_cell(0, 1, "edited")
+    assert conn.execute("SELECT summary FROM terms WHERE name = 'term 199'").fetchone() == ("edited",)
+    assert source.count() == 99
+
+
+def test_sqlite_source_rejects_unknown_columns():
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE terms (name TEXT)")
+    try:
+        SQLiteRowSource(conn, "terms", ("name", "nope"))
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("expected ValueError")
@@ -0,0 +1,122 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file is a unit test for my_egeria.
+
+
+"""
+
+import asyncio
+import threading
+import time
+
+from services.collection_service import CollectionService
+from utils.config import EgeriaConfig
+from utils.egeria_client import EgeriaTechClientManager
+from utils.scheduler import (
+    BACKGROUND,
+    INTERACTIVE,
+    VISIBLE_PREFETCH,
+    RequestScheduler,
+    current_priority,
+    request_priority,
+)
+
+
+def test_queued_requests_run_most_urgent_first():
+    scheduler = RequestScheduler("test", limit=1)
+    order = []
+
+    async def call(name, priority, hold=0.0):
+        async with scheduler.aslot(priority):
+            order.append(name)
+            await asyncio.sleep(hold)
+
+    async def scenario():
+        first = asyncio.ensure_future(call("first", BACKGROUND, hold=0.05))
+        await asyncio.sleep(0.01)
+        queued = [
+            asyncio.ensure_future(call(name, priority))
+            for name, priority in (("bg", BACKGROUND), ("prefetch", VISIBLE_PREFETCH), ("click", INTERACTIVE))
+        ]
+        await asyncio.sleep(0)
+        depth = scheduler.stats()["queue_depth"]
+        await asyncio.gather(first, *queued)
+        return depth
+
+    assert asyncio.run(scenario()) == 3
+    assert order == ["first", "click", "prefetch", "bg"]
+    stats = scheduler.stats()
+    assert stats["in_flight"] == 0 and stats["queue_depth"] == 0
+    assert stats["max_queue_depth"] == 3
+    assert stats["admitted"] == {"interactive": 1, "visible-prefetch": 1, "background": 2}
+    assert stats["max_wait_ms"]["background"] > stats["max_wait_ms"]["interactive"] > 0
+
+
+def test_background_work_leaves_a_slot_for_interactive_calls():
+    scheduler = RequestScheduler("test", limit=3)
+    release = threading.Event()
+    started = []
+
+    def background():
+        with scheduler.slot(BACKGROUND):
+            started.append("bg")
+            release.wait(2)
+
+    workers = [threading.Thread(target=background) for _ in range(4)]
+    for w in workers:
+        w.start()
+    time.sleep(0.05)
+    assert len(started) == 2  # the third slot is held back for the user
+
+    t0 = time.monotonic()
+    with scheduler.slot(INTERACTIVE):
+        assert time.monotonic() - t0 < 0.05
+    release.set()
+    for w in workers:
+        w.join(2)
+    assert started == ["bg"] * 4
+
+
+def test_cancelled_waiter_gives_up_its_place():
+    scheduler = RequestScheduler("test", limit=1)
+
+    async def scenario():
+        async with scheduler.aslot():
+            waiter = asyncio.ensure_future(scheduler.aslot().__aenter__())
+            await asyncio.sleep(0.01)
+            waiter.cancel()
+            await asyncio.sleep(0.01)
+        async with scheduler.aslot():
+            return scheduler.stats()
+
+    stats = asyncio.run(scenario())
+    assert stats["in_flight"] == 1 and stats["queue_depth"] == 0
+
+
+def test_priority_follows_the_context_into_worker_threads():
+    async def scenario():
+        with request_priority(VISIBLE_PREFETCH):
+            return await asyncio.to_thread(current_priority)
+
+    assert asyncio.run(scenario()) == VISIBLE_PREFETCH
+    assert current_priority() == INTERACTIVE
+
+
+def test_service_calls_go_through_the_server_scheduler():
+    cfg = EgeriaConfig("https://localhost:9443", "scheduler-test-server", "erinoverview", "secret")
+
+    class Client:
+        def create_egeria_bearer_token(self, user, password):
+            pass
+
+        def find_collections(self, search, output_format="DICT"):
+            return [{"GUID": "c1"}]
+
+    manager = EgeriaTechClientManager(cfg, client_factory=lambda c: Client())
+    service = CollectionService(cfg, manager=manager)
+    with request_priority(BACKGROUND):
+        service.list_collections("sched", refresh=True)
+    assert service.scheduler.stats()["admitted"]["background"] == 1
@@ -0,0 +1,78 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file is a unit test for my_egeria.
+
+
+"""
+
+from utils.search_index import IndexedRows, SearchIndex, tokenize
+
+ROWS = [
+    ("g1", "Sales Data", "Collection::Sales-Data", "Quarterly revenue by region"),
+    ("g2", "Clinical Trials", "Collection::ClinicalTrials", "Drug trial results"),
+    ("g3", "Data Products", "Collection::DataProducts", "Marketplace of sales datasets"),
+]
+
+
+def test_tokenize_splits_qualified_names():
+    assert tokenize("Collection::Sales-Data v2") == ["collection", "sales", "data", "v2"]
+
+
+def test_prefix_substring_and_conjunction():
+    index = SearchIndex()
+    for row in ROWS:
+        index.add(row[0], row[1:])
+
+    assert index.search("sal") == ["g1", "g3"]  # token prefix
+    assert index.search("inical") == ["g2"]  # substring inside a token
+    assert index.search("sales data") == ["g1", "g3"]  # every token must match
+    assert index.search("sales trial") == []
+    assert index.search("") == ["g1", "g2", "g3"]
+    assert index.search("zz") == []
+
+
+def test_index_sees_rows_added_after_a_search():
+    index = SearchIndex()
+    index.add("a", ["alpha"])
+    assert index.search("alp") == ["a"]
+    index.add("b", ["alpine"])
+    assert index.search("alp") == ["a", "b"]
+
+
+def test_indexed_rows_filters_and_knows_when_to_ask_the_server():
+    rows = IndexedRows(text_columns=(1, 2, 3))
+    rows.set_rows(ROWS, complete=True)
+
+    assert [r[0] for r in rows.visible("region")] == ["g1"]
+    assert rows.query == "region"
+    assert not rows.needs_server("anything") and not rows.needs_server("")
+
+    rows.set_rows(ROWS[:1], complete=False)
+    assert rows.needs_server("clinical")
+    assert rows.needs_server("")  # clearing a server search reloads the full listing
+    assert [r[0] for r in rows.visible("")] == ["g1"]
+
+
+def test_server_search_results_are_shown_as_returned():
+    rows = IndexedRows(text_columns=(1, 2, 3))
+    # The server matched "clinical" on fields the local index does not cover
+    rows.set_rows(ROWS, complete=False, answers="clinical")
+    rows.query = "Clinical"
+    assert [r[0] for r in rows.visible()] == [r[0] for r in ROWS]
+    assert [r[0] for r in rows.visible("region")] == ["g1"]  # typing on narrows locally
+
+    rows.set_rows(ROWS, complete=True, answers="clinical")  # a full listing is filtered as usual
+    assert rows.visible("clinical") != rows.visible("")
+
+
+def test_large_index_lookup_is_proportional_to_matches():
+    rows = IndexedRows(text_columns=(1, 2))
+    rows.set_rows(
+        ((f"g{i}", f"Element {i}", f"Collection::Bucket{i % 100}::Item{i}") for i in range(20000)),
+        complete=True,
+    )
+    assert len(rows.visible("bucket42")) == 200
+    assert len(rows.visible("item19999")) == 1
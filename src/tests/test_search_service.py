@@ -0,0 +1,110 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file is a unit test for my_egeria.
+
+
+"""
+
+import asyncio
+from contextlib import aclosing
+
+import pytest
+
+from services import search_service
+from services.search_service import SOURCES, UnifiedSearchService, score_match
+from utils.config import EgeriaConfig
+from utils.egeria_client import EgeriaTechClientManager
+from utils.response_cache import get_response_cache
+
+CFG = EgeriaConfig(
+    platform_url="https://localhost:9443",
+    view_server="omnibox-test-server",
+    user="erinoverview",
+    password="secret",
+)
+
+
+class FanOutClient:
+    def __init__(self, slow_delay=0.0):
+        self.slow_delay = slow_delay
+        self.cancelled = []
+
+    def create_egeria_bearer_token(self, user, password):
+        pass
+
+    async def _async_find_glossaries(self, search, output_format="JSON"):
+        return [{"guid": "gl1", "displayName": "Sales Glossary"}]
+
+    async def _async_find_glossary_terms(self, search, output_format="JSON"):
+        await asyncio.sleep(0.01)
+        return [{"guid": "t1", "displayName": "Sales"}]
+
+    async def _async_find_collections(self, search, output_format="JSON"):
+        return "No elements found"
+
+    async def _async_find_technology_types(self, search, output_format="JSON"):
+        raise ValueError("tech types unavailable")
+
+    async def _async_find_governance_definitions(self, search, output_format="JSON"):
+        try:
+            await asyncio.sleep(self.slow_delay)
+        except asyncio.CancelledError:
+            self.cancelled.append(search)
+            raise
+        return [{"guid": "gd1", "title": "Sales retention policy"}]
+
+
+@pytest.fixture(autouse=True)
+def report_specs(monkeypatch):
+    monkeypatch.setattr(
+        search_service,
+        "_report_specs",
+        lambda: [{"name": "Sales-Summary", "family": "Sales"}, {"name": "Assets", "family": "Catalog"}],
+    )
+    monkeypatch.setitem(search_service._LOCAL_SOURCES, "report_spec_list", search_service._report_specs)
+
+
+def _service(client):
+    get_response_cache().clear()
+    manager = EgeriaTechClientManager(CFG, client_factory=lambda cfg: client)
+    return UnifiedSearchService(CFG, manager=manager)
+
+
+def test_batches_stream_in_as_sources_answer():
+    service = _service(FanOutClient(slow_delay=0.05))
+
+    async def collect():
+        return [batch async for batch in service.search("sales")]
+
+    batches = asyncio.run(collect())
+    kinds = [b.source.kind for b in batches]
+    assert sorted(kinds) == sorted(s.kind for s in SOURCES)
+    assert kinds[-1] == "Governance Definition"  # the slowest source lands last
+    errors = {b.source.kind: b.error for b in batches if b.error}
+    assert list(errors) == ["Technology Type"]
+    hits = sorted(h for b in batches for h in b.hits)
+    assert [h.guid for h in hits] == ["t1", "gl1", "gd1", ""]
+    assert hits[-1].display_name == "Sales-Summary"  # local report spec, filtered to matches
+
+
+def test_refining_cancels_slow_sources():
+    client = FanOutClient(slow_delay=5)
+    service = _service(client)
+
+    async def first_batch_then_refine():
+        async with aclosing(service.search("sal")) as batches:
+            async for _ in batches:
+                break
+        await asyncio.sleep(0)
+
+    asyncio.run(asyncio.wait_for(first_batch_then_refine(), 2))
+    assert client.cancelled == ["sal"]
+
+
+def test_score_prefers_name_matches():
+    assert score_match("sales", "Sales", "", "") > score_match("sales", "Sales Data", "", "")
+    assert score_match("sales", "Sales Data", "", "") > score_match("data", "Sales Data", "", "")
+    assert score_match("sales", "Other", "Collection::Sales", "") > score_match("sales", "Other", "", "sales")
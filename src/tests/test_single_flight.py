@@ -0,0 +1,142 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file is a unit test for my_egeria.
+
+
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from utils.scheduler import BACKGROUND, VISIBLE_PREFETCH, RequestScheduler, request_priority
+from utils.single_flight import SingleFlight
+
+
+def test_concurrent_sync_calls_share_one_request():
+    flight = SingleFlight()
+    calls = []
+    start = threading.Barrier(10)
+    results = []
+
+    def fetch():
+        calls.append(1)
+        time.sleep(0.1)
+        return {"rows": [1, 2, 3]}
+
+    def worker():
+        start.wait()
+        results.append(flight.do(("scope", "find_collections", ("*",)), fetch))
+
+    threads = [threading.Thread(target=worker) for _ in range(10)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1
+    assert len(results) == 10
+    assert all(r == {"rows": [1, 2, 3]} for r in results)
+    # Every caller gets its own copy to modify
+    assert len({id(r) for r in results}) == len({id(r["rows"]) for r in results}) == 10
+    assert flight.in_flight() == 0
+
+
+def test_followers_receive_the_leaders_exception():
+    flight = SingleFlight()
+    started = threading.Event()
+    errors = []
+
+    def fetch():
+        started.set()
+        time.sleep(0.05)
+        raise ConnectionError("down")
+
+    def follower():
+        started.wait()
+        try:
+            flight.do("k", lambda: "unused")
+        except ConnectionError as e:
+            errors.append(e)
+
+    t = threading.Thread(target=follower)
+    t.start()
+    with pytest.raises(ConnectionError):
+        flight.do("k", fetch)
+    t.join()
+    assert len(errors) == 1
+
+
+def test_async_calls_share_and_survive_leader_cancellation():
+    flight = SingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "payload"
+
+    async def main():
+        leader = asyncio.create_task(flight.ado("k", fetch))
+        await asyncio.sleep(0)
+        followers = [asyncio.create_task(flight.ado("k", fetch)) for _ in range(5)]
+        await asyncio.sleep(0)
+        leader.cancel()
+        return await asyncio.gather(*followers)
+
+    assert asyncio.run(main()) == ["payload"] * 5
+    assert len(calls) == 1
+
+
+def test_forget_detaches_in_flight_reads_for_scope():
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def slow():
+        calls.append("slow")
+        release.wait(1)
+        return "stale"
+
+    t = threading.Thread(target=flight.do, args=(("s", "find_collections", ()), slow))
+    t.start()
+    while flight.in_flight() == 0:
+        time.sleep(0.001)
+    flight.forget("s", ["find_collections"])
+    assert flight.do(("s", "find_collections", ()), lambda: "fresh") == "fresh"
+    release.set()
+    t.join()
+
+
+def test_interactive_follower_raises_a_background_flight():
+    flight = SingleFlight()
+    scheduler = RequestScheduler("test", limit=1)
+    order = []
+
+    async def call(name, hold=0.0):
+        async with scheduler.aslot():
+            order.append(name)
+            await asyncio.sleep(hold)
+        return name
+
+    async def main():
+        busy = asyncio.ensure_future(call("busy", hold=0.05))
+        await asyncio.sleep(0.01)
+        with request_priority(VISIBLE_PREFETCH):
+            prefetch = asyncio.ensure_future(call("prefetch"))
+        with request_priority(BACKGROUND):
+            warmup = asyncio.ensure_future(flight.ado("k", lambda: call("shared")))
+        await asyncio.sleep(0.01)
+        assert scheduler.stats()["queue_depth"] == 2
+        click = await flight.ado("k", lambda: call("unused"))  # the user opens the same item
+        await asyncio.gather(busy, prefetch, warmup)
+        return click
+
+    assert asyncio.run(main()) == "shared"
+    assert order == ["busy", "shared", "prefetch"]
+    assert scheduler.stats()["admitted"]["interactive"] == 2
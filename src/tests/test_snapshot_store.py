@@ -0,0 +1,69 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file is a unit test for my_egeria.
+
+
+"""
+
+from services.collection_service import CollectionService
+from utils import snapshot_store
+from utils.config import EgeriaConfig
+from utils.egeria_client import EgeriaTechClientManager
+from utils.response_cache import get_response_cache
+from utils.snapshot_store import SnapshotStore, format_age
+
+CFG = EgeriaConfig(
+    platform_url="https://localhost:9443",
+    view_server="snapshot-test-server",
+    user="erinoverview",
+    password="secret",
+)
+
+
+def test_store_records_responses_and_reports_age(tmp_path):
+    store = SnapshotStore(str(tmp_path / "snap.db"))
+    res = {"elements": [{"GUID": "g1", "qualifiedName": "Collection::One", "displayName": "One"}]}
+    store.record("scope", "find_collections", '["*"]', res)
+    store.flush()
+
+    assert store.load("scope", "find_collections", '["*"]')[0] == res
+    assert store.age("scope") < 5
+    assert store.load("other-scope", "find_collections", '["*"]') is None
+
+    store.forget("scope", ["find_collections"])
+    store.flush()
+    assert store.load("scope", "find_collections", '["*"]') is None
+    store.close()
+
+
+def test_cold_start_peek_is_served_from_disk(tmp_path, monkeypatch):
+    store = SnapshotStore(str(tmp_path / "snap.db"))
+    monkeypatch.setattr(snapshot_store, "get_snapshot_store", lambda: store)
+    monkeypatch.setattr("services.base_service.get_snapshot_store", lambda: store)
+
+    class Client:
+        def create_egeria_bearer_token(self, user, password):
+            pass
+
+        def find_collections(self, search, output_format="JSON"):
+            return [{"GUID": "c1", "displayName": "Sales"}]
+
+    manager = EgeriaTechClientManager(CFG, client_factory=lambda cfg: Client())
+    CollectionService(CFG, manager=manager).list_collections("*")
+    store.flush()
+
+    # Simulate a new process: the in-memory cache is empty
+    get_response_cache().clear()
+    rows, age = CollectionService(CFG, manager=manager).peek_collections("*")
+    assert rows == [{"GUID": "c1", "displayName": "Sales"}]
+    assert age >= 0
+    store.close()
+
+
+def test_format_age():
+    assert format_age(5) == "5s"
+    assert format_age(125) == "2m"
+    assert format_age(7200) == "2h"
@@ -0,0 +1,77 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file is a unit test for my_egeria.
+
+
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from screens.lazy import LazyScreen, screen_class
+
+SRC_DIR = Path(__file__).resolve().parents[1]
+
+# Screens reached from the main menu: none of them should load before the user logs in
+DEFERRED_MODULES = [
+    "screens.main_menu",
+    "screens.glossary.glossary_browser",
+    "screens.collections.collection_browser",
+    "screens.GovernanceOfficer.governance_officer_browser",
+    "screens.GovernanceOfficer.marketplace_tree",
+    "screens.ProductManager.product_manager_browser",
+    "screens.omnibox_screen",
+]
+
+# Cumulative import time allowed for `import my_egeria`; override on slow machines
+IMPORT_BUDGET_MS = float(os.environ.get("EGERIA_IMPORT_BUDGET_MS", "1500"))
+
+
+def _import_times(stderr: str) -> dict:
+    """Parse `python -X importtime` output into {module: cumulative microseconds}."""
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_lazy_screen_imports_on_first_call(monkeypatch):
+    monkeypatch.delitem(sys.modules, "json.tool", raising=False)
+    entry = LazyScreen("json.tool:main")
+    assert "json.tool" not in sys.modules
+    assert repr(entry) == "LazyScreen('json.tool:main')"
+    assert screen_class(entry.path) is sys.modules["json.tool"].main
+
+
+def test_lazy_screen_builds_an_instance():
+    entry = LazyScreen("collections:OrderedDict")
+    assert entry(a=1) == {"a": 1}
+
+
+def test_my_egeria_start_up_defers_screens():
+    pytest.importorskip("textual")
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import my_egeria"],
+        cwd=SRC_DIR,
+        capture_output=True,
+        text=True,
+        env={**os.environ, "EGERIA_SNAPSHOT_DISABLED": "true"},
+        timeout=120,
+    )
+    assert proc.returncode == 0, f"import my_egeria failed: {proc.stderr.strip().splitlines()[-1]}"
+    times = _import_times(proc.stderr)
+
+    loaded = [name for name in DEFERRED_MODULES if name in times]
+    assert not loaded, f"imported at start-up: {loaded}"
+    total_ms = times["my_egeria"] / 1000
+    assert total_ms < IMPORT_BUDGET_MS, f"import my_egeria took {total_ms:.0f} ms (budget {IMPORT_BUDGET_MS:.0f} ms)"
@@ -0,0 +1,115 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file is a unit test for my_egeria.
+
+
+"""
+
+import asyncio
+
+from textual.app import App
+from textual.widgets import DataTable
+
+from widgets.table_updater import KeyedTableUpdater, keyed_rows, sync_table_rows
+
+
+class FakeTable:
+    """Records the DataTable calls made by the updater."""
+
+    def __init__(self):
+        self.ops = []
+
+    def clear(self):
+        self.ops.append(("clear",))
+
+    def add_row(self, *cells, key=None):
+        self.ops.append(("add", key))
+
+    def remove_row(self, key):
+        self.ops.append(("remove", key))
+
+    def update_cell(self, key, column, value):
+        self.ops.append(("update", key, column, value))
+
+
+COLUMNS = ["guid", "name", "qname"]
+
+
+def test_only_differences_are_applied():
+    table = FakeTable()
+    rows = sync_table_rows(table, COLUMNS, {}, keyed_rows([("g1", "A", "qa"), ("g2", "B", "qb")]))
+    table.ops.clear()
+
+    rows = sync_table_rows(
+        table, COLUMNS, rows, keyed_rows([("g1", "A", "qa"), ("g2", "B2", "qb"), ("g3", "C", "qc")])
+    )
+    assert table.ops == [("update", "g2", "name", "B2"), ("add", "g3")]
+
+    table.ops.clear()
+    rows = sync_table_rows(table, COLUMNS, rows, keyed_rows([("g2", "B2", "qb"), ("g3", "C", "qc")]))
+    assert table.ops == [("remove", "g1")]
+
+
+def test_unchanged_data_is_a_no_op_and_reorder_rebuilds():
+    table = FakeTable()
+    data = keyed_rows([("g1", "A", "qa"), ("g2", "B", "qb")])
+    rows = sync_table_rows(table, COLUMNS, {}, data)
+    table.ops.clear()
+    assert sync_table_rows(table, COLUMNS, rows, data) is rows
+    assert table.ops == []
+
+    sync_table_rows(table, COLUMNS, rows, keyed_rows([("g2", "B", "qb"), ("g1", "A", "qa")]))
+    assert table.ops[0] == ("clear",)
+
+    # DataTable can only append: a row inserted above the others also rebuilds
+    table.ops.clear()
+    sync_table_rows(table, COLUMNS, rows, keyed_rows([("g0", "Z", "qz")]) + data)
+    assert table.ops == [("clear",), ("add", "g0"), ("add", "g1"), ("add", "g2")]
+
+
+def test_narrowing_filter_rebuilds_instead_of_removing_row_by_row():
+    table = FakeTable()
+    rows = sync_table_rows(table, COLUMNS, {}, keyed_rows([(f"g{i}", "A", "q") for i in range(100)]))
+    table.ops.clear()
+
+    sync_table_rows(table, COLUMNS, rows, keyed_rows([("g1", "A", "q"), ("g2", "A", "q")]))
+    assert table.ops == [("clear",), ("add", "g1"), ("add", "g2")]
+
+
+def test_keyed_rows_handles_missing_and_duplicate_keys():
+    assert [k for k, _ in keyed_rows([("", "x"), ("g", "y"), ("g", "z")])] == ["row-0", "g", "g#1"]
+
+
+def test_updater_keeps_the_cursor_row_in_place():
+    class TableApp(App):
+        def compose(self):
+            yield DataTable(id="t")
+
+    async def scenario():
+        app = TableApp()
+        async with app.run_test(size=(60, 12)) as pilot:
+            table = app.query_one("#t", DataTable)
+            table.add_columns("GUID", "Name", "Qualified Name")
+            updater = KeyedTableUpdater(table, key_index=(0, 2))
+            data = [(f"g{i}", f"N{i}", f"q{i}") for i in range(50)]
+            assert updater.update(data)
+            table.move_cursor(row=30)
+            await pilot.pause()
+            top = table.scroll_y
+
+            # Two rows inserted above the cursor: it follows g30, and so does the viewport
+            assert updater.update([("g-a", "A", "qa"), ("", "B", "qb")] + data)
+            await pilot.pause()
+            assert table.coordinate_to_cell_key(table.cursor_coordinate).row_key.value == "g30"
+            assert table.scroll_y == top + 2
+            assert not updater.update([("g-a", "A", "qa"), ("", "B", "qb")] + data)
+
+            # The cursor row is deleted: the cursor stays at the same position
+            assert updater.update([("g-a", "A", "qa"), ("", "B", "qb")] + data[:30] + data[31:])
+            assert table.cursor_coordinate.row == 32
+            assert "qb" in updater.rows  # keyed by qualified name when the GUID is missing
+
+    asyncio.run(scenario())
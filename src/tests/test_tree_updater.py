@@ -0,0 +1,78 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file is a unit test for my_egeria.
+
+
+"""
+
+from textual.widgets import Tree
+
+from widgets.tree_updater import TreeSpec, TreeUpdater
+
+
+def _shape(node):
+    return [(c.label.plain, _shape(c)) for c in node.children]
+
+
+def _dictionary(subjects):
+    return [
+        TreeSpec(subject, children=[TreeSpec(t, data=f"qn:{t}", leaf=True) for t in terms], expand=True)
+        for subject, terms in subjects.items()
+    ]
+
+
+def test_unchanged_subtrees_keep_their_nodes_and_expansion():
+    tree = Tree("Dictionary")
+    updater = TreeUpdater(tree)
+    stats = updater.update(_dictionary({"Finance": ["Ledger", "Invoice"], "HR": ["Employee"]}))
+    assert stats.created == 5
+    finance, hr = tree.root.children
+    hr.collapse()
+
+    stats = updater.update(_dictionary({"Finance": ["Ledger", "Payment"], "HR": ["Employee"], "Sales": ["Lead"]}))
+    assert (stats.created, stats.removed) == (3, 1)  # Payment, Sales and Lead in; Invoice out
+    assert tree.root.children[0] is finance and tree.root.children[1] is hr
+    assert not hr.is_expanded  # the user's collapse survives the refresh
+    assert _shape(tree.root) == [
+        ("Finance", [("Ledger", []), ("Payment", [])]),
+        ("HR", [("Employee", [])]),
+        ("Sales", [("Lead", [])]),
+    ]
+
+    assert not updater.update(_dictionary({"Finance": ["Ledger", "Payment"], "HR": ["Employee"], "Sales": ["Lead"]})).changed
+
+
+def test_reordering_moves_only_out_of_place_nodes():
+    tree = Tree("root")
+    updater = TreeUpdater(tree)
+    updater.update([TreeSpec(label, children=[TreeSpec(f"{label}1")]) for label in "abcde"])
+    a, b = tree.root.children[:2]
+    a.expand()
+    stats = updater.update([TreeSpec(label, children=[TreeSpec(f"{label}1")]) for label in "ebcda"])
+    assert [c.label.plain for c in tree.root.children] == list("ebcda")
+    assert tree.root.children[1] is b
+    assert (stats.moved, stats.created, stats.removed) == (2, 0, 0)  # a and e moved; b, c, d stayed put
+    # The moved subtree is the same node, expansion and children included
+    assert tree.root.children[4] is a and a.is_expanded
+    assert [c.label.plain for c in a.children] == ["a1"]
+
+
+def test_keys_track_relabelled_nodes():
+    tree = Tree("root")
+    updater = TreeUpdater(tree)
+    updater.update([TreeSpec("Old name", key="guid-1", data=1)], label="Catalog")
+    node = tree.root.children[0]
+    stats = updater.update([TreeSpec("New name", key="guid-1", data=2)], label="Catalog")
+    assert tree.root.children[0] is node
+    assert (node.label.plain, node.data, stats.updated) == ("New name", 2, 2)
+
+
+def test_textual_still_has_the_internals_moves_rely_on():
+    # TreeUpdater moves nodes through these; if Textual drops them, moves must be rewritten
+    tree = Tree("Dictionary")
+    node = tree.root.add("Finance")
+    assert tree.root._children == [node]
+    assert callable(tree._invalidate)
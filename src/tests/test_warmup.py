@@ -0,0 +1,163 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file is a unit test for my_egeria.
+
+
+"""
+
+import asyncio
+import threading
+
+from services import warmup
+from services.collection_service import CollectionService
+from services.glossary_service import GlossaryService
+from services.warmup import WarmUp
+from utils.config import EgeriaConfig
+from utils.egeria_client import EgeriaTechClientManager
+from utils.response_cache import get_response_cache
+
+CFG = EgeriaConfig(
+    platform_url="https://localhost:9443",
+    view_server="warmup-test-server",
+    user="erinoverview",
+    password="secret",
+)
+
+
+class FakeClient:
+    def __init__(self):
+        self.calls = []
+
+    def create_egeria_bearer_token(self, user, password):
+        self.calls.append("token")
+
+    def find_glossaries(self, search, output_format="DICT"):
+        self.calls.append("find_glossaries")
+        return [{"GUID": "g1", "displayName": "Glossary One"}]
+
+    def find_collections(self, search, output_format="DICT"):
+        self.calls.append("find_collections")
+        return [{"GUID": "c1", "displayName": "One"}, {"GUID": "c2", "displayName": "Two"}]
+
+
+def test_warmup_signs_in_and_fills_the_cache_the_browsers_read():
+    get_response_cache().clear()
+    client = FakeClient()
+    manager = EgeriaTechClientManager(CFG, client_factory=lambda cfg: client)
+    stages = []
+    job = WarmUp(CFG, manager=manager, probe=lambda url, user: None, on_progress=stages.append)
+
+    asyncio.run(job.run())
+
+    assert stages == ["probe", "authenticate", "prefetch", "done"]
+    assert job.prefetched == {"glossaries": 1, "collections": 2}
+    assert client.calls[0] == "token"
+    # The browsers open on a cache hit
+    assert CollectionService(CFG, manager=manager).peek_collections("*")[0][0]["GUID"] == "c1"
+    assert GlossaryService(CFG, manager=manager).peek_glossaries("*") is not None
+
+
+def test_unreachable_platform_stops_before_signing_in():
+    client = FakeClient()
+    manager = EgeriaTechClientManager(CFG, client_factory=lambda cfg: client)
+
+    def probe(url, user):
+        raise ConnectionError("down")
+
+    job = WarmUp(CFG, manager=manager, probe=probe)
+    asyncio.run(job.run())
+
+    assert job.stage == "failed"
+    assert isinstance(job.error, ConnectionError)
+    assert client.calls == []
+
+
+def test_changing_credentials_cancels_the_warmup(monkeypatch):
+    monkeypatch.setattr(warmup, "_WARMUP", None)
+    client = FakeClient()
+    manager = EgeriaTechClientManager(CFG, client_factory=lambda cfg: client)
+    release = threading.Event()
+
+    async def scenario():
+        job = warmup.start_warmup(CFG, manager=manager, probe=lambda url, user: release.wait(2))
+        await asyncio.sleep(0.01)
+        assert warmup.keep_warmup_for(CFG.with_overrides()) is True
+        assert warmup.keep_warmup_for(CFG.with_overrides(user="garygeeke")) is False
+        release.set()
+        await asyncio.sleep(0.05)
+        return job
+
+    job = asyncio.run(scenario())
+    assert job.stage == "cancelled"
+    assert warmup.get_warmup() is None
+    assert client.calls == []  # never signed in as the abandoned user
+
+
+def test_warmup_comes_back_when_the_form_returns_to_its_connection(monkeypatch):
+    monkeypatch.setattr(warmup, "_WARMUP", None)
+    monkeypatch.setattr(warmup, "_SET_ASIDE", None)
+    manager = EgeriaTechClientManager(CFG, client_factory=lambda cfg: FakeClient())
+    release = threading.Event()
+
+    async def scenario():
+        first = warmup.start_warmup(CFG, manager=manager, probe=lambda url, user: release.wait(2))
+        await asyncio.sleep(0.01)
+        assert warmup.keep_warmup_for(CFG.with_overrides(user="e")) is False
+        assert warmup.get_warmup() is None
+        assert warmup.keep_warmup_for(CFG.with_overrides()) is True
+        again = warmup.get_warmup()
+        release.set()
+        await asyncio.sleep(0.05)
+        return first, again
+
+    first, again = asyncio.run(scenario())
+    assert first.stage == "cancelled"
+    assert again is not first and again.stage == "done"
+
+
+def test_typing_the_default_user_keeps_the_warmup(monkeypatch):
+    from textual.app import App
+    from textual.widgets import Input
+    from screens import login_screen
+    from utils import config
+
+    monkeypatch.setattr(warmup, "_WARMUP", None)
+    monkeypatch.setattr(warmup, "_SET_ASIDE", None)
+    monkeypatch.setattr(config, "_current_config", CFG)
+    monkeypatch.setattr(login_screen, "WARMUP_CHECK_SECONDS", 0.3)
+    for name, value in (
+        ("EGERIA_USER", CFG.user),
+        ("EGERIA_USER_PASSWORD", CFG.password),
+        ("EGERIA_PLATFORM_URL", CFG.platform_url),
+        ("EGERIA_VIEW_SERVER", CFG.view_server),
+    ):
+        monkeypatch.setenv(name, value)
+    manager = EgeriaTechClientManager(CFG, client_factory=lambda cfg: FakeClient())
+    release = threading.Event()
+
+    class LoginApp(App):
+        async def on_mount(self):
+            await self.push_screen(login_screen.LoginScreen())
+
+    async def scenario():
+        job = warmup.start_warmup(CFG, manager=manager, probe=lambda url, user: release.wait(5))
+        try:
+            async with LoginApp().run_test() as pilot:
+                await pilot.pause(0.4)
+                username = pilot.app.screen.query_one("#username", Input)
+                username.value = ""
+                await pilot.press(*CFG.user)  # "e", "er", ... never the warmed user until the end
+                await pilot.pause(0.4)
+                assert username.value == CFG.user
+                assert warmup.get_warmup() is job and job.running
+
+                await pilot.press("x")  # settles on another user: the warm-up stops
+                await pilot.pause(0.4)
+                assert warmup.get_warmup() is None
+        finally:
+            release.set()
+
+    asyncio.run(scenario())
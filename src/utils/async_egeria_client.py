@@ -0,0 +1,98 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file provides a native asyncio client manager for my_egeria.
+
+
+"""
+
+import asyncio
+import inspect
+from typing import Any, Awaitable, Callable, Optional, Tuple
+
+from .circuit_breaker import is_transport_failure
+from .egeria_client import EgeriaTechClientManager, is_auth_failure
+
+
+class NativeAsyncUnavailable(AttributeError):
+    """The client has no `_async_` coroutine for the requested operation."""
+
+
+class AsyncEgeriaClientManager:
+    """
+    Awaits pyegeria's `_async_*` coroutines directly on the running event loop.
+
+    Wraps an EgeriaTechClientManager so the client, token and circuit breaker are shared
+    with the synchronous path. Only the cold path (first client build, token renewal)
+    runs in a worker thread; steady-state calls never leave the event loop.
+    """
+
+    def __init__(self, manager: EgeriaTechClientManager, *, timeout: float = 8.0):
+        self.manager = manager
+        self.timeout = timeout
+
+    async def get_client(self) -> Any:
+        client = self.manager._client
+        if client is not None and not self.manager._token_expired():
+            self.manager.touch()
+            return client
+        # Builds/authenticates single-flight under the manager's lock
+        return await asyncio.to_thread(self.manager.get_client)
+
+    async def invoke(
+        self, method_name: str, args: Tuple = (), kwargs: Optional[dict] = None
+    ) -> Any:
+        """
+        Await client.<method_name>(*args, **kwargs), retrying once after a token refresh
+        if the server rejected the token.
+        Raises NativeAsyncUnavailable if the method is missing or not a coroutine function.
+        """
+        kwargs = kwargs or {}
+        breaker = self.manager.breaker
+        if self.manager._client is not None:
+            _coroutine(self.manager._client, method_name)  # fall back before taking a breaker trial
+        trial = breaker.check()
+        reported = False
+        try:
+            try:
+                client = await self.get_client()
+                generation = self.manager._auth_generation
+                try:
+                    result = await self._await_call(client, method_name, args, kwargs)
+                except NativeAsyncUnavailable:
+                    raise
+                except Exception as e:
+                    if not is_auth_failure(e):
+                        raise
+                    await asyncio.to_thread(self.manager.refresh_token, generation)
+                    client = await self.get_client()
+                    result = await self._await_call(client, method_name, args, kwargs)
+            except NativeAsyncUnavailable:
+                raise
+            except Exception as e:
+                reported = True
+                if is_transport_failure(e):
+                    breaker.record_failure(e)
+                else:
+                    breaker.record_success()
+                raise
+            reported = True
+            breaker.record_success()
+            return result
+        finally:
+            if not reported:
+                # Cancelled, or the client has no such coroutine: no verdict on the server
+                breaker.release_trial(trial)
+
+    async def _await_call(self, client: Any, method_name: str, args: Tuple, kwargs: dict) -> Any:
+        fn = _coroutine(client, method_name)
+        return await asyncio.wait_for(fn(*args, **kwargs), timeout=self.timeout)
+
+
+def _coroutine(client: Any, method_name: str) -> Callable[..., Awaitable[Any]]:
+    fn = getattr(client, method_name, None)
+    if fn is None or not inspect.iscoroutinefunction(fn):
+        raise NativeAsyncUnavailable(f"Client has no coroutine '{method_name}'")
+    return fn
@@ -0,0 +1,221 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file provides a per-server circuit breaker for my_egeria.
+
+
+"""
+
+import socket
+import sys
+import threading
+import time
+from typing import Callable, Optional, Tuple
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+
+class CircuitOpenError(ConnectionError):
+    """Raised without contacting the server while its circuit is open."""
+
+
+# Socket-level failures; plain ConnectionError/OSError are also raised for local problems
+# (missing files, our own "unexpected response" errors) and do not count
+_SOCKET_ERRORS = (
+    TimeoutError,
+    ConnectionRefusedError,
+    ConnectionResetError,
+    ConnectionAbortedError,
+    BrokenPipeError,
+    socket.gaierror,
+)
+
+
+def _is_transport_error(exc: BaseException) -> bool:
+    if isinstance(exc, _SOCKET_ERRORS):
+        return True
+    httpx = sys.modules.get("httpx")  # if httpx was never imported, none of its errors exist
+    if httpx is not None and isinstance(exc, httpx.TransportError):
+        return True
+    if type(exc).__module__ == "builtins":
+        return False
+    # Client libraries (pyegeria, requests) raise their own connection/timeout types
+    name = type(exc).__name__.lower()
+    return "connect" in name or "timeout" in name
+
+
+def is_transport_failure(exc: BaseException) -> bool:
+    """
+    True for failures that say something about server health (unreachable, timed out):
+    socket errors, httpx transport errors and client-library connection/timeout types,
+    also when wrapped (raise ... from e). Method-resolution misses (AttributeError/TypeError),
+    validation errors and local OS errors do not count.
+    """
+    seen = set()
+    while exc is not None and id(exc) not in seen:
+        if isinstance(exc, CircuitOpenError):
+            return False
+        if _is_transport_error(exc):
+            return True
+        seen.add(id(exc))
+        exc = exc.__cause__
+    return False
+
+
+class CircuitBreaker:
+    """
+    Closed -> open after failure_threshold consecutive transport failures.
+    While open, calls fail immediately; after reset_timeout seconds a background probe
+    (if supplied) checks the server, and the breaker moves to half-open. One trial call is
+    let through in half-open: success closes the circuit, failure re-opens it. A trial
+    that ends without a verdict (cancelled, or never reached the server) is handed back
+    with release_trial() so the next call can be the trial; one whose holder never reports
+    back is given up after reset_timeout.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        failure_threshold: int = 3,
+        reset_timeout: float = 15.0,
+        probe: Optional[Callable[[], None]] = None,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.probe = probe
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._trials = 0  # numbers the half-open trials, so a stale holder cannot release a newer one
+        self._trial_started = 0.0
+        self._probe_timer: Optional[threading.Timer] = None
+        self.last_error: Optional[str] = None
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == OPEN and self.probe is None and self._cooled_down():
+                # Without a background probe, let the next caller act as the probe
+                self._state = HALF_OPEN
+            return self._state
+
+    def _cooled_down(self) -> bool:
+        return (time.monotonic() - self._opened_at) >= self.reset_timeout
+
+    def allow(self) -> bool:
+        """Whether a call may go to the server right now."""
+        return self._enter() is not None
+
+    def _enter(self) -> Optional[int]:
+        # None: refused; 0: the circuit is closed; otherwise the number of the trial taken
+        state = self.state
+        with self._lock:
+            if state == CLOSED:
+                return 0
+            if state == HALF_OPEN and not (self._trial_in_flight and not self._trial_abandoned()):
+                self._trial_in_flight = True
+                self._trials += 1
+                self._trial_started = time.monotonic()
+                return self._trials
+            return None
+
+    def _trial_abandoned(self) -> bool:
+        # Callers hold self._lock
+        return (time.monotonic() - self._trial_started) >= self.reset_timeout
+
+    def check(self) -> int:
+        """
+        Raise CircuitOpenError unless a call may go ahead. Returns the half-open trial the
+        call holds (0 when the circuit is closed) for release_trial().
+        """
+        trial = self._enter()
+        if trial is None:
+            raise CircuitOpenError(
+                f"Egeria server {self.name} is unavailable (circuit {self._state}); "
+                f"last error: {self.last_error}"
+            )
+        return trial
+
+    def release_trial(self, trial: int) -> None:
+        """Hand back a trial that ended without record_success() or record_failure()."""
+        with self._lock:
+            if trial and trial == self._trials:
+                self._trial_in_flight = False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = CLOSED
+            self._failures = 0
+            self._trial_in_flight = False
+            self.last_error = None
+
+    def record_failure(self, exc: Optional[BaseException] = None) -> None:
+        with self._lock:
+            if exc is not None:
+                self.last_error = str(exc)
+            self._trial_in_flight = False
+            self._failures += 1
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                self._trip()
+
+    def _trip(self) -> None:
+        # Callers hold self._lock
+        self._state = OPEN
+        self._opened_at = time.monotonic()
+        if self.probe is not None and self._probe_timer is None:
+            self._probe_timer = threading.Timer(self.reset_timeout, self._run_probe)
+            self._probe_timer.daemon = True
+            self._probe_timer.start()
+
+    def _run_probe(self) -> None:
+        with self._lock:
+            self._probe_timer = None
+        try:
+            self.probe()
+        except Exception as e:
+            with self._lock:
+                self.last_error = str(e)
+                self._trip()
+            return
+        with self._lock:
+            if self._state == OPEN:
+                self._state = HALF_OPEN
+
+    def reset(self) -> None:
+        with self._lock:
+            if self._probe_timer is not None:
+                self._probe_timer.cancel()
+                self._probe_timer = None
+            self._state = CLOSED
+            self._failures = 0
+            self._trial_in_flight = False
+            self.last_error = None
+
+
+_BREAKERS: dict[Tuple[str, str], CircuitBreaker] = {}
+_BREAKERS_LOCK = threading.Lock()
+
+
+def get_circuit_breaker(
+    platform_url: str,
+    view_server: str,
+    probe: Optional[Callable[[], None]] = None,
+) -> CircuitBreaker:
+    """Return the process-wide breaker for a view server, creating it on first use."""
+    key = (platform_url.rstrip("/"), view_server)
+    with _BREAKERS_LOCK:
+        breaker = _BREAKERS.get(key)
+        if breaker is None:
+            breaker = CircuitBreaker(f"{view_server}@{key[0]}", probe=probe)
+            _BREAKERS[key] = breaker
+        elif breaker.probe is None and probe is not None:
+            breaker.probe = probe
+        return breaker
@@ -22,6 +22,9 @@ class EgeriaConfig:
     user: str
     password: str
     token_ttl_seconds: int = 900  # refresh proactively every 15 minutes by default
+    token_refresh_margin_seconds: int = 60  # background refresh this long before expiry
+    page_size: int = 100  # elements per request when streaming paged results
+    bulk_concurrency: int = 8  # parallel requests for many-GUID lookups
 
     @staticmethod
     def from_env() -> "EgeriaConfig":
@@ -39,6 +42,9 @@ class EgeriaConfig:
             user=os.getenv("EGERIA_USER", "erinoverview"),
             password=os.getenv("EGERIA_USER_PASSWORD", "secret"),
             token_ttl_seconds=int(os.getenv("EGERIA_TOKEN_TTL_SECONDS", "900")),
+            token_refresh_margin_seconds=int(os.getenv("EGERIA_TOKEN_REFRESH_MARGIN_SECONDS", "60")),
+            page_size=int(os.getenv("EGERIA_PAGE_SIZE", "100")),
+            bulk_concurrency=int(os.getenv("EGERIA_BULK_CONCURRENCY", "8")),
         )
 
     def with_overrides(
@@ -49,6 +55,9 @@ class EgeriaConfig:
         user: Optional[str] = None,
         password: Optional[str] = None,
         token_ttl_seconds: Optional[int] = None,
+        token_refresh_margin_seconds: Optional[int] = None,
+        page_size: Optional[int] = None,
+        bulk_concurrency: Optional[int] = None,
     ) -> "EgeriaConfig":
         return EgeriaConfig(
             platform_url=platform_url or self.platform_url,
@@ -58,6 +67,13 @@ class EgeriaConfig:
             token_ttl_seconds=(
                 token_ttl_seconds if token_ttl_seconds is not None else self.token_ttl_seconds
             ),
+            token_refresh_margin_seconds=(
+                token_refresh_margin_seconds
+                if token_refresh_margin_seconds is not None
+                else self.token_refresh_margin_seconds
+            ),
+            page_size=page_size if page_size is not None else self.page_size,
+            bulk_concurrency=bulk_concurrency if bulk_concurrency is not None else self.bulk_concurrency,
         )
 
 
@@ -10,19 +10,19 @@
 
 import asyncio
 import os
+import threading
 import time
 from typing import Any, Callable, Optional, Tuple
 from urllib.parse import quote
 
-# import requests
-
 from typing import TYPE_CHECKING
 
 # Only for type checkers; avoids importing pyegeria at runtime during test collection
 if TYPE_CHECKING:
     from pyegeria import EgeriaTech as _EgeriaTechType  # noqa: F401
 
-from .config import EgeriaConfig, get_global_config
+from .config import EgeriaConfig, get_global_config, set_global_config
+from .circuit_breaker import CircuitBreaker, get_circuit_breaker, is_transport_failure
 
 
 # Registry to track all managers for clean shutdown
@@ -40,6 +40,49 @@ def close_all_managers() -> None:
         except Exception:
             pass
     _MANAGER_REGISTRY.clear()
+    _CLIENT_POOL.clear()
+
+
+_AUTH_NAME_HINTS = ("unauthorized", "notauthorized", "unauthenticated", "authentication", "token")
+_AUTH_TEXT_HINTS = ("401", "unauthorized", "token expired", "invalid token", "expired token")
+
+
+def _status_code(exc: BaseException) -> Optional[int]:
+    # httpx/requests errors carry a response; pyegeria's exceptions a related_http_code
+    response = getattr(exc, "response", None)
+    for code in (
+        getattr(exc, "status_code", None),
+        getattr(exc, "related_http_code", None),
+        getattr(response, "status_code", None),
+    ):
+        try:
+            if code is not None:
+                return int(code)
+        except (TypeError, ValueError):
+            continue
+    return None
+
+
+def is_auth_failure(exc: BaseException) -> bool:
+    """
+    True if the server rejected the bearer token (HTTP 401 or a client-library
+    "unauthorized"/token error), also when wrapped (raise ... from e). Only these are
+    worth a token refresh and retry; not-found, validation and signature errors are not.
+    """
+    seen = set()
+    while exc is not None and id(exc) not in seen:
+        code = _status_code(exc)
+        if code is not None:
+            if code == 401:
+                return True
+        else:
+            name = type(exc).__name__.lower()
+            text = str(exc).lower()
+            if any(h in name for h in _AUTH_NAME_HINTS) or any(h in text for h in _AUTH_TEXT_HINTS):
+                return True
+        seen.add(id(exc))
+        exc = exc.__cause__
+    return False
 
 
 def _bool_env(name: str, default: bool = True) -> bool:
@@ -55,29 +98,61 @@ def _build_origin_url(platform_url: str, user: str) -> str:
     return f"{base}/open-metadata/platform-services/users/{user_q}/server-platform/origin"
 
 
+def origin_error(url: str, exc: BaseException) -> ConnectionError:
+    """The ConnectionError a failed origin request (sync or async httpx) is reported as."""
+    import httpx
+
+    if isinstance(exc, httpx.ConnectError) and "CERTIFICATE_VERIFY_FAILED" in str(exc):
+        return ConnectionError(
+            f"TLS verification failed for {url}. Set EGERIA_SSL_VERIFY=false for local dev if using self-signed certs."
+        )
+    if isinstance(exc, httpx.TimeoutException):
+        return ConnectionError(f"Preflight timeout contacting {url}")
+    return ConnectionError(f"Preflight error contacting {url}: {exc}")
+
+
+def check_origin_response(url: str, status_code: int) -> None:
+    # Any 2xx is fine; otherwise raise with details
+    if not (200 <= status_code < 300):
+        raise ConnectionError(f"Preflight failed ({status_code}) for {url}")
+
+
 def preflight_origin(platform_url: str, user: str, *, timeout: float = 3.0) -> None:
     """
     Quick connectivity check to Egeria platform origin endpoint with a short timeout.
-    Raises ConnectionError if not reachable in time.
+    Raises ConnectionError if not reachable in time. Blocking: UI code should use the
+    cached, async utils.health probe instead.
     """
     if not platform_url or "://" not in platform_url:
         raise ConnectionError(f"Malformed EGERIA_PLATFORM_URL: {platform_url!r}")
 
+    import httpx  # on first use, to keep app start-up light
+
     url = _build_origin_url(platform_url, user)
     verify_ssl = _bool_env("EGERIA_SSL_VERIFY", True)
-    # try:
-    #     resp = requests.get(url, timeout=timeout, verify=verify_ssl)
-    #     # Any 2xx is fine; otherwise let it raise with details
-    #     if not (200 <= resp.status_code < 300):
-    #         raise ConnectionError(f"Preflight failed ({resp.status_code}) for {url}")
-    # except requests.exceptions.SSLError as e:
-    #     raise ConnectionError(
-    #         f"TLS verification failed for {url}. Set EGERIA_SSL_VERIFY=false for local dev if using self-signed certs."
-    #     ) from e
-    # except requests.exceptions.Timeout as e:
-    #     raise ConnectionError(f"Preflight timeout contacting {url}") from e
-    # except requests.RequestException as e:
-    #     raise ConnectionError(f"Preflight error contacting {url}: {e}") from e
+    try:
+        resp = httpx.get(url, timeout=timeout, verify=verify_ssl)
+    except httpx.HTTPError as e:
+        raise origin_error(url, e) from e
+    check_origin_response(url, resp.status_code)
+
+
+_LOOP_POLICY_SET = False
+
+
+def _ensure_loop_policy() -> None:
+    """
+    Set a standard loop policy once, before the first pyegeria client is built, to avoid
+    deadlocks with nest_asyncio + run_coroutine_threadsafe.
+    """
+    global _LOOP_POLICY_SET
+    if _LOOP_POLICY_SET:
+        return
+    try:
+        asyncio.set_event_loop_policy(asyncio.DefaultEventLoopPolicy())
+    except Exception:
+        pass
+    _LOOP_POLICY_SET = True
 
 
 class EgeriaTechClientManager:
@@ -86,20 +161,63 @@ class EgeriaTechClientManager:
     - builds client from config
     - authenticates and caches token
     - refreshes token proactively (TTL) and reactively (on failures)
+
+    Client construction and token renewal are single-flight: concurrent callers
+    (e.g. several asyncio.to_thread workers) share one in-flight authentication.
     """
 
-    def __init__(self, config: Optional[EgeriaConfig] = None):
+    def __init__(
+        self,
+        config: Optional[EgeriaConfig] = None,
+        client_factory: Optional[Callable[[EgeriaConfig], Any]] = None,
+    ):
         self.config = config or get_global_config()
+        self._client_factory = client_factory
         self._client: Optional[Any] = None
         self._last_auth_ts: float = 0.0
+        self._last_used_ts: float = 0.0
+        self._lock = threading.RLock()
+        self._auth_generation: int = 0
+        self.auth_count: int = 0
+        # Shared per view server: every manager talking to a down server fails fast together
+        self.breaker: CircuitBreaker = get_circuit_breaker(
+            self.config.platform_url,
+            self.config.view_server,
+            probe=lambda: preflight_origin(self.config.platform_url, self.config.user, timeout=2.0),
+        )
         _register_manager(self)
 
+    def touch(self) -> None:
+        self._last_used_ts = time.time()
+
     def get_client(self) -> Any:
-        # Set a standard loop policy to avoid deadlocks with nest_asyncio + run_coroutine_threadsafe
-        try:
-            asyncio.set_event_loop_policy(asyncio.DefaultEventLoopPolicy())
-        except Exception:
-            pass
+        self.touch()
+        client = self._client
+        if client is not None and not self._token_expired():
+            return client
+
+        with self._lock:
+            # Re-check under the lock: another thread may have built or re-authenticated already
+            if self._client is None:
+                self._client = self._build_client()
+                self._authenticate()
+            elif self._token_expired():
+                self._authenticate()
+            return self._client
+
+    def _build_client(self) -> Any:
+        if self._client_factory is not None:
+            return self._client_factory(self.config)
+
+        # Fail fast on a platform the health probe just found down. No origin GET of our
+        # own: that is the breaker probe's job, and it would add a round trip to every build
+        from .health import recent_failure  # utils.health imports this module
+
+        down = recent_failure(self.config.platform_url, self.config.user)
+        if down is not None:
+            raise ConnectionError(down.error or f"Egeria platform {self.config.platform_url} is unreachable")
+
+        _ensure_loop_policy()
 
         # Import pyegeria lazily to avoid import-time config validation during test collection
         try:
@@ -110,42 +228,84 @@ class EgeriaTechClientManager:
                 "Ensure it is installed and configured if you call into the live client."
             ) from e
 
-        if self._client is None:
-            # Fast preflight to fail fast rather than hang
-            preflight_origin(self.config.platform_url, self.config.user, timeout=3.0)
-
-            # Build with explicit keyword arguments to avoid positional-order bugs
-            self._client = EgeriaTech(
-                view_server=self.config.view_server,
-                platform_url=self.config.platform_url,
-                user_id=self.config.user,
-                user_pwd=self.config.password,
-            )
-            self._authenticate()
-        elif self._token_expired():
-            self._authenticate()
-        return self._client
+        # Build with explicit keyword arguments to avoid positional-order bugs
+        return EgeriaTech(
+            view_server=self.config.view_server,
+            platform_url=self.config.platform_url,
+            user_id=self.config.user,
+            user_pwd=self.config.password,
+        )
 
     def _token_expired(self) -> bool:
         if self._last_auth_ts <= 0:
             return True
         return (time.time() - self._last_auth_ts) >= self.config.token_ttl_seconds
 
+    def seconds_until_expiry(self) -> float:
+        if self._last_auth_ts <= 0:
+            return 0.0
+        return self._last_auth_ts + self.config.token_ttl_seconds - time.time()
+
+    def has_session(self) -> bool:
+        """True while the manager holds a client whose token is still within its TTL."""
+        return self._client is not None and not self._token_expired()
+
+    def adopt(self, client: Any) -> bool:
+        """
+        Take over a client that was just built and authenticated elsewhere (the login check)
+        instead of building and authenticating another one on first use. A manager that
+        already has a live session keeps it and returns False; the caller closes client.
+        """
+        with self._lock:
+            if self.has_session():
+                return False
+            stale, self._client = self._client, client
+            self._last_auth_ts = time.time()
+            self._auth_generation += 1
+        if stale is not None and hasattr(stale, "close_session"):
+            try:
+                stale.close_session()
+            except Exception:
+                pass
+        return True
+
+    def idle_seconds(self) -> float:
+        if self._last_used_ts <= 0:
+            return float("inf")
+        return time.time() - self._last_used_ts
+
+    def needs_proactive_refresh(self) -> bool:
+        """True when a live session is within the configured margin of token expiry."""
+        if self._client is None or self._last_auth_ts <= 0:
+            return False
+        return self.seconds_until_expiry() <= self.config.token_refresh_margin_seconds
+
     def _authenticate(self) -> None:
+        # Callers hold self._lock
         if self._client and hasattr(self._client, "create_egeria_bearer_token"):
             self._client.create_egeria_bearer_token(self.config.user, self.config.password)
             self._last_auth_ts = time.time()
+            self._auth_generation += 1
+            self.auth_count += 1
 
-    def refresh_token(self) -> None:
-        self._authenticate()
+    def refresh_token(self, seen_generation: Optional[int] = None) -> None:
+        """
+        Renew the bearer token. When seen_generation is given and a renewal has completed
+        since the caller observed it, the caller reuses that token instead of authenticating again.
+        """
+        with self._lock:
+            if seen_generation is not None and seen_generation != self._auth_generation:
+                return
+            self._authenticate()
 
     def close(self) -> None:
-        if self._client and hasattr(self._client, "close_session"):
-            try:
-                self._client.close_session()
-            finally:
-                self._client = None
-                self._last_auth_ts = 0.0
+        with self._lock:
+            if self._client and hasattr(self._client, "close_session"):
+                try:
+                    self._client.close_session()
+                finally:
+                    self._client = None
+                    self._last_auth_ts = 0.0
         # Deregister on close to avoid registry growth
         try:
             _MANAGER_REGISTRY.remove(self)
@@ -156,13 +316,230 @@ class EgeriaTechClientManager:
         self, fn: Callable, args: Tuple = (), kwargs: Optional[dict] = None
     ):
         """
-        Call client function, retrying once on failure by refreshing the token.
+        Call client function, retrying once after a token refresh if the server rejected
+        the token (is_auth_failure); other errors are raised at once. Concurrent failures
+        triggered by the same stale token coalesce onto one refresh. While the server's
+        circuit is open the call fails immediately with CircuitOpenError.
         """
         kwargs = kwargs or {}
-        client = self.get_client()
+        trial = self.breaker.check()
+        reported = False
         try:
-            return fn(client, *args, **kwargs)
-        except Exception:
-            self.refresh_token()
-            client = self.get_client()
-            return fn(client, *args, **kwargs)
+            try:
+                client = self.get_client()
+                generation = self._auth_generation
+                try:
+                    result = fn(client, *args, **kwargs)
+                except Exception as e:
+                    if not is_auth_failure(e):
+                        raise
+                    self.refresh_token(seen_generation=generation)
+                    client = self.get_client()
+                    result = fn(client, *args, **kwargs)
+            except Exception as e:
+                reported = True
+                if is_transport_failure(e):
+                    self.breaker.record_failure(e)
+                else:
+                    # The server answered (e.g. API or signature error): it is healthy
+                    self.breaker.record_success()
+                raise
+            reported = True
+            self.breaker.record_success()
+            return result
+        finally:
+            if not reported:
+                self.breaker.release_trial(trial)  # interrupted: no verdict on the server
+
+
+PoolKey = Tuple[str, str, str]
+
+
+def _pool_key(config: EgeriaConfig) -> PoolKey:
+    return (config.platform_url.rstrip("/"), config.view_server, config.user)
+
+
+class EgeriaClientPool:
+    """
+    Process-wide pool of EgeriaTechClientManager instances.
+
+    Managers are keyed by (platform_url, view_server, user) and shared between all
+    services and screens that use the same connection, so navigating between screens
+    reuses one authenticated client instead of building a new one each time.
+    Managers are reference counted; a manager whose count drops to zero stays in the
+    pool (idle) until close_all_managers() runs at shutdown.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._managers: dict[PoolKey, EgeriaTechClientManager] = {}
+        self._refcounts: dict[PoolKey, int] = {}
+        self._hedge_managers: dict[PoolKey, EgeriaTechClientManager] = {}
+        # Replaced managers still referenced by screens: id -> (manager, refcount)
+        self._retired: dict[int, Tuple[EgeriaTechClientManager, int]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def acquire(self, config: Optional[EgeriaConfig] = None) -> "EgeriaTechClientManager":
+        cfg = config or get_global_config()
+        key = _pool_key(cfg)
+        stale: Optional[EgeriaTechClientManager] = None
+        with self._lock:
+            manager = self._managers.get(key)
+            if manager is not None and manager.config.password != cfg.password:
+                # Same identity with new credentials: the cached session is no longer valid.
+                # Screens still holding it keep using it until they release it; close it then.
+                refs = self._refcounts.get(key, 0)
+                if refs > 0:
+                    self._retired[id(manager)] = (manager, refs)
+                else:
+                    stale = manager
+                manager = None
+            if manager is None:
+                self.misses += 1
+                manager = EgeriaTechClientManager(cfg)
+                self._managers[key] = manager
+                self._refcounts[key] = 0
+            else:
+                self.hits += 1
+            self._refcounts[key] += 1
+        if stale is not None:
+            try:
+                stale.close()
+            except Exception:
+                pass
+        return manager
+
+    def adopt(self, config: EgeriaConfig, client: Any) -> "EgeriaTechClientManager":
+        """Hand an authenticated client for config to its pooled manager."""
+        manager = self.acquire(config)
+        try:
+            if not manager.adopt(client) and hasattr(client, "close_session"):
+                try:
+                    client.close_session()  # the pooled session stays; no need for two
+                except Exception:
+                    pass
+        finally:
+            self.release(manager)
+        return manager
+
+    def live_session(self, config: EgeriaConfig) -> Optional["EgeriaTechClientManager"]:
+        """The pooled manager for config if it is signed in with config's password."""
+        with self._lock:
+            manager = self._managers.get(_pool_key(config))
+        if manager is not None and manager.config.password == config.password and manager.has_session():
+            return manager
+        return None
+
+    def hedge_manager(self, config: Optional[EgeriaConfig] = None) -> "EgeriaTechClientManager":
+        """
+        A second manager (its own client and session) for the same connection, used by
+        hedged reads so the duplicate does not queue behind the slow call on one client.
+        """
+        cfg = config or get_global_config()
+        key = _pool_key(cfg)
+        stale: Optional[EgeriaTechClientManager] = None
+        with self._lock:
+            manager = self._hedge_managers.get(key)
+            if manager is not None and manager.config.password != cfg.password:
+                stale, manager = manager, None
+            if manager is None:
+                manager = EgeriaTechClientManager(cfg)
+                self._hedge_managers[key] = manager
+        if stale is not None:
+            try:
+                stale.close()
+            except Exception:
+                pass
+        return manager
+
+    def release(self, manager: "EgeriaTechClientManager") -> None:
+        stale: Optional[EgeriaTechClientManager] = None
+        with self._lock:
+            key = _pool_key(manager.config)
+            if self._managers.get(key) is manager and self._refcounts.get(key, 0) > 0:
+                self._refcounts[key] -= 1
+            elif id(manager) in self._retired:
+                retired, refs = self._retired[id(manager)]
+                if refs > 1:
+                    self._retired[id(manager)] = (retired, refs - 1)
+                else:
+                    del self._retired[id(manager)]
+                    stale = retired
+        if stale is not None:
+            try:
+                stale.close()
+            except Exception:
+                pass
+
+    def managers(self) -> list["EgeriaTechClientManager"]:
+        with self._lock:
+            return list(self._managers.values()) + list(self._hedge_managers.values())
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "managers": len(self._managers),
+                "in_use": sum(1 for c in self._refcounts.values() if c > 0),
+                "refcounts": {"|".join(k): c for k, c in self._refcounts.items()},
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            managers = list(self._managers.values()) + list(self._hedge_managers.values())
+            managers += [m for m, _ in self._retired.values()]
+            self._managers.clear()
+            self._refcounts.clear()
+            self._hedge_managers.clear()
+            self._retired.clear()
+        for m in managers:
+            try:
+                m.close()
+            except Exception:
+                pass
+
+
+_CLIENT_POOL = EgeriaClientPool()
+
+
+def get_client_pool() -> EgeriaClientPool:
+    return _CLIENT_POOL
+
+
+def acquire_manager(config: Optional[EgeriaConfig] = None) -> EgeriaTechClientManager:
+    """Return the shared manager for this connection, creating it on first use."""
+    return _CLIENT_POOL.acquire(config)
+
+
+def release_manager(manager: EgeriaTechClientManager) -> None:
+    """Drop one reference to a pooled manager; the session stays cached for reuse."""
+    _CLIENT_POOL.release(manager)
+
+
+def login_config(platform_url: str, view_server: str, user: str, password: str) -> EgeriaConfig:
+    """The connection a login form describes; blank fields keep the current values."""
+    return get_global_config().with_overrides(
+        platform_url=platform_url, view_server=view_server, user=user, password=password
+    )
+
+
+def adopt_login_session(config: EgeriaConfig, client: Any) -> EgeriaTechClientManager:
+    """
+    Make config the app's connection and hand the client the login just authenticated to
+    the pool, so the first service call reuses its session and token.
+    """
+    set_global_config(config)
+    return _CLIENT_POOL.adopt(config, client)
+
+
+def resume_login_session(config: EgeriaConfig) -> bool:
+    """
+    If the pool is already signed in with exactly these credentials (e.g. by the start-up
+    warm-up), make config the app's connection and return True: the login needs no new session.
+    """
+    if _CLIENT_POOL.live_session(config) is None:
+        return False
+    set_global_config(config)
+    return True
@@ -0,0 +1,179 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file provides a cached, asynchronous platform health probe for my_egeria.
+
+
+"""
+
+import asyncio
+import os
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from .config import get_global_config
+from .egeria_client import _bool_env, _build_origin_url, check_origin_response, origin_error
+
+HealthKey = Tuple[str, str]  # (platform_url, user)
+
+
+@dataclass(frozen=True)
+class HealthStatus:
+    reachable: bool
+    checked_at: float  # time.monotonic() of the probe
+    latency_ms: float = 0.0
+    error: str = ""
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.checked_at
+
+
+async def probe_origin(platform_url: str, user: str, *, timeout: float = 2.0) -> None:
+    """Async preflight_origin: GET the platform origin, raising ConnectionError on failure."""
+    if not platform_url or "://" not in platform_url:
+        raise ConnectionError(f"Malformed EGERIA_PLATFORM_URL: {platform_url!r}")
+
+    import httpx  # on first use, to keep app start-up light
+
+    url = _build_origin_url(platform_url, user)
+    try:
+        async with httpx.AsyncClient(timeout=timeout, verify=_bool_env("EGERIA_SSL_VERIFY", True)) as client:
+            resp = await client.get(url)
+    except httpx.HTTPError as e:
+        raise origin_error(url, e) from e
+    check_origin_response(url, resp.status_code)
+
+
+def health_ttl_seconds() -> float:
+    return float(os.getenv("EGERIA_HEALTH_TTL_SECONDS", "10"))
+
+
+class HealthCache:
+    """
+    Process-wide platform health: the last probe result per (platform_url, user).
+    check() probes only when the cached result is older than the TTL, and concurrent
+    checks of the same platform share one probe. peek() never touches the network.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: Optional[float] = None,
+        probe: Callable[[str, str], Awaitable[None]] = probe_origin,
+    ):
+        self.ttl_seconds = health_ttl_seconds() if ttl_seconds is None else ttl_seconds
+        self._probe = probe
+        self._status: Dict[HealthKey, HealthStatus] = {}
+        self._pending: Dict[HealthKey, asyncio.Future] = {}
+        self.probes = 0
+
+    @staticmethod
+    def _key(platform_url: str, user: str) -> HealthKey:
+        return (platform_url.rstrip("/"), user)
+
+    def peek(self, platform_url: str, user: str) -> Optional[HealthStatus]:
+        return self._status.get(self._key(platform_url, user))
+
+    async def check(self, platform_url: str, user: str, *, max_age: Optional[float] = None) -> HealthStatus:
+        key = self._key(platform_url, user)
+        status = self._status.get(key)
+        if status is not None and status.age < (self.ttl_seconds if max_age is None else max_age):
+            return status
+        future = self._pending.get(key)
+        if future is None:
+            future = self._pending[key] = asyncio.ensure_future(self._run(key, platform_url, user))
+        return await asyncio.shield(future)
+
+    async def _run(self, key: HealthKey, platform_url: str, user: str) -> HealthStatus:
+        started = time.monotonic()
+        try:
+            self.probes += 1
+            try:
+                await self._probe(platform_url, user)
+                status = HealthStatus(True, time.monotonic(), (time.monotonic() - started) * 1000)
+            except Exception as e:
+                status = HealthStatus(False, time.monotonic(), error=str(e))
+            self._status[key] = status
+            return status
+        finally:
+            self._pending.pop(key, None)
+
+    def clear(self) -> None:
+        self._status.clear()
+
+
+class HealthWatcher:
+    """
+    One background task that keeps the cache fresh for the current connection (the global
+    config, so it follows a login) by checking it every interval_seconds. Screens read
+    the result with current_health(); nothing on a mount path waits for the network.
+    """
+
+    def __init__(self, cache: "HealthCache", interval_seconds: Optional[float] = None):
+        self.cache = cache
+        self.interval_seconds = cache.ttl_seconds if interval_seconds is None else interval_seconds
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start on the running loop; call it from UI handlers."""
+        if not self.running:
+            self._task = asyncio.ensure_future(self._run())
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            cfg = get_global_config()
+            try:
+                await self.cache.check(cfg.platform_url, cfg.user, max_age=self.interval_seconds)
+            except Exception:
+                pass  # a broken probe must not end the watcher
+            await asyncio.sleep(self.interval_seconds)
+
+
+_HEALTH_CACHE = HealthCache()
+_WATCHER: Optional[HealthWatcher] = None
+
+
+def get_health_cache() -> HealthCache:
+    return _HEALTH_CACHE
+
+
+def start_health_watcher(**kwargs) -> HealthWatcher:
+    """Start (or return) the process-wide watcher."""
+    global _WATCHER
+    if _WATCHER is None:
+        _WATCHER = HealthWatcher(_HEALTH_CACHE, **kwargs)
+    _WATCHER.start()
+    return _WATCHER
+
+
+def current_health() -> Optional[HealthStatus]:
+    """Last known health of the current connection, or None before the first probe."""
+    cfg = get_global_config()
+    return _HEALTH_CACHE.peek(cfg.platform_url, cfg.user)
+
+
+def recent_failure(platform_url: str, user: str) -> Optional[HealthStatus]:
+    """The cached status if a probe within the TTL found the platform unreachable; no network."""
+    status = _HEALTH_CACHE.peek(platform_url, user)
+    if status is None or status.reachable or status.age >= _HEALTH_CACHE.ttl_seconds:
+        return None
+    return status
+
+
+def stop_health_watcher() -> None:
+    global _WATCHER
+    if _WATCHER is not None:
+        _WATCHER.stop()
+        _WATCHER = None
@@ -0,0 +1,213 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file provides hedged reads for idempotent my_egeria lookups.
+
+
+"""
+
+import asyncio
+import contextvars
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Tuple
+
+
+def hedging_enabled() -> bool:
+    val = os.getenv("EGERIA_HEDGED_READS", "")
+    return val.strip().lower() in ("1", "true", "yes", "y", "on")
+
+
+def hedge_budget_fraction() -> float:
+    return max(0.0, float(os.getenv("EGERIA_HEDGE_BUDGET_PERCENT", "5"))) / 100
+
+
+class LatencyTracker:
+    """Recent latencies of one operation; p90() is None until min_samples have been seen."""
+
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        self.min_samples = min_samples
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def p90(self) -> Optional[float]:
+        with self._lock:
+            if len(self._samples) < self.min_samples:
+                return None
+            ordered = sorted(self._samples)
+        return ordered[int(0.9 * (len(ordered) - 1))]
+
+
+class HedgeBudget:
+    """
+    Token bucket that keeps hedges to a fraction of calls: every call earns fraction of a
+    token (up to burst), every hedge spends one.
+    """
+
+    def __init__(self, fraction: Optional[float] = None, burst: float = 5.0):
+        self.fraction = hedge_budget_fraction() if fraction is None else fraction
+        self.burst = burst
+        self._tokens = 0.0
+        self._lock = threading.Lock()
+
+    def earn(self) -> None:
+        with self._lock:
+            self._tokens = min(self.burst, self._tokens + self.fraction)
+
+    def spend(self) -> bool:
+        with self._lock:
+            if self._tokens < 1.0:
+                return False
+            self._tokens -= 1.0
+            return True
+
+
+_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def _executor() -> ThreadPoolExecutor:
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix="egeria-hedge")
+        return _EXECUTOR
+
+
+class Hedger:
+    """
+    Races a duplicate against slow reads of one view server. A call still running after
+    its operation's observed p90 latency gets a second attempt (normally on a second
+    client) if the budget allows; the first successful answer wins and the loser is
+    abandoned (its thread finishes in the background). Only use it for idempotent reads.
+    """
+
+    def __init__(self, name: str, budget: Optional[HedgeBudget] = None, min_samples: int = 20):
+        self.name = name
+        self.budget = budget or HedgeBudget()
+        self.min_samples = min_samples
+        self._trackers: Dict[str, LatencyTracker] = {}
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    def tracker(self, op: str) -> LatencyTracker:
+        with self._lock:
+            tracker = self._trackers.get(op)
+            if tracker is None:
+                tracker = self._trackers[op] = LatencyTracker(min_samples=self.min_samples)
+            return tracker
+
+    def _timed(self, op: str, fn: Callable[[], Any]) -> Callable[[], Any]:
+        def run():
+            started = time.monotonic()
+            result = fn()
+            self.tracker(op).record(time.monotonic() - started)
+            return result
+        return run
+
+    def run(self, op: str, primary: Callable[[], Any], secondary: Callable[[], Any]) -> Any:
+        """Blocking: primary(), hedged with secondary() once it outlives the p90."""
+        self.calls += 1
+        self.budget.earn()
+        delay = self.tracker(op).p90()
+        if delay is None:
+            return self._timed(op, primary)()  # still learning the latency profile
+        # Workers run in a copy of the caller's context (request priority and the like)
+        pool = _executor()
+        first = pool.submit(contextvars.copy_context().run, self._timed(op, primary))
+        done, _ = wait([first], timeout=delay)
+        if done or not self.budget.spend():
+            return first.result()
+        self.hedges += 1
+        second = pool.submit(contextvars.copy_context().run, secondary)
+        pending = {first, second}
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                if fut.exception() is None:
+                    if fut is second:
+                        self.hedge_wins += 1
+                    return fut.result()
+                error = error or fut.exception()
+        raise error
+
+    async def arun(
+        self, op: str, primary: Callable[[], Awaitable[Any]], secondary: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """run() for coroutines; the losing attempt is cancelled."""
+        self.calls += 1
+        self.budget.earn()
+        delay = self.tracker(op).p90()
+
+        async def timed():
+            started = time.monotonic()
+            try:
+                result = await primary()
+            except asyncio.CancelledError:
+                # Lost to the hedge: it took at least this long, and dropping the sample
+                # would pull the p90 down to the calls that beat it
+                self.tracker(op).record(time.monotonic() - started)
+                raise
+            self.tracker(op).record(time.monotonic() - started)
+            return result
+
+        if delay is None:
+            return await timed()
+        first = asyncio.ensure_future(timed())
+        done, _ = await asyncio.wait({first}, timeout=delay)
+        if done or not self.budget.spend():
+            return await first
+        self.hedges += 1
+        second = asyncio.ensure_future(secondary())
+        pending = {first, second}
+        error: Optional[BaseException] = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is second:
+                            self.hedge_wins += 1
+                        return task.result()
+                    error = error or task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def stats(self) -> dict:
+        with self._lock:
+            p90s = {op: t.p90() for op, t in self._trackers.items()}
+        return {
+            "calls": self.calls,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "p90_ms": {op: (p * 1000 if p is not None else None) for op, p in p90s.items()},
+        }
+
+
+_HEDGERS: Dict[Tuple[str, str], Hedger] = {}
+_HEDGERS_LOCK = threading.Lock()
+
+
+def get_hedger(platform_url: str, view_server: str) -> Hedger:
+    """Return the process-wide hedger for a view server, creating it on first use."""
+    key = (platform_url.rstrip("/"), view_server)
+    with _HEDGERS_LOCK:
+        hedger = _HEDGERS.get(key)
+        if hedger is None:
+            hedger = Hedger(f"{view_server}@{key[0]}")
+            _HEDGERS[key] = hedger
+        return hedger
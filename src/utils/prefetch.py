@@ -0,0 +1,82 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file provides highlight-driven prefetching for my_egeria browser tables.
+
+
+"""
+
+import asyncio
+import os
+from typing import Awaitable, Callable, Dict, Hashable
+
+from .scheduler import VISIBLE_PREFETCH, request_priority
+
+
+def prefetch_enabled() -> bool:
+    val = os.getenv("EGERIA_PREFETCH_DISABLED", "")
+    return val.strip().lower() not in ("1", "true", "yes", "y", "on")
+
+
+class Prefetcher:
+    """
+    Warm the caches for the row under the cursor. hover(key, factory) waits dwell_seconds
+    and then runs factory() with at most max_concurrency prefetches in flight.
+
+    Moving the highlight cancels prefetches that are still dwelling or waiting for a slot.
+    One that has already started is left to finish: its request is on the wire, its result
+    lands in the response cache, and a details screen opened meanwhile joins it through
+    the in-flight table instead of asking again.
+
+    Runs on the event loop; call it from UI handlers.
+    """
+
+    def __init__(self, dwell_seconds: float = 0.3, max_concurrency: int = 2):
+        self.dwell_seconds = dwell_seconds
+        self._slots = asyncio.Semaphore(max_concurrency)
+        self._waiting: Dict[Hashable, asyncio.Task] = {}
+        self._running: Dict[Hashable, asyncio.Task] = {}
+        self.started = 0
+        self.cancelled = 0
+
+    def hover(self, key: Hashable, factory: Callable[[], Awaitable]) -> None:
+        """The highlight is now on key: prefetch it after the dwell, dropping other waiters."""
+        if not key or not prefetch_enabled():
+            return
+        for other in [k for k in self._waiting if k != key]:
+            self._waiting.pop(other).cancel()
+            self.cancelled += 1
+        # Already-warm keys are cheap to hover again: the fetch is a response-cache hit
+        if key in self._waiting or key in self._running:
+            return
+        self._waiting[key] = asyncio.ensure_future(self._run(key, factory))
+
+    async def _run(self, key: Hashable, factory: Callable[[], Awaitable]) -> None:
+        try:
+            await asyncio.sleep(self.dwell_seconds)
+            async with self._slots:
+                # Past this point the prefetch is committed and no longer cancelled by hover()
+                task = self._waiting.pop(key, None)
+                if task is None:
+                    return
+                self._running[key] = task
+                self.started += 1
+                try:
+                    # Queued behind anything the user is waiting for on the same server
+                    with request_priority(VISIBLE_PREFETCH):
+                        await factory()
+                except Exception:
+                    pass  # best effort; the details screen will report real failures
+                finally:
+                    self._running.pop(key, None)
+        except asyncio.CancelledError:
+            self._waiting.pop(key, None)
+            raise
+
+    def cancel_all(self) -> None:
+        for task in list(self._waiting.values()) + list(self._running.values()):
+            task.cancel()
+        self._waiting.clear()
+        self._running.clear()
@@ -0,0 +1,204 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file provides a read-through response cache for my_egeria services.
+
+
+"""
+
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Iterable, Optional, Tuple
+
+
+def freeze(obj: Any) -> Hashable:
+    """Turn call arguments (dicts, lists, ...) into a hashable cache-key component."""
+    if isinstance(obj, dict):
+        return tuple(sorted((str(k), freeze(v)) for k, v in obj.items()))
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return tuple(freeze(v) for v in obj)
+    try:
+        hash(obj)
+        return obj
+    except TypeError:
+        return repr(obj)
+
+
+def clone(obj: Any) -> Any:
+    """
+    Copy of a decoded JSON-like response (dicts, lists, tuples; leaves are shared since
+    they are immutable). Cheaper than copy.deepcopy for the shapes pyegeria returns.
+    """
+    if isinstance(obj, dict):
+        return {k: clone(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [clone(v) for v in obj]
+    if isinstance(obj, tuple):
+        return tuple(clone(v) for v in obj)
+    return obj
+
+
+def estimate_size(obj: Any, _depth: int = 0) -> int:
+    """Approximate in-memory size of a decoded JSON-like response, in bytes."""
+    size = sys.getsizeof(obj)
+    if _depth > 6:
+        return size
+    if isinstance(obj, dict):
+        for k, v in obj.items():
+            size += estimate_size(k, _depth + 1) + estimate_size(v, _depth + 1)
+    elif isinstance(obj, (list, tuple, set)):
+        for v in obj:
+            size += estimate_size(v, _depth + 1)
+    return size
+
+
+@dataclass
+class _Entry:
+    value: Any
+    size: int
+    stored_at: float
+    expires_at: float
+    scope: Hashable
+    method: str
+
+
+class ResponseCache:
+    """
+    Bounded TTL + LRU cache for read responses.
+
+    Keys are (scope, method, frozen args, frozen kwargs) where scope identifies the
+    connection (platform, view server, user). Values are copied in and out, so callers
+    may modify what they get without corrupting later hits. Entries expire after a
+    per-call TTL and the least recently used entries are evicted when either max_entries
+    or max_bytes is exceeded. Expired entries are kept (until evicted) so they can still
+    be served as a stale snapshot via peek().
+
+    invalidate() also bumps a per-(scope, method) generation. A reader notes
+    generation() before fetching and skips storing its result if it changed meanwhile,
+    so a response read before a mutation cannot be cached after it.
+    """
+
+    def __init__(self, max_entries: int = 512, max_bytes: int = 32 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._generations: Dict[Tuple[Hashable, str], int] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def make_key(scope: Hashable, method: str, args: Tuple = (), kwargs: Optional[dict] = None) -> Hashable:
+        return (scope, method, freeze(tuple(args)), freeze(kwargs or {}))
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """Return (True, value) for a fresh entry, else (False, None)."""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.expires_at <= now:
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            value = entry.value
+        return True, clone(value)
+
+    def peek(self, key: Hashable) -> Optional[Tuple[Any, float]]:
+        """Return (value, age_seconds) even if the entry has expired; None if absent."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, age = entry.value, time.time() - entry.stored_at
+        return clone(value), age
+
+    def put(self, key: Hashable, value: Any, ttl: float) -> None:
+        if ttl <= 0:
+            return
+        scope, method = key[0], key[1]
+        value = clone(value)
+        size = estimate_size(value)
+        if size > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old.size
+            self._entries[key] = _Entry(value, size, now, now + ttl, scope, method)
+            self._bytes += size
+            while self._entries and (
+                len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.size
+                self.evictions += 1
+
+    def generation(self, scope: Hashable, method: str) -> int:
+        """How many times method has been invalidated within scope."""
+        with self._lock:
+            return self._generations.get((scope, method), 0)
+
+    def invalidate(self, scope: Hashable, methods: Iterable[str]) -> int:
+        """Drop every entry for the given methods within a connection scope."""
+        methods = set(methods)
+        with self._lock:
+            for m in methods:
+                self._generations[(scope, m)] = self._generations.get((scope, m), 0) + 1
+            doomed = [
+                k for k, e in self._entries.items() if e.scope == scope and e.method in methods
+            ]
+            for k in doomed:
+                self._bytes -= self._entries.pop(k).size
+            self.invalidations += len(doomed)
+            return len(doomed)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": (self.hits / lookups) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+
+def cache_enabled() -> bool:
+    val = os.getenv("EGERIA_CACHE_DISABLED", "")
+    return val.strip().lower() not in ("1", "true", "yes", "y", "on")
+
+
+def default_ttl_seconds() -> float:
+    try:
+        return float(os.getenv("EGERIA_CACHE_TTL_SECONDS", "30"))
+    except ValueError:
+        return 30.0
+
+
+_RESPONSE_CACHE = ResponseCache(
+    max_entries=int(os.getenv("EGERIA_CACHE_MAX_ENTRIES", "512")),
+    max_bytes=int(os.getenv("EGERIA_CACHE_MAX_MB", "32")) * 1024 * 1024,
+)
+
+
+def get_response_cache() -> ResponseCache:
+    return _RESPONSE_CACHE
@@ -0,0 +1,303 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file provides a per-server request scheduler with priority classes for my_egeria.
+
+
+"""
+
+import asyncio
+import contextvars
+import heapq
+import itertools
+import os
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Priority classes, most urgent first
+INTERACTIVE = 0  # the user is waiting on it: screen loads, searches, edits
+VISIBLE_PREFETCH = 1  # what the user is about to look at: highlighted rows, open tree branches
+BACKGROUND = 2  # nobody is waiting: warm-ups, deep prefetch, housekeeping
+PRIORITY_NAMES = {INTERACTIVE: "interactive", VISIBLE_PREFETCH: "visible-prefetch", BACKGROUND: "background"}
+
+_PRIORITY: contextvars.ContextVar[int] = contextvars.ContextVar("egeria_request_priority", default=INTERACTIVE)
+_TICKET: contextvars.ContextVar[Optional["PriorityTicket"]] = contextvars.ContextVar(
+    "egeria_priority_ticket", default=None
+)
+
+
+def current_priority() -> int:
+    return _PRIORITY.get()
+
+
+def effective_priority() -> int:
+    """current_priority(), raised to that of the shared work (PriorityTicket) it runs for."""
+    priority = _PRIORITY.get()
+    ticket = _TICKET.get()
+    return priority if ticket is None else min(priority, ticket.priority)
+
+
+@contextmanager
+def request_priority(priority: int) -> Iterator[None]:
+    """
+    Run the block's Egeria calls at priority. The class follows the context: asyncio tasks
+    and asyncio.to_thread workers started inside the block inherit it.
+    """
+    token = _PRIORITY.set(priority)
+    try:
+        yield
+    finally:
+        _PRIORITY.reset(token)
+
+
+class PriorityTicket:
+    """
+    The priority of one piece of shared work (a single-flight read, a tree branch load).
+    It starts at its creator's priority; a caller joining the work later calls raise_to()
+    with its own, so an interactive caller never waits on a background fetch served at
+    background priority. Calls the work made that are still queued in a scheduler move up
+    to the new class, later ones are admitted at it, and tickets created inside the work
+    (nested flights) are raised with it.
+    """
+
+    def __init__(self) -> None:
+        parent = _TICKET.get()
+        self.priority = effective_priority()
+        self._lock = threading.Lock()
+        self._queued: List[Tuple["RequestScheduler", "_Waiter"]] = []
+        self._children: List["PriorityTicket"] = []
+        if parent is not None:
+            with parent._lock:
+                parent._children.append(self)
+
+    @contextmanager
+    def active(self) -> Iterator[None]:
+        """Run the block (and the tasks and worker threads it starts) as this ticket's work."""
+        token = _TICKET.set(self)
+        try:
+            yield
+        finally:
+            _TICKET.reset(token)
+
+    def raise_to(self, priority: int) -> None:
+        with self._lock:
+            if priority >= self.priority:
+                return
+            self.priority = priority
+            queued = [(s, w) for s, w in self._queued if not (w.granted or w.abandoned)]
+            self._queued = queued
+            children = list(self._children)
+        for scheduler, waiter in queued:
+            scheduler._promote(waiter, priority)
+        for child in children:
+            child.raise_to(priority)
+
+    def _track(self, scheduler: "RequestScheduler", waiter: "_Waiter") -> None:
+        with self._lock:
+            self._queued.append((scheduler, waiter))
+            priority = self.priority
+        scheduler._promote(waiter, priority)  # raised while the waiter was queueing
+
+
+def server_concurrency() -> int:
+    return max(1, int(os.getenv("EGERIA_SERVER_CONCURRENCY", "6")))
+
+
+class _Waiter:
+    __slots__ = ("priority", "wake", "granted", "abandoned", "queued_at")
+
+    def __init__(self, priority: int, wake):
+        self.priority = priority
+        self.wake = wake
+        self.granted = False
+        self.abandoned = False
+        self.queued_at = time.monotonic()
+
+
+class RequestScheduler:
+    """
+    Admits at most limit concurrent calls to one view server. Calls beyond that queue by
+    priority class (FIFO within a class). Below INTERACTIVE a class may not take the last
+    free slot, so a long background queue never keeps an interactive request waiting for
+    more than one call to finish. A queued call made for shared work moves up when a more
+    urgent caller joins that work (see PriorityTicket).
+
+    Sync callers (worker threads) block in slot(); coroutines on the UI loop await aslot().
+    Both share one queue. A sync call made on the event loop thread itself is admitted
+    at once: blocking the loop could stall the coroutines holding the slots.
+    """
+
+    def __init__(self, name: str, limit: Optional[int] = None, reserved_interactive: int = 1):
+        self.name = name
+        self.limit = server_concurrency() if limit is None else max(1, limit)
+        self.reserved_interactive = min(reserved_interactive, self.limit - 1)
+        self._lock = threading.Lock()
+        self._queue: List[Tuple[int, int, _Waiter]] = []
+        self._seq = itertools.count()
+        self._in_flight = 0
+        self._queued: Dict[int, int] = dict.fromkeys(PRIORITY_NAMES, 0)
+        self._admitted: Dict[int, int] = dict.fromkeys(PRIORITY_NAMES, 0)
+        self._wait_total: Dict[int, float] = dict.fromkeys(PRIORITY_NAMES, 0.0)
+        self._wait_max: Dict[int, float] = dict.fromkeys(PRIORITY_NAMES, 0.0)
+        self.max_queue_depth = 0
+
+    # ------------- Admission -------------
+
+    def _can_admit(self, priority: int) -> bool:
+        # Callers hold self._lock
+        free = self.limit - self._in_flight
+        return free > (0 if priority == INTERACTIVE else self.reserved_interactive)
+
+    def _admit(self, priority: int, waited: float) -> None:
+        # Callers hold self._lock
+        self._in_flight += 1
+        self._admitted[priority] += 1
+        self._wait_total[priority] += waited
+        self._wait_max[priority] = max(self._wait_max[priority], waited)
+
+    def _try_enter(self, priority: int, wake, force: bool = False) -> Optional[_Waiter]:
+        """Take a slot now (None) or join the queue (the waiter to wait on)."""
+        with self._lock:
+            if force or (not self._queue and self._can_admit(priority)):
+                self._admit(priority, 0.0)
+                return None
+            waiter = _Waiter(priority, wake)
+            heapq.heappush(self._queue, (priority, next(self._seq), waiter))
+            self._queued[priority] += 1
+            self.max_queue_depth = max(self.max_queue_depth, len(self._queue))
+            self._dispatch()  # an interactive caller may fit the reserved slot
+            return waiter
+
+    def _dispatch(self) -> None:
+        # Callers hold self._lock; hand free slots to queued waiters, most urgent first
+        while self._queue:
+            priority, _, waiter = self._queue[0]
+            if waiter.abandoned or waiter.granted or priority != waiter.priority:
+                heapq.heappop(self._queue)  # gone, or an entry left behind by _promote
+                continue
+            if not self._can_admit(priority):
+                return
+            heapq.heappop(self._queue)
+            self._queued[priority] -= 1
+            waiter.granted = True
+            self._admit(priority, time.monotonic() - waiter.queued_at)
+            waiter.wake()
+
+    def _promote(self, waiter: _Waiter, priority: int) -> None:
+        """Move a queued waiter up to a more urgent class (its old heap entry is skipped)."""
+        with self._lock:
+            if waiter.granted or waiter.abandoned or priority >= waiter.priority:
+                return
+            self._queued[waiter.priority] -= 1
+            self._queued[priority] += 1
+            waiter.priority = priority
+            heapq.heappush(self._queue, (priority, next(self._seq), waiter))
+            self._dispatch()
+
+    def _leave(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            self._dispatch()
+
+    def _abandon(self, waiter: _Waiter) -> None:
+        """A queued caller gave up (cancelled): drop its place, or its slot if already granted."""
+        with self._lock:
+            if not waiter.granted:
+                waiter.abandoned = True
+                self._queued[waiter.priority] -= 1
+                return
+        self._leave()
+
+    @contextmanager
+    def slot(self, priority: Optional[int] = None) -> Iterator[None]:
+        """Hold one of the server's slots for the block (blocking the thread until one is free)."""
+        priority = effective_priority() if priority is None else priority
+        event = threading.Event()
+        waiter = self._try_enter(priority, event.set, force=_on_event_loop())
+        if waiter is not None:
+            self._track(waiter)
+            event.wait()
+        try:
+            yield
+        finally:
+            self._leave()
+
+    @asynccontextmanager
+    async def aslot(self, priority: Optional[int] = None):
+        """slot() for coroutines: waits on the event loop instead of blocking it."""
+        priority = effective_priority() if priority is None else priority
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def wake():
+            loop.call_soon_threadsafe(lambda: future.done() or future.set_result(None))
+
+        waiter = self._try_enter(priority, wake)
+        if waiter is not None:
+            self._track(waiter)
+            try:
+                await future
+            except asyncio.CancelledError:
+                self._abandon(waiter)
+                raise
+        try:
+            yield
+        finally:
+            self._leave()
+
+    def _track(self, waiter: _Waiter) -> None:
+        ticket = _TICKET.get()
+        if ticket is not None:
+            ticket._track(self, waiter)
+
+    # ------------- Metrics -------------
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "limit": self.limit,
+                "in_flight": self._in_flight,
+                "queue_depth": sum(self._queued.values()),
+                "max_queue_depth": self.max_queue_depth,
+                "queued": {PRIORITY_NAMES[p]: n for p, n in self._queued.items()},
+                "admitted": {PRIORITY_NAMES[p]: n for p, n in self._admitted.items()},
+                "avg_wait_ms": {
+                    PRIORITY_NAMES[p]: (self._wait_total[p] / n * 1000 if n else 0.0)
+                    for p, n in self._admitted.items()
+                },
+                "max_wait_ms": {PRIORITY_NAMES[p]: w * 1000 for p, w in self._wait_max.items()},
+            }
+
+
+def _on_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+        return True
+    except RuntimeError:
+        return False
+
+
+_SCHEDULERS: Dict[Tuple[str, str], RequestScheduler] = {}
+_SCHEDULERS_LOCK = threading.Lock()
+
+
+def get_scheduler(platform_url: str, view_server: str) -> RequestScheduler:
+    """Return the process-wide scheduler for a view server, creating it on first use."""
+    key = (platform_url.rstrip("/"), view_server)
+    with _SCHEDULERS_LOCK:
+        scheduler = _SCHEDULERS.get(key)
+        if scheduler is None:
+            scheduler = RequestScheduler(f"{view_server}@{key[0]}")
+            _SCHEDULERS[key] = scheduler
+        return scheduler
+
+
+def scheduler_stats() -> Dict[str, dict]:
+    """Queue depth and wait-time metrics of every view server, keyed by scheduler name."""
+    with _SCHEDULERS_LOCK:
+        schedulers = list(_SCHEDULERS.values())
+    return {s.name: s.stats() for s in schedulers}
@@ -0,0 +1,235 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file provides an in-memory search index for search-as-you-type in my_egeria browsers.
+
+
+"""
+
+import re
+from collections import OrderedDict
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Set, Tuple
+
+_TOKEN_RE = re.compile(r"[0-9a-z]+")
+_NGRAM = 3
+_VERIFY_LIMIT = 2000  # candidate count below which documents are checked directly
+
+
+def tokenize(text: str) -> List[str]:
+    """Lower-case alphanumeric runs, so 'Collection::Sales-Data' -> ['collection', 'sales', 'data']."""
+    return _TOKEN_RE.findall(text.lower()) if text else []
+
+
+def _has_match(tokens: Iterable[str], fragment: str) -> bool:
+    """Same matching rule as SearchIndex: token prefix, or substring for 3+ characters."""
+    if len(fragment) >= _NGRAM:
+        return any(fragment in t for t in tokens)
+    return any(t.startswith(fragment) for t in tokens)
+
+
+def _ngrams(token: str) -> Set[str]:
+    return {token[i:i + _NGRAM] for i in range(len(token) - _NGRAM + 1)}
+
+
+class SearchIndex:
+    """
+    Token index over short text fields (display name, qualified name, description, ...).
+
+    Every distinct token goes into a prefix trie and a trigram table; each token maps to the
+    ascending list of documents containing it. A query matches documents that contain, for
+    every query token, some token that starts with it or (for 3+ characters) contains it.
+    Query tokens are resolved against the vocabulary, which is far smaller than the document
+    set, before postings are combined, so cost follows the number of matches rather than the
+    number of rows. Results keep insertion order.
+    """
+
+    def __init__(self) -> None:
+        self.clear()
+
+    def clear(self) -> None:
+        self._keys: List[Hashable] = []
+        self._postings: Dict[str, List[int]] = {}
+        self._doc_tokens: List[Tuple[str, ...]] = []  # forward index, to verify small candidate sets
+        self._initials: Dict[str, List[int]] = {}  # first character -> docs, for one-key queries
+        self._trie: dict = {}
+        self._trigrams: Dict[str, Set[str]] = {}
+        self._unindexed: List[str] = []  # new vocabulary not yet in the trie/trigram table
+        self._memo: "OrderedDict[str, List[int]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, key: Hashable, texts: Iterable[str]) -> None:
+        doc = len(self._keys)
+        self._keys.append(key)
+        postings = self._postings
+        tokens = tuple(set(_TOKEN_RE.findall(" ".join(texts).lower())))
+        self._doc_tokens.append(tokens)
+        for token in tokens:
+            docs = postings.get(token)
+            if docs is None:
+                docs = postings[token] = []
+                self._unindexed.append(token)
+            docs.append(doc)
+        for initial in {t[0] for t in tokens}:
+            self._initials.setdefault(initial, []).append(doc)
+        if self._memo:
+            self._memo.clear()
+
+    def extend(self, items: Iterable[Tuple[Hashable, Iterable[str]]]) -> None:
+        for key, texts in items:
+            self.add(key, texts)
+
+    def prepare(self) -> None:
+        """Index new vocabulary now (otherwise done on the next search)."""
+        if self._unindexed:
+            self._index_vocabulary()
+
+    def _index_vocabulary(self) -> None:
+        trie, trigrams = self._trie, self._trigrams
+        for token in self._unindexed:
+            node = trie
+            for ch in token:
+                node = node.setdefault(ch, {})
+            node[""] = token
+            for gram in _ngrams(token):
+                grams = trigrams.get(gram)
+                if grams is None:
+                    trigrams[gram] = {token}
+                else:
+                    grams.add(token)
+        self._unindexed = []
+
+    def _tokens_with_prefix(self, prefix: str) -> List[str]:
+        node = self._trie
+        for ch in prefix:
+            node = node.get(ch)
+            if node is None:
+                return []
+        out, stack = [], [node]
+        while stack:
+            node = stack.pop()
+            for ch, child in node.items():
+                if ch == "":
+                    out.append(child)
+                else:
+                    stack.append(child)
+        return out
+
+    def _tokens_containing(self, fragment: str) -> Set[str]:
+        grams = sorted(_ngrams(fragment), key=lambda g: len(self._trigrams.get(g, ())))
+        candidates = set(self._trigrams.get(grams[0], ()))
+        for gram in grams[1:]:
+            candidates &= self._trigrams.get(gram, set())
+            if not candidates:
+                return candidates
+        return {t for t in candidates if fragment in t}
+
+    def _docs_for(self, fragment: str) -> List[int]:
+        """Ascending ids of documents with a token matching fragment (memoized)."""
+        docs = self._memo.get(fragment)
+        if docs is not None:
+            self._memo.move_to_end(fragment)
+            return docs
+        if len(fragment) == 1:
+            return self._initials.get(fragment, [])
+        tokens = set(self._tokens_with_prefix(fragment))
+        if len(fragment) >= _NGRAM:
+            tokens |= self._tokens_containing(fragment)
+        lists = sorted((self._postings[t] for t in tokens), key=len, reverse=True)
+        if not lists:
+            docs = []
+        elif len(lists) == 1 or len(lists[0]) == len(self._keys):
+            # One token, or one that every document has (e.g. a qualified-name prefix)
+            docs = lists[0]
+        else:
+            docs = sorted(set().union(*lists))
+        self._memo[fragment] = docs
+        if len(self._memo) > 64:
+            self._memo.popitem(last=False)
+        return docs
+
+    def search_ids(self, query: str) -> List[int]:
+        """Ascending document ids (insertion positions) matching query; do not mutate the result."""
+        fragments = tokenize(query)
+        if not fragments:
+            return list(range(len(self._keys)))
+        self.prepare()
+        # Longest fragment first: it is usually the most selective. Once few candidates
+        # remain, check the other fragments against those documents' tokens instead of
+        # expanding short, broad fragments into large posting lists.
+        pending = sorted(set(fragments), key=len, reverse=True)
+        hits = self._docs_for(pending.pop(0))
+        while pending and hits:
+            fragment = pending.pop(0)
+            if len(hits) <= _VERIFY_LIMIT:
+                hits = [d for d in hits if _has_match(self._doc_tokens[d], fragment)]
+            else:
+                keep = set(self._docs_for(fragment))
+                hits = [d for d in hits if d in keep]
+        return hits
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[Hashable]:
+        """Keys of matching documents in insertion order; an empty query matches everything."""
+        keys = self._keys
+        return [keys[d] for d in self.search_ids(query)[:limit]]
+
+
+class IndexedRows:
+    """
+    Table rows (tuples keyed by their first cell) plus a SearchIndex over some of their
+    columns. Browsers keep every loaded row here and show visible() for the current query.
+
+    complete says whether the rows are the full unfiltered result set. While it is False a
+    local miss proves nothing, so needs_server() tells the screen to ask the server; that
+    includes an empty query, which must bring back the full listing after a server search.
+    Rows a server search returned (answers) are shown as returned for that query: the
+    server may have matched them on fields the local index does not cover.
+    """
+
+    def __init__(self, text_columns: Sequence[int]):
+        self.text_columns = tuple(text_columns)
+        self.index = SearchIndex()
+        self.rows: Dict[Hashable, tuple] = {}
+        self._ordered: List[tuple] = []  # rows by index document id
+        self.complete = False
+        self.answers = ""  # the server search the rows came from, if not the full listing
+        self.query = ""
+
+    def set_rows(self, rows: Iterable[Sequence], complete: bool = True, answers: str = "") -> None:
+        self.index.clear()
+        self.rows = {}
+        self._ordered = []
+        self.add_rows(rows)
+        self.complete = complete
+        self.answers = "" if complete else answers
+
+    def add_rows(self, rows: Iterable[Sequence]) -> None:
+        for row in rows:
+            row = tuple(row)
+            key = row[0] if row and row[0] else f"__row_{len(self.rows)}"
+            if key in self.rows:
+                continue
+            self.rows[key] = row
+            self._ordered.append(row)
+            self.index.add(key, (str(row[i] or "") for i in self.text_columns if i < len(row)))
+        # Pay for the trie/trigram tables here, where callers load rows, not on a keystroke
+        self.index.prepare()
+
+    def visible(self, query: Optional[str] = None) -> List[tuple]:
+        if query is not None:
+            self.query = query
+        terms = tokenize(self.query)
+        if not terms or terms == tokenize(self.answers):
+            return list(self._ordered)
+        ordered = self._ordered
+        ids = self.index.search_ids(self.query)
+        if len(ids) == len(ordered):
+            return list(ordered)
+        return [ordered[d] for d in ids]
+
+    def needs_server(self, query: str) -> bool:
+        # An empty query is answered by the server's "*" listing
+        return not self.complete
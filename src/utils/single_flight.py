@@ -0,0 +1,164 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file coalesces identical in-flight reads for my_egeria services.
+
+
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, Optional
+
+from utils.response_cache import clone
+from utils.scheduler import PriorityTicket, effective_priority
+
+
+@dataclass
+class _Flight:
+    future: Future
+    owner_thread: int
+    ticket: PriorityTicket
+    followers: int = 0
+
+
+class SingleFlight:
+    """
+    At most one in-flight call per key. Callers asking for a key that is already being
+    fetched wait on the leader's future and receive the same result (or exception).
+    Results are JSON-like responses that screens modify, so each follower gets its own
+    copy (response_cache.clone) and the leader keeps the original only if nobody joined.
+
+    Sync and async callers share one table: an async follower awaits a sync leader's
+    future and vice versa. A sync caller never blocks on a flight owned by its own
+    thread (that would deadlock an event loop), it just runs the call itself.
+
+    A follower more urgent than the leader raises the flight's priority (PriorityTicket),
+    so an interactive caller joining a prefetch does not wait at prefetch priority.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._flights: Dict[Hashable, _Flight] = {}
+        self.leaders = 0
+        self.shared = 0
+
+    def _join_or_lead(self, key: Hashable, blocking: bool):
+        """Return (flight, is_leader); flight is None if the caller must run unshared."""
+        me = threading.get_ident()
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is not None:
+                if blocking and flight.owner_thread == me:
+                    return None, True
+                self.shared += 1
+                flight.followers += 1
+            else:
+                fut: Future = Future()
+                # Mark running so a stray cancel() from a waiter cannot cancel it for everyone
+                fut.set_running_or_notify_cancel()
+                flight = _Flight(fut, me, PriorityTicket())
+                self._flights[key] = flight
+                self.leaders += 1
+                return flight, True
+        flight.ticket.raise_to(effective_priority())
+        return flight, False
+
+    def _land(self, key: Hashable, flight: _Flight) -> None:
+        with self._lock:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """Run fn() once for all concurrent callers with the same key."""
+        flight, leader = self._join_or_lead(key, blocking=True)
+        if flight is None:
+            return fn()
+        if not leader:
+            return clone(flight.future.result())
+        try:
+            with flight.ticket.active():
+                res = fn()
+        except BaseException as e:
+            flight.future.set_exception(e)
+            raise
+        finally:
+            self._land(key, flight)
+        flight.future.set_result(res)
+        return self._leaders_copy(flight, res)
+
+    @staticmethod
+    def _leaders_copy(flight: _Flight, res: Any) -> Any:
+        # Called once the flight has landed, so no more followers can join
+        return clone(res) if flight.followers else res
+
+    async def ado(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Async counterpart of do(). The shared call runs as its own task and every caller
+        awaits it through asyncio.shield, so cancelling one caller (e.g. an exclusive
+        worker being replaced) does not cancel the request for the others.
+        """
+        flight, leader = self._join_or_lead(key, blocking=False)
+        if flight is None:
+            return await factory()
+        if not leader:
+            return clone(await asyncio.shield(asyncio.wrap_future(flight.future)))
+
+        async def _run():
+            return await factory()
+
+        with flight.ticket.active():  # the task copies the context it is created in
+            task = asyncio.get_running_loop().create_task(_run())
+
+        def _done(t: asyncio.Task) -> None:
+            self._land(key, flight)
+            if t.cancelled():
+                flight.future.set_exception(asyncio.CancelledError())
+            elif t.exception() is not None:
+                flight.future.set_exception(t.exception())
+            else:
+                flight.future.set_result(t.result())
+
+        task.add_done_callback(_done)
+        res = await asyncio.shield(task)  # _done (registered first) has landed the flight
+        return self._leaders_copy(flight, res)
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._flights)
+
+    def forget(self, scope: Hashable, methods: Optional[Iterable[str]] = None) -> None:
+        """
+        Detach in-flight reads for a scope (optionally only some methods) so callers
+        arriving after a mutation start a fresh request instead of joining a stale one.
+        Keys are expected to be ResponseCache.make_key tuples: (scope, method, ...).
+        """
+        names = set(methods) if methods else None
+        with self._lock:
+            for key in list(self._flights):
+                if not isinstance(key, tuple) or len(key) < 2 or key[0] != scope:
+                    continue
+                if names is None or key[1] in names:
+                    del self._flights[key]
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"leaders": self.leaders, "shared": self.shared, "in_flight": len(self._flights)}
+
+
+_SINGLE_FLIGHT: Optional[SingleFlight] = None
+_SINGLE_FLIGHT_LOCK = threading.Lock()
+
+
+def get_single_flight() -> SingleFlight:
+    """Process-wide in-flight table shared by all services."""
+    global _SINGLE_FLIGHT
+    if _SINGLE_FLIGHT is None:
+        with _SINGLE_FLIGHT_LOCK:
+            if _SINGLE_FLIGHT is None:
+                _SINGLE_FLIGHT = SingleFlight()
+    return _SINGLE_FLIGHT
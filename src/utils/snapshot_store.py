@@ -0,0 +1,188 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file provides a persistent SQLite metadata snapshot store for my_egeria.
+
+
+"""
+
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional, Tuple
+
+from utils.response_cache import clone
+
+_SCHEMA = """
+-- Per-element rows written by earlier versions; nothing reads them
+DROP TABLE IF EXISTS elements;
+CREATE TABLE IF NOT EXISTS responses (
+    scope TEXT NOT NULL,
+    operation TEXT NOT NULL,
+    request TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (scope, operation, request)
+);
+"""
+
+
+def format_age(seconds: float) -> str:
+    """Short human-readable age for staleness indicators, e.g. '42s', '5m', '3h', '2d'."""
+    seconds = max(seconds, 0)
+    for unit, size in (("d", 86400), ("h", 3600), ("m", 60)):
+        if seconds >= size:
+            return f"{int(seconds // size)}{unit}"
+    return f"{int(seconds)}s"
+
+
+class SnapshotStore:
+    """
+    Local SQLite snapshot of metadata read from Egeria (glossaries, terms, collections,
+    members). Every successful read is recorded as a whole response, so a screen can
+    re-render it on cold start; a mutation forgets the responses it made stale.
+
+    Writes go through a single background writer thread so callers on the UI loop never
+    block on disk; reads are synchronous and served from the indexed table.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            if path != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+            self._conn.commit()
+        self._writes: "queue.Queue[Optional[Tuple[str, str, str, Any, float]]]" = queue.Queue()
+        self._writer = threading.Thread(target=self._drain, name="egeria-snapshot-writer", daemon=True)
+        self._writer.start()
+
+    # ---------- writes ----------
+
+    def record(self, scope: str, operation: str, request: str, res: Any) -> None:
+        """Queue a successful response for persistence (non-blocking)."""
+        # Copied now: the caller may modify res before the writer thread serialises it
+        self._writes.put((scope, operation, request, clone(res), time.time()))
+
+    def forget(self, scope: str, operations) -> None:
+        """Queue removal of recorded responses made stale by a mutation."""
+        self._writes.put((scope, "__forget__", "", tuple(operations), time.time()))
+
+    def flush(self, timeout: float = 5.0) -> None:
+        """Wait until queued writes are on disk."""
+        done = threading.Event()
+        self._writes.put(("__flush__", "", "", done, 0.0))
+        done.wait(timeout)
+
+    def _drain(self) -> None:
+        while True:
+            item = self._writes.get()
+            if item is None:
+                return
+            scope, operation, request, res, fetched_at = item
+            if scope == "__flush__":
+                res.set()
+                continue
+            try:
+                if operation == "__forget__":
+                    self._forget(scope, res)
+                else:
+                    self._write(scope, operation, request, res, fetched_at)
+            except Exception:
+                # The snapshot is a best-effort accelerator; never let it break reads
+                pass
+
+    def _write(self, scope: str, operation: str, request: str, res: Any, fetched_at: float) -> None:
+        payload = json.dumps(res, default=str)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                (scope, operation, request, payload, fetched_at),
+            )
+            self._conn.commit()
+
+    def _forget(self, scope: str, operations: Tuple[str, ...]) -> None:
+        with self._lock:
+            self._conn.executemany(
+                "DELETE FROM responses WHERE scope=? AND operation=?",
+                [(scope, op) for op in operations],
+            )
+            self._conn.commit()
+
+    # ---------- reads ----------
+
+    def load(self, scope: str, operation: str, request: str) -> Optional[Tuple[Any, float]]:
+        """Last recorded response and its age in seconds, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, fetched_at FROM responses WHERE scope=? AND operation=? AND request=?",
+                (scope, operation, request),
+            ).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0]), time.time() - row[1]
+
+    def age(self, scope: str) -> Optional[float]:
+        """Seconds since the most recent write for this connection scope."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT MAX(fetched_at) FROM responses WHERE scope=?", (scope,)
+            ).fetchone()
+        return None if not row or row[0] is None else time.time() - row[0]
+
+    def close(self) -> None:
+        self._writes.put(None)
+        self._writer.join(2.0)
+        with self._lock:
+            self._conn.close()
+
+
+def snapshot_enabled() -> bool:
+    val = os.getenv("EGERIA_SNAPSHOT_DISABLED", "")
+    return val.strip().lower() not in ("1", "true", "yes", "y", "on")
+
+
+def default_snapshot_path() -> str:
+    return os.getenv(
+        "EGERIA_SNAPSHOT_DB",
+        str(Path.home() / ".cache" / "my_egeria" / "snapshots.db"),
+    )
+
+
+_STORE: Optional[SnapshotStore] = None
+_STORE_FAILED = False
+_STORE_LOCK = threading.Lock()
+
+
+def get_snapshot_store() -> Optional[SnapshotStore]:
+    """The process-wide snapshot store, or None when disabled or unavailable."""
+    global _STORE, _STORE_FAILED
+    if not snapshot_enabled() or _STORE_FAILED:
+        return None
+    with _STORE_LOCK:
+        if _STORE is None:
+            try:
+                _STORE = SnapshotStore(default_snapshot_path())
+            except Exception:
+                # e.g. read-only home directory: run without a snapshot
+                _STORE_FAILED = True
+                return None
+        return _STORE
+
+
+def close_snapshot_store() -> None:
+    global _STORE
+    with _STORE_LOCK:
+        if _STORE is not None:
+            _STORE.close()
+            _STORE = None
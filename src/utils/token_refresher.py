@@ -0,0 +1,124 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file provides a background token refresher for my_egeria.
+
+
+"""
+
+import os
+import threading
+from typing import Optional
+
+from .egeria_client import EgeriaClientPool, get_client_pool
+
+
+class TokenRefresher:
+    """
+    Renews bearer tokens of pooled managers shortly before they expire, so that
+    interactive requests never pay for authentication on the critical path.
+
+    Runs on a daemon thread. Managers that have not been used for idle_after_seconds
+    are skipped (the app is idle, let their tokens lapse and refresh on demand);
+    pause()/resume() suspend all renewals.
+    """
+
+    def __init__(
+        self,
+        pool: Optional[EgeriaClientPool] = None,
+        *,
+        interval_seconds: float = 15.0,
+        idle_after_seconds: float = 600.0,
+    ):
+        self.pool = pool or get_client_pool()
+        self.interval_seconds = interval_seconds
+        self.idle_after_seconds = idle_after_seconds
+        self.refresh_count = 0
+        self.error_count = 0
+        self._stop = threading.Event()
+        self._paused = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="egeria-token-refresher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self._thread = None
+
+    def pause(self) -> None:
+        self._paused.set()
+
+    def resume(self) -> None:
+        self._paused.clear()
+
+    def run_once(self) -> int:
+        """Refresh every active manager that is close to expiry; returns how many were renewed."""
+        if self._paused.is_set():
+            return 0
+        renewed = 0
+        for manager in self.pool.managers():
+            if manager.idle_seconds() > self.idle_after_seconds:
+                continue
+            if not manager.needs_proactive_refresh():
+                continue
+            try:
+                manager.refresh_token()
+                renewed += 1
+            except Exception:
+                self.error_count += 1
+        self.refresh_count += renewed
+        return renewed
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_seconds):
+            self.run_once()
+
+
+_REFRESHER: Optional[TokenRefresher] = None
+
+
+def proactive_refresh_enabled() -> bool:
+    val = os.getenv("EGERIA_PROACTIVE_TOKEN_REFRESH", "")
+    return val.strip().lower() in ("1", "true", "yes", "y", "on")
+
+
+def start_token_refresher(**kwargs) -> TokenRefresher:
+    """Start (or return) the process-wide refresher."""
+    global _REFRESHER
+    if _REFRESHER is None:
+        _REFRESHER = TokenRefresher(**kwargs)
+    _REFRESHER.start()
+    return _REFRESHER
+
+
+def pause_token_refresher() -> None:
+    """Suspend renewals (the app is in the background); a no-op if the refresher is off."""
+    if _REFRESHER is not None:
+        _REFRESHER.pause()
+
+
+def resume_token_refresher() -> None:
+    if _REFRESHER is not None:
+        _REFRESHER.resume()
+
+
+def stop_token_refresher() -> None:
+    global _REFRESHER
+    if _REFRESHER is not None:
+        _REFRESHER.stop()
+        _REFRESHER = None
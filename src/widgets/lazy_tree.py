@@ -0,0 +1,178 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file provides a Tree widget that loads its branches on expand for my_egeria.
+
+
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+from textual.widgets import Tree
+from textual.widgets.tree import TreeNode
+
+from utils.scheduler import BACKGROUND, VISIBLE_PREFETCH, PriorityTicket, effective_priority, request_priority
+from widgets.tree_updater import TreeSpec
+
+ChildLoader = Callable[[Any], Awaitable[Sequence[TreeSpec]]]
+
+
+def _cache_key(data: Any) -> Hashable:
+    try:
+        hash(data)
+        return data
+    except TypeError:
+        return repr(data)
+
+
+class LazyTree(Tree):
+    """
+    A Tree whose lazy branches (TreeSpec.lazy) fetch their children the first time they
+    are expanded: loader(node.data) returns the child specs. Until then the branch shows a
+    placeholder; a failed load leaves an error in its place and the next expand retries.
+
+    Children are cached per node data (normally a GUID or qualified name), so collapsing
+    and re-expanding, or the same collection appearing twice, costs one fetch. With
+    prefetch_depth > 0 the lazy children of a freshly loaded branch are fetched in the
+    background, that many levels down, so opening them is instant. Expanding a branch whose
+    prefetch is still running joins it and raises it to the expand's priority.
+
+    With lazy_root the root itself is a lazy branch, loaded from loader(data) on mount.
+    """
+
+    def __init__(
+        self,
+        label: str,
+        loader: ChildLoader,
+        data: Any = None,
+        *,
+        lazy_root: bool = False,
+        prefetch_depth: int = 0,
+        max_prefetch: int = 4,
+        placeholder: str = "Loading…",
+        name: Optional[str] = None,
+        id: Optional[str] = None,
+        classes: Optional[str] = None,
+        disabled: bool = False,
+    ) -> None:
+        super().__init__(label, data, name=name, id=id, classes=classes, disabled=disabled)
+        self.loader = loader
+        self.prefetch_depth = prefetch_depth
+        self.placeholder = placeholder
+        self._placeholders: Dict[int, TreeNode] = {}  # node id -> placeholder of a branch not loaded yet
+        self._cache: Dict[Hashable, List[TreeSpec]] = {}
+        self._pending: Dict[Hashable, Tuple[asyncio.Future, PriorityTicket]] = {}
+        self._reloads: Dict[Hashable, int] = {}  # bumped by reload(): older fetches are not cached
+        self._prefetch_slots = asyncio.Semaphore(max_prefetch)
+        self.loads = 0  # loader calls made
+        if lazy_root:
+            self.mark_lazy(self.root)
+
+    def on_mount(self) -> None:
+        if self.root.id in self._placeholders and self.root.is_expanded:
+            self.run_worker(self._load_node(self.root))
+
+    # ------------- Building -------------
+
+    def add_spec(self, parent: TreeNode, spec: TreeSpec, before: Optional[int] = None) -> TreeNode:
+        """Add spec (and any eager children) under parent; lazy branches get a placeholder."""
+        node = parent.add(spec.label, spec.data, before=before, allow_expand=not spec.leaf)
+        if spec.lazy:
+            self.mark_lazy(node)
+        else:
+            for child in spec.children:
+                self.add_spec(node, child)
+        if spec.expand:
+            node.expand()  # for a lazy branch this starts the load
+        return node
+
+    def mark_lazy(self, node: TreeNode) -> None:
+        self._placeholders[node.id] = node.add_leaf(self.placeholder)
+
+    def is_loaded(self, node: TreeNode) -> bool:
+        return node.id not in self._placeholders
+
+    def reload(self, node: TreeNode) -> None:
+        """Forget node's cached children and fetch them again (now if it is open)."""
+        key = _cache_key(node.data)
+        self._reloads[key] = self._reloads.get(key, 0) + 1
+        self._cache.pop(key, None)
+        self._pending.pop(key, None)  # a fetch still running answers for the old data
+        self._placeholders.pop(node.id, None)
+        node.remove_children()
+        self.mark_lazy(node)
+        if node.is_expanded:
+            self.run_worker(self._load_node(node))
+
+    # ------------- Loading -------------
+
+    def on_tree_node_expanded(self, event: Tree.NodeExpanded) -> None:
+        if event.node.id in self._placeholders:
+            self.run_worker(self._load_node(event.node))
+
+    async def _load_node(self, node: TreeNode) -> None:
+        placeholder = self._placeholders.get(node.id)
+        if placeholder is None:
+            return
+        try:
+            specs = await self.children_of(node.data)
+        except Exception as e:
+            if self._placeholders.get(node.id) is placeholder:
+                placeholder.set_label(f"Failed to load: {e}")
+            return
+        if self._placeholders.get(node.id) is not placeholder:
+            return  # another expand of the same node got here first, or a reload replaced it
+        del self._placeholders[node.id]
+        placeholder.remove()
+        for spec in specs:
+            self.add_spec(node, spec)
+        if self.prefetch_depth:
+            self._prefetch(specs, self.prefetch_depth)
+
+    async def children_of(self, data: Any) -> List[TreeSpec]:
+        """Child specs for a node's data: cached, or one shared loader call."""
+        key = _cache_key(data)
+        if key in self._cache:
+            return self._cache[key]
+        pending = self._pending.get(key)
+        if pending is None:
+            ticket = PriorityTicket()
+            with ticket.active():  # the fetch task copies the context it is created in
+                future = asyncio.ensure_future(self._fetch(key, data))
+            self._pending[key] = future, ticket
+        else:
+            future, ticket = pending
+            ticket.raise_to(effective_priority())
+        return await asyncio.shield(future)
+
+    async def _fetch(self, key: Hashable, data: Any) -> List[TreeSpec]:
+        reloads = self._reloads.get(key, 0)
+        try:
+            self.loads += 1
+            specs = list(await self.loader(data))
+            if self._reloads.get(key, 0) == reloads:
+                self._cache[key] = specs
+            return specs
+        finally:
+            if self._reloads.get(key, 0) == reloads:
+                self._pending.pop(key, None)
+
+    def _prefetch(self, specs: Sequence[TreeSpec], depth: int) -> None:
+        for spec in specs:
+            if spec.lazy and _cache_key(spec.data) not in self._cache:
+                self.run_worker(self._prefetch_one(spec.data, depth), group="lazy-tree-prefetch")
+
+    async def _prefetch_one(self, data: Any, depth: int) -> None:
+        # The next level down is likely to be opened; deeper levels only when the server is idle
+        priority = VISIBLE_PREFETCH if depth == self.prefetch_depth else BACKGROUND
+        async with self._prefetch_slots:
+            try:
+                with request_priority(priority):
+                    specs = await self.children_of(data)
+            except Exception:
+                return  # best effort; expanding the node retries and shows the error
+        if depth > 1:
+            self._prefetch(specs, depth - 1)
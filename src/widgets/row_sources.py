@@ -0,0 +1,257 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file provides row sources for the virtualized table widget of my_egeria.
+
+
+"""
+
+import asyncio
+import sqlite3
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from utils.search_index import SearchIndex
+
+Row = Tuple[Any, ...]
+
+
+class RowSource:
+    """
+    What VirtualTable reads rows from. Indexes are positions in the current (sorted,
+    filtered) view. rows() must be cheap: it is called while painting. Sources that fetch
+    remotely return None for rows they do not have yet and load them in load().
+    """
+
+    columns: Tuple[str, ...] = ()
+
+    def count(self) -> int:
+        raise NotImplementedError
+
+    def rows(self, start: int, stop: int) -> List[Optional[Row]]:
+        raise NotImplementedError
+
+    def missing(self, start: int, stop: int) -> bool:
+        """True if some row in [start, stop) still has to be loaded."""
+        return False
+
+    async def load(self, start: int, stop: int) -> None:
+        """Fetch rows in [start, stop); VirtualTable runs this in a worker and repaints after."""
+
+    def sort(self, column: int, reverse: bool = False) -> None:
+        raise NotImplementedError
+
+    def filter(self, query: str) -> None:
+        raise NotImplementedError
+
+    def set_cell(self, index: int, column: int, value: Any) -> None:
+        raise NotImplementedError
+
+
+def _sort_key(value: Any):
+    return (value is None, str(value).lower() if value is not None else "")
+
+
+class ListRowSource(RowSource):
+    """Rows held in memory. Filtering uses a SearchIndex over every column."""
+
+    def __init__(self, columns: Sequence[str], rows: Sequence[Sequence[Any]] = ()):
+        self.columns = tuple(columns)
+        self._rows: List[List[Any]] = []
+        self._index = SearchIndex()
+        self._view: List[int] = []
+        self._query = ""
+        self._order: Optional[Tuple[int, bool]] = None
+        self.extend(rows)
+
+    def extend(self, rows: Sequence[Sequence[Any]]) -> None:
+        for row in rows:
+            self._index.add(len(self._rows), (str(v) for v in row if v is not None))
+            self._rows.append(list(row))
+        self._rebuild()
+
+    def _rebuild(self) -> None:
+        view = self._index.search(self._query) if self._query.strip() else list(range(len(self._rows)))
+        if self._order is not None:
+            column, reverse = self._order
+            view.sort(key=lambda i: _sort_key(self._rows[i][column]), reverse=reverse)
+        self._view = view
+
+    def count(self) -> int:
+        return len(self._view)
+
+    def rows(self, start: int, stop: int) -> List[Optional[Row]]:
+        return [tuple(self._rows[i]) for i in self._view[start:stop]]
+
+    def sort(self, column: int, reverse: bool = False) -> None:
+        self._order = (column, reverse)
+        self._rebuild()
+
+    def filter(self, query: str) -> None:
+        self._query = query
+        self._rebuild()
+
+    def set_cell(self, index: int, column: int, value: Any) -> None:
+        # The search index keeps the old text until rows are reloaded; edits are rare
+        self._rows[self._view[index]][column] = value
+
+
+class AsyncPageSource(RowSource):
+    """
+    Rows fetched page by page from an async function fetch_page(start_from, page_size),
+    e.g. a pyegeria find_* call. Only pages the table has scrolled near are requested. The
+    total is unknown until a short page arrives; until then count() runs one page ahead so
+    scrolling to the end asks for more.
+
+    Sorting and filtering are applied to the loaded rows (the server API has neither), so
+    they are exact once every page is in.
+    """
+
+    def __init__(
+        self,
+        columns: Sequence[str],
+        fetch_page: Callable[[int, int], Awaitable[Sequence[Sequence[Any]]]],
+        page_size: int = 100,
+    ):
+        self.columns = tuple(columns)
+        self.page_size = page_size
+        self._fetch_page = fetch_page
+        self._pages: Dict[int, List[List[Any]]] = {}
+        self._loading: Set[int] = set()
+        self._exhausted_at: Optional[int] = None  # index of the first short page
+        self._local: Optional[ListRowSource] = None  # sorted/filtered view over loaded rows
+
+    @property
+    def complete(self) -> bool:
+        return self._exhausted_at is not None and all(
+            p in self._pages for p in range(self._exhausted_at + 1)
+        )
+
+    def _loaded_rows(self) -> List[List[Any]]:
+        return [row for p in sorted(self._pages) for row in self._pages[p]]
+
+    def count(self) -> int:
+        if self._local is not None:
+            return self._local.count()
+        if self._exhausted_at is not None:
+            return self._exhausted_at * self.page_size + len(self._pages.get(self._exhausted_at, []))
+        highest = max(self._pages, default=-1)
+        return (highest + 2) * self.page_size
+
+    def rows(self, start: int, stop: int) -> List[Optional[Row]]:
+        if self._local is not None:
+            return self._local.rows(start, stop)
+        out: List[Optional[Row]] = []
+        for i in range(start, min(stop, self.count())):
+            page = self._pages.get(i // self.page_size)
+            offset = i % self.page_size
+            out.append(tuple(page[offset]) if page is not None and offset < len(page) else None)
+        return out
+
+    def _pages_for(self, start: int, stop: int) -> List[int]:
+        last = (max(start, stop - 1)) // self.page_size
+        pages = range(start // self.page_size, last + 1)
+        if self._exhausted_at is not None:
+            pages = [p for p in pages if p <= self._exhausted_at]
+        return [p for p in pages if p not in self._pages and p not in self._loading]
+
+    def missing(self, start: int, stop: int) -> bool:
+        return self._local is None and bool(self._pages_for(start, stop))
+
+    async def load(self, start: int, stop: int) -> None:
+        pages = self._pages_for(start, stop)
+        self._loading.update(pages)
+        try:
+            results = await asyncio.gather(
+                *(self._fetch_page(p * self.page_size, self.page_size) for p in pages)
+            )
+        finally:
+            self._loading.difference_update(pages)
+        for page, rows in zip(pages, results):
+            self._pages[page] = [list(r) for r in rows]
+            if len(rows) < self.page_size and (self._exhausted_at is None or page < self._exhausted_at):
+                self._exhausted_at = page
+
+    def sort(self, column: int, reverse: bool = False) -> None:
+        self._local = self._local or ListRowSource(self.columns, self._loaded_rows())
+        self._local.sort(column, reverse)
+
+    def filter(self, query: str) -> None:
+        self._local = self._local or ListRowSource(self.columns, self._loaded_rows())
+        self._local.filter(query)
+
+    def set_cell(self, index: int, column: int, value: Any) -> None:
+        if self._local is not None:
+            self._local.set_cell(index, column, value)
+            return
+        self._pages[index // self.page_size][index % self.page_size][column] = value
+
+
+class SQLiteRowSource(RowSource):
+    """
+    Rows of one SQLite table (e.g. the metadata snapshot), read a window at a time with
+    LIMIT/OFFSET. Sort and filter become ORDER BY and LIKE clauses; edits are UPDATEs.
+    """
+
+    def __init__(self, conn: sqlite3.Connection, table: str, columns: Sequence[str]):
+        known = {r[1] for r in conn.execute(f'PRAGMA table_info("{table}")')}
+        unknown = [c for c in columns if c not in known]
+        if not known or unknown:
+            raise ValueError(f"Unknown table or columns for {table!r}: {unknown or table}")
+        self._conn = conn
+        self._table = table
+        self.columns = tuple(columns)
+        self._where = ""
+        self._params: Tuple[Any, ...] = ()
+        self._order = "rowid"
+        self._count: Optional[int] = None
+        self._window: Tuple[int, List[Tuple[int, Row]]] = (0, [])
+
+    def _select(self) -> str:
+        cols = ", ".join(f'"{c}"' for c in self.columns)
+        return f'SELECT rowid, {cols} FROM "{self._table}" {self._where} ORDER BY {self._order}'
+
+    def _invalidate(self) -> None:
+        self._count = None
+        self._window = (0, [])
+
+    def count(self) -> int:
+        if self._count is None:
+            sql = f'SELECT COUNT(*) FROM "{self._table}" {self._where}'
+            self._count = self._conn.execute(sql, self._params).fetchone()[0]
+        return self._count
+
+    def _fetch(self, start: int, stop: int) -> List[Tuple[int, Row]]:
+        first, cached = self._window
+        if first <= start and stop <= first + len(cached):
+            return cached[start - first:stop - first]
+        cur = self._conn.execute(f"{self._select()} LIMIT ? OFFSET ?", self._params + (stop - start, start))
+        fetched = [(r[0], tuple(r[1:])) for r in cur.fetchall()]
+        self._window = (start, fetched)
+        return fetched
+
+    def rows(self, start: int, stop: int) -> List[Optional[Row]]:
+        return [row for _rowid, row in self._fetch(start, stop)]
+
+    def sort(self, column: int, reverse: bool = False) -> None:
+        self._order = f'"{self.columns[column]}" COLLATE NOCASE {"DESC" if reverse else "ASC"}, rowid'
+        self._invalidate()
+
+    def filter(self, query: str) -> None:
+        query = query.strip()
+        if not query:
+            self._where, self._params = "", ()
+        else:
+            like = f"%{query}%"
+            self._where = "WHERE " + " OR ".join(f'"{c}" LIKE ?' for c in self.columns)
+            self._params = tuple(like for _ in self.columns)
+        self._invalidate()
+
+    def set_cell(self, index: int, column: int, value: Any) -> None:
+        rowid = self._fetch(index, index + 1)[0][0]
+        self._conn.execute(
+            f'UPDATE "{self._table}" SET "{self.columns[column]}" = ? WHERE rowid = ?', (value, rowid)
+        )
+        self._conn.commit()
+        self._invalidate()
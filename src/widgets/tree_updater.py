@@ -0,0 +1,181 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file provides a diff-based updater for Tree widgets in my_egeria.
+
+
+"""
+
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+
+
+@dataclass
+class TreeSpec:
+    """
+    One node of the tree to show. key identifies the node among its siblings (defaults
+    to the label); nodes with the same key path are patched in place rather than rebuilt.
+    expand only applies when the node is first created: after that the user's expansion
+    state wins. A lazy node has no children here: a LazyTree fetches them when the node
+    is first expanded, and updates leave whatever it loaded alone.
+    """
+
+    label: str
+    data: Any = None
+    children: List["TreeSpec"] = field(default_factory=list)
+    key: Optional[str] = None
+    leaf: bool = False
+    expand: bool = False
+    lazy: bool = False
+
+
+@dataclass
+class TreeUpdateStats:
+    created: int = 0
+    removed: int = 0
+    updated: int = 0
+    moved: int = 0
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.created or self.removed or self.updated or self.moved)
+
+
+# Tree has no public move, and remove() + add(before=...) would rebuild the subtree and
+# lose its expansion and loaded branches. Moves reorder the parent's child list the way
+# TreeNode.add/remove do: Textual internals, pinned by pyproject (textual <9) and checked
+# by tests/test_tree_updater.py.
+
+
+def _detach(parent, node) -> None:
+    parent._children.remove(node)
+
+
+def _reattach(parent, position: int, node) -> None:
+    parent._children.insert(position, node)
+
+
+def _stable_positions(positions: Sequence[int]) -> set:
+    """Indexes into positions of a longest increasing run: the nodes that need not move."""
+    tails: List[int] = []  # tails[k] = index of the smallest tail of an increasing run of length k+1
+    tail_values: List[int] = []
+    prev: List[int] = [-1] * len(positions)
+    for i, pos in enumerate(positions):
+        k = bisect_left(tail_values, pos)
+        prev[i] = tails[k - 1] if k else -1
+        if k == len(tails):
+            tails.append(i)
+            tail_values.append(pos)
+        else:
+            tails[k] = i
+            tail_values[k] = pos
+    keep, i = set(), tails[-1] if tails else -1
+    while i >= 0:
+        keep.add(i)
+        i = prev[i]
+    return keep
+
+
+class TreeUpdater:
+    """
+    Keeps a Tree widget in step with a hierarchical payload. update(specs) diffs the specs
+    against the mounted nodes and only adds, removes, moves or relabels what changed, so
+    surviving subtrees keep their TreeNodes and their expansion state, also when a
+    refresh reorders them.
+    """
+
+    def __init__(self, tree):
+        self.tree = tree
+        self._keys: Dict[int, str] = {}  # node id -> the key it was created with
+
+    def update(self, specs: Sequence[TreeSpec], label: Optional[str] = None, data: Any = None) -> TreeUpdateStats:
+        """Make the root's children match specs; optionally relabel the root too."""
+        stats = TreeUpdateStats()
+        root = self.tree.root
+        if label is not None and root.label.plain != label:
+            root.set_label(label)
+            stats.updated += 1
+        if data is not None:
+            root.data = data
+        self._sync_children(root, specs, stats)
+        return stats
+
+    def _key(self, node) -> str:
+        return self._keys.get(node.id, node.label.plain)
+
+    @staticmethod
+    def _spec_keys(specs: Sequence[TreeSpec]) -> List[str]:
+        seen: Dict[str, int] = {}
+        keys = []
+        for spec in specs:
+            key = spec.key if spec.key is not None else spec.label
+            if key in seen:
+                seen[key] += 1
+                key = f"{key}#{seen[key]}"
+            else:
+                seen[key] = 0
+            keys.append(key)
+        return keys
+
+    def _sync_children(self, parent, specs: Sequence[TreeSpec], stats: TreeUpdateStats) -> None:
+        keys = self._spec_keys(specs)
+        wanted = {key: i for i, key in enumerate(keys)}
+        existing: Dict[str, Any] = {}
+        for child in list(parent.children):
+            key = self._key(child)
+            if key in wanted and key not in existing:
+                existing[key] = child
+            else:
+                self._remove(child, stats)
+
+        # Keep the longest run of survivors already in the right order; lift out the rest
+        # and put the same TreeNodes back at their new positions
+        survivors = list(existing.items())
+        stable = _stable_positions([wanted[key] for key, _ in survivors])
+        moving = {key for i, (key, _) in enumerate(survivors) if i not in stable}
+        for key in moving:
+            _detach(parent, existing[key])
+
+        for position, (key, spec) in enumerate(zip(keys, specs)):
+            node = existing.get(key)
+            if node is None:
+                before = position if position < len(parent.children) else None
+                self._create(parent, key, spec, before, stats)
+                continue
+            if key in moving:
+                _reattach(parent, position, node)
+                stats.moved += 1
+            if node.label.plain != spec.label:
+                node.set_label(spec.label)
+                stats.updated += 1
+            if node.data != spec.data:
+                node.data = spec.data
+                stats.updated += 1
+            node.allow_expand = not spec.leaf
+            if not spec.lazy:
+                self._sync_children(node, spec.children, stats)
+        if moving:
+            self.tree._invalidate()  # re-render the moved lines (internal, see _detach)
+
+    def _create(self, parent, key: str, spec: TreeSpec, before: Optional[int], stats: TreeUpdateStats) -> None:
+        if spec.lazy and hasattr(self.tree, "add_spec"):
+            self._keys[self.tree.add_spec(parent, spec, before=before).id] = key
+            stats.created += 1
+            return
+        node = parent.add(spec.label, spec.data, before=before, expand=spec.expand, allow_expand=not spec.leaf)
+        self._keys[node.id] = key
+        stats.created += 1
+        for child_key, child in zip(self._spec_keys(spec.children), spec.children):
+            self._create(node, child_key, child, None, stats)
+
+    def _remove(self, node, stats: TreeUpdateStats) -> None:
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            self._keys.pop(current.id, None)
+            stats.removed += 1
+            stack.extend(current.children)
+        node.remove()
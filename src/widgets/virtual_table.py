@@ -0,0 +1,365 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file provides a virtualized, lazily populated table widget for my_egeria.
+
+
+"""
+
+from typing import List, Optional, Tuple
+
+from rich.cells import cell_len
+from rich.segment import Segment
+from textual import events
+from textual.binding import Binding
+from textual.geometry import Size
+from textual.message import Message
+from textual.reactive import reactive
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
+
+from widgets.row_sources import RowSource, Row
+
+PLACEHOLDER = "…"
+
+
+def _fit(text: str, width: int) -> str:
+    """Pad or truncate text to exactly width cells."""
+    if cell_len(text) <= width:
+        return text + " " * (width - cell_len(text))
+    out, used = [], 0
+    for ch in text:
+        w = cell_len(ch)
+        if used + w > width - 1:
+            break
+        out.append(ch)
+        used += w
+    return "".join(out) + PLACEHOLDER + " " * (width - 1 - used)
+
+
+class VirtualTable(ScrollView, can_focus=True):
+    """
+    A table that paints rows straight from a RowSource using the ScrollView line API.
+
+    Only the rows in view plus buffer_rows on either side are materialized, so mount time
+    and memory do not grow with the result size. Rows a remote source has not loaded yet
+    show a placeholder and are fetched in a worker. Sorting ('s' on the cursor column) and
+    filtering (filter()) are delegated to the source. On an editable table 'e' or a double
+    click edits the cursor cell in place; Enter commits it and posts CellEdited.
+    """
+
+    DEFAULT_CSS = """
+    VirtualTable {
+        height: 1fr;
+    }
+    VirtualTable > .virtual-table--header {
+        text-style: bold;
+        background: $panel;
+    }
+    VirtualTable > .virtual-table--cursor {
+        background: $accent;
+        color: $text;
+    }
+    VirtualTable > .virtual-table--editing {
+        background: $warning;
+        color: $text;
+    }
+    VirtualTable > .virtual-table--placeholder {
+        color: $text-muted;
+    }
+    """
+
+    COMPONENT_CLASSES = {
+        "virtual-table--header",
+        "virtual-table--cursor",
+        "virtual-table--editing",
+        "virtual-table--placeholder",
+    }
+
+    BINDINGS = [
+        Binding("up", "cursor_up", "Up", show=False),
+        Binding("down", "cursor_down", "Down", show=False),
+        Binding("left", "cursor_left", "Left", show=False),
+        Binding("right", "cursor_right", "Right", show=False),
+        Binding("pageup", "page_up", "Page up", show=False),
+        Binding("pagedown", "page_down", "Page down", show=False),
+        Binding("home", "first_row", "First", show=False),
+        Binding("end", "last_row", "Last", show=False),
+        Binding("enter", "select", "Select", show=False),
+        Binding("e", "edit", "Edit cell"),
+        Binding("s", "sort", "Sort column"),
+    ]
+
+    cursor_row: reactive[int] = reactive(0)
+    cursor_column: reactive[int] = reactive(0)
+
+    class RowHighlighted(Message):
+        def __init__(self, table: "VirtualTable", cursor_row: int, values: Optional[Row]) -> None:
+            self.table = table
+            self.cursor_row = cursor_row
+            self.values = values
+            super().__init__()
+
+    class RowSelected(Message):
+        def __init__(self, table: "VirtualTable", cursor_row: int, values: Optional[Row]) -> None:
+            self.table = table
+            self.cursor_row = cursor_row
+            self.values = values
+            super().__init__()
+
+    class CellEdited(Message):
+        def __init__(self, table: "VirtualTable", row: int, column: int, value: str) -> None:
+            self.table = table
+            self.row = row
+            self.column = column
+            self.value = value
+            super().__init__()
+
+    def __init__(
+        self,
+        source: Optional[RowSource] = None,
+        *,
+        editable: bool = False,
+        buffer_rows: int = 50,
+        max_column_width: int = 40,
+        name: Optional[str] = None,
+        id: Optional[str] = None,
+        classes: Optional[str] = None,
+    ) -> None:
+        super().__init__(name=name, id=id, classes=classes)
+        self.editable = editable
+        self.buffer_rows = buffer_rows
+        self.max_column_width = max_column_width
+        self.source: Optional[RowSource] = None
+        self._widths: List[int] = []
+        self._widths_final = False  # measured against real rows, not just the headers
+        self._window_start = 0
+        self._window: List[Optional[Row]] = []
+        self._sorted: Optional[Tuple[int, bool]] = None
+        self._editing: Optional[Tuple[int, int, str]] = None  # (row, column, text)
+        if source is not None:
+            self.set_source(source)
+
+    # ------------- Source management -------------
+
+    def set_source(self, source: RowSource) -> None:
+        self.source = source
+        self._sorted = None
+        self._editing = None
+        self._widths_final = False
+        self.cursor_row = 0
+        self.cursor_column = 0
+        self.refresh_rows()
+
+    def refresh_rows(self) -> None:
+        """Re-read the source (after it changed) and repaint."""
+        self._window_start, self._window = 0, []
+        count = self.source.count() if self.source is not None else 0
+        if not self._widths_final and self.source is not None:
+            self._widths, self._widths_final = self._measure()
+        self.virtual_size = Size(sum(self._widths) + len(self._widths), count + 1)
+        if self.cursor_row >= count:
+            self.cursor_row = max(0, count - 1)
+        self.refresh()
+
+    def filter(self, query: str) -> None:
+        if self.source is None:
+            return
+        self.source.filter(query)
+        self.cursor_row = 0
+        self.scroll_to(y=0, animate=False)
+        self.refresh_rows()
+
+    def sort_by(self, column: int, reverse: bool = False) -> None:
+        if self.source is None:
+            return
+        self.source.sort(column, reverse)
+        self._sorted = (column, reverse)
+        self.refresh_rows()
+
+    def _measure(self) -> Tuple[List[int], bool]:
+        """Column widths from the header and the first rows, and whether any rows were seen."""
+        widths = [cell_len(c) + 2 for c in self.source.columns]
+        seen = False
+        for row in self.source.rows(0, 200):
+            if row is None:
+                continue
+            seen = True
+            for i, value in enumerate(row[: len(widths)]):
+                widths[i] = max(widths[i], cell_len(str(value if value is not None else "")))
+        return [min(w, self.max_column_width) for w in widths], seen
+
+    # ------------- Row window -------------
+
+    def row_at(self, index: int) -> Optional[Row]:
+        """Row at a view position, materializing a buffered window around it if needed."""
+        if self.source is None:
+            return None
+        offset = index - self._window_start
+        if not (0 <= offset < len(self._window)):
+            start = max(0, index - self.buffer_rows)
+            stop = index + self.size.height + self.buffer_rows
+            self._window_start, self._window = start, self.source.rows(start, stop)
+            if self.source.missing(start, stop):
+                self.run_worker(self._load(start, stop), group="virtual-table-load")
+            offset = index - start
+        return self._window[offset] if 0 <= offset < len(self._window) else None
+
+    async def _load(self, start: int, stop: int) -> None:
+        await self.source.load(start, stop)
+        self.refresh_rows()
+        if self._widths and self.source.count():
+            self.post_message(self.RowHighlighted(self, self.cursor_row, self.row_at(self.cursor_row)))
+
+    # ------------- Painting -------------
+
+    def render_line(self, y: int) -> Strip:
+        scroll_x, scroll_y = self.scroll_offset
+        width = self.size.width
+        if self.source is None:
+            return Strip.blank(width)
+        if y == 0:
+            strip = self._header_strip()
+        else:
+            index = scroll_y + y - 1
+            if index >= self.source.count():
+                return Strip.blank(width, self.rich_style)
+            strip = self._row_strip(index)
+        total = max(width, sum(self._widths) + len(self._widths))
+        return strip.extend_cell_length(total, self.rich_style).crop(scroll_x, scroll_x + width)
+
+    def _header_strip(self) -> Strip:
+        style = self.get_component_rich_style("virtual-table--header")
+        segments = []
+        for i, (title, w) in enumerate(zip(self.source.columns, self._widths)):
+            if self._sorted and self._sorted[0] == i:
+                title = f"{title} {'▼' if self._sorted[1] else '▲'}"
+            segments.append(Segment(_fit(title, w) + " ", style))
+        return Strip(segments)
+
+    def _row_strip(self, index: int) -> Strip:
+        row = self.row_at(index)
+        base = self.rich_style
+        if row is None:
+            style = self.get_component_rich_style("virtual-table--placeholder")
+            return Strip([Segment(_fit(PLACEHOLDER, self._widths[0] if self._widths else 1), style)])
+        cursor = self.get_component_rich_style("virtual-table--cursor")
+        editing = self.get_component_rich_style("virtual-table--editing")
+        segments = []
+        for col, w in enumerate(self._widths):
+            value = row[col] if col < len(row) else ""
+            text = "" if value is None else str(value)
+            # Editable tables highlight the cursor cell, read-only ones the whole row
+            on_cursor = index == self.cursor_row and (col == self.cursor_column or not self.editable)
+            style = base + cursor if on_cursor else base
+            if self._editing and self._editing[0] == index and self._editing[1] == col:
+                text, style = self._editing[2] + "▏", base + editing
+            segments.append(Segment(_fit(text, w) + " ", style))
+        return Strip(segments)
+
+    # ------------- Cursor -------------
+
+    def _row_count(self) -> int:
+        return self.source.count() if self.source is not None else 0
+
+    def validate_cursor_row(self, value: int) -> int:
+        return max(0, min(value, self._row_count() - 1)) if self._row_count() else 0
+
+    def validate_cursor_column(self, value: int) -> int:
+        return max(0, min(value, len(self._widths) - 1)) if self._widths else 0
+
+    def watch_cursor_row(self, old: int, new: int) -> None:
+        visible = max(1, self.size.height - 1)
+        top = self.scroll_offset.y
+        if new < top:
+            self.scroll_to(y=new, animate=False)
+        elif new >= top + visible:
+            self.scroll_to(y=new - visible + 1, animate=False)
+        self.refresh()
+        if self._row_count():
+            self.post_message(self.RowHighlighted(self, new, self.row_at(new)))
+
+    def watch_cursor_column(self) -> None:
+        self.refresh()
+
+    def action_cursor_up(self) -> None:
+        self.cursor_row -= 1
+
+    def action_cursor_down(self) -> None:
+        self.cursor_row += 1
+
+    def action_cursor_left(self) -> None:
+        self.cursor_column -= 1
+
+    def action_cursor_right(self) -> None:
+        self.cursor_column += 1
+
+    def action_page_up(self) -> None:
+        self.cursor_row -= max(1, self.size.height - 2)
+
+    def action_page_down(self) -> None:
+        self.cursor_row += max(1, self.size.height - 2)
+
+    def action_first_row(self) -> None:
+        self.cursor_row = 0
+
+    def action_last_row(self) -> None:
+        self.cursor_row = self._row_count() - 1
+
+    def action_select(self) -> None:
+        if self._row_count():
+            self.post_message(self.RowSelected(self, self.cursor_row, self.row_at(self.cursor_row)))
+
+    def action_sort(self) -> None:
+        reverse = bool(self._sorted and self._sorted[0] == self.cursor_column and not self._sorted[1])
+        self.sort_by(self.cursor_column, reverse)
+
+    def on_click(self, event: events.Click) -> None:
+        if self.source is None or event.y < 1:
+            return
+        self.cursor_row = self.scroll_offset.y + event.y - 1
+        x, edge = event.x + self.scroll_offset.x, 0
+        for col, w in enumerate(self._widths):
+            edge += w + 1
+            if x < edge:
+                self.cursor_column = col
+                break
+        if event.chain == 2:
+            if self.editable:
+                self.action_edit()
+            else:
+                self.post_message(self.RowSelected(self, self.cursor_row, self.row_at(self.cursor_row)))
+
+    # ------------- In-place editing -------------
+
+    def action_edit(self) -> None:
+        row = self.row_at(self.cursor_row) if self._row_count() else None
+        if not self.editable or row is None:
+            return
+        value = row[self.cursor_column] if self.cursor_column < len(row) else ""
+        self._editing = (self.cursor_row, self.cursor_column, "" if value is None else str(value))
+        self.refresh()
+
+    def on_key(self, event: events.Key) -> None:
+        if self._editing is None:
+            return
+        index, column, text = self._editing
+        if event.key == "enter":
+            self._editing = None
+            self.source.set_cell(index, column, text)
+            self._window_start, self._window = 0, []
+            self.post_message(self.CellEdited(self, index, column, text))
+        elif event.key == "escape":
+            self._editing = None
+        elif event.key == "backspace":
+            self._editing = (index, column, text[:-1])
+        elif event.is_printable and event.character:
+            self._editing = (index, column, text + event.character)
+        else:
+            return
+        # While editing, keys belong to the cell, not to table or screen bindings
+        event.stop()
+        event.prevent_default()
+        self.refresh()